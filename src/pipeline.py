@@ -13,14 +13,17 @@ Commands
 ingest_data : Load and preprocess raw data
     Output: data_work/data_raw.parquet
 link_records : Link records across data sources
+    Options: --sources, --fuzzy-key, --workers, --streaming
     Output: data_work/data_linked.parquet
 build_panel : Create analysis panel
     Output: data_work/panel.parquet
 
 # Analysis
 run_estimation : Run primary estimation
-    Options: --specification, --sample
+    Options: --specification, --sample, --all, --jobs, --streaming, --fe-cache,
+             --bootstrap, --n-boot, --seed
 estimate_robustness : Run robustness checks
+    Options: --permutations, --jobs
     Output: data_work/diagnostics/
 
 # Figures and Manuscript
@@ -97,7 +100,31 @@ def parse_args() -> argparse.Namespace:
 
     # Data Processing Commands
     sub.add_parser('ingest_data', help='Load and preprocess raw data')
-    sub.add_parser('link_records', help='Link records across data sources')
+    p_link = sub.add_parser('link_records', help='Link records across data sources')
+    p_link.add_argument(
+        '--sources',
+        nargs='+',
+        default=None,
+        help='Parquet files in data_work/ to link onto the primary data'
+    )
+    p_link.add_argument(
+        '--fuzzy-key',
+        nargs=2,
+        metavar=('LEFT', 'RIGHT'),
+        default=None,
+        help='Columns to fuzzy match for sources without a common key column'
+    )
+    p_link.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=1,
+        help='Worker processes for fuzzy matching (default: 1)'
+    )
+    p_link.add_argument(
+        '--streaming',
+        action='store_true',
+        help='Join sources out-of-core via hash-partitioned parquet buckets'
+    )
     sub.add_parser('build_panel', help='Create analysis panel')
 
     # Estimation Commands
@@ -112,8 +139,61 @@ def parse_args() -> argparse.Namespace:
         default='full',
         help='Sample restriction (default: full)'
     )
+    p_est.add_argument(
+        '--all',
+        dest='run_all',
+        action='store_true',
+        help='Run every registered specification'
+    )
+    p_est.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='Worker processes for specifications not swept together, e.g. with --streaming (default: 1)'
+    )
+    p_est.add_argument(
+        '--streaming',
+        action='store_true',
+        help='Estimate out-of-core from panel.parquet in row batches'
+    )
+    p_est.add_argument(
+        '--fe-cache',
+        dest='fe_cache',
+        action='store_true',
+        help='Keep demeaned columns in data_work/fe_cache/ for reuse across runs'
+    )
+    p_est.add_argument(
+        '--bootstrap',
+        choices=['rademacher', 'webb'],
+        default=None,
+        help='Add a wild cluster bootstrap p-value with these weights'
+    )
+    p_est.add_argument(
+        '--n-boot',
+        type=int,
+        default=9_999,
+        help='Bootstrap replications (default: 9999)'
+    )
+    p_est.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Seed for the bootstrap weights'
+    )
 
-    sub.add_parser('estimate_robustness', help='Run robustness checks')
+    p_rob = sub.add_parser('estimate_robustness', help='Run robustness checks')
+    p_rob.add_argument(
+        '--permutations',
+        type=int,
+        default=9_999,
+        help='Treatment permutations for randomization inference, 0 to skip (default: 9999)'
+    )
+    p_rob.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='Worker processes for robustness checks and randomization inference (default: 1)'
+    )
 
     # Figure and Manuscript Commands
     sub.add_parser('make_figures', help='Generate publication figures')
@@ -275,7 +355,12 @@ def main():
 
     elif args.cmd == 'link_records':
         from stages import s01_link
-        s01_link.main()
+        s01_link.main(
+            additional_sources=args.sources,
+            fuzzy_key_columns=tuple(args.fuzzy_key) if args.fuzzy_key else None,
+            workers=args.workers,
+            streaming=args.streaming
+        )
 
     elif args.cmd == 'build_panel':
         from stages import s02_panel
@@ -285,12 +370,19 @@ def main():
         from stages import s03_estimation
         s03_estimation.main(
             specification=args.specification,
-            sample=args.sample
+            sample=args.sample,
+            run_all=args.run_all,
+            streaming=args.streaming,
+            jobs=args.jobs,
+            persist_fe_cache=args.fe_cache,
+            bootstrap=args.bootstrap,
+            n_boot=args.n_boot,
+            seed=args.seed
         )
 
     elif args.cmd == 'estimate_robustness':
         from stages import s04_robustness
-        s04_robustness.main()
+        s04_robustness.main(n_permutations=args.permutations, jobs=args.jobs)
 
     elif args.cmd == 'make_figures':
         from stages import s05_figures
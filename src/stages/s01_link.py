@@ -6,7 +6,14 @@ Purpose: Link records across multiple data sources using various matching strate
 
 This stage handles:
 - Exact matching on key columns
+- Out-of-core exact joins over hash-partitioned parquet buckets
 - Fuzzy matching using string similarity
+- Candidate blocking (q-gram, prefix) and vectorized pair scoring
+- Process-pool sharding of fuzzy matching over left-side values
+- One-to-one (greedy or optimal) assignment of fuzzy matches
+- On-disk LRU cache of pair similarities reused across runs
+- Probabilistic (Fellegi-Sunter) matching with EM-estimated weights
+- Spatial matching (nearest neighbour, within radius) over a KD-tree
 - Merge quality diagnostics
 - Match rate tracking
 
@@ -19,17 +26,25 @@ Output Files
 ------------
 - data_work/data_linked.parquet
 - data_work/diagnostics/linkage_summary.csv
+- data_work/diagnostics/linkage/<source>_<match_type>.csv (per-source detail)
+- data_work/linkage_index/qgram_*.npz (cached reference indexes)
+- data_work/linkage_cache/scores_<method>.npz (cached pair similarities)
 
 Usage
 -----
     python src/pipeline.py link_records
+    python src/pipeline.py link_records --workers 8
+    python src/pipeline.py link_records --streaming
 """
 from __future__ import annotations
 
 from pathlib import Path
 from typing import Optional, Union, Literal
 from dataclasses import dataclass, field
+import hashlib
+import multiprocessing as mp
 import sys
+import tempfile
 
 # Add parent directory for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -59,6 +74,45 @@ OUTPUT_FILE = 'data_linked.parquet'
 # Default key columns for matching
 DEFAULT_KEY_COLUMNS = ['id']
 
+# Fuzzy key (left column, right column) for sources without common key columns
+FUZZY_KEY_COLUMNS: Optional[tuple[str, str]] = None
+FUZZY_THRESHOLD = 0.85
+
+# Fuzzy matching configuration
+SIMILARITY_METHODS = ('levenshtein', 'jaro_winkler', 'contains')
+ASSIGNMENT_METHODS = ('greedy', 'optimal')
+GREEDY_MIN_PROGRESS = 0.9    # Switch to a sequential pass once a round keeps >90% of pairs
+ASSIGNMENT_MAX_EDGES = 20_000_000  # Record-level edges allowed for optimal assignment
+QGRAM_SIZE = 3               # q-gram length for candidate blocking (1-3)
+BLOCK_PREFIX_LENGTH = 2      # Leading characters shared under prefix blocking
+FUZZY_BATCH_SIZE = 5_000     # Unique left values per candidate batch
+PAIR_CHUNK_SIZE = 200_000    # Candidate pairs scored per NumPy kernel call
+
+# Streaming exact join configuration
+STREAM_BUCKETS = 64          # Hash partitions per side (each must fit in memory)
+STREAM_BATCH_SIZE = 250_000  # Rows read per parquet batch while partitioning
+
+# Spatial matching configuration
+SPATIAL_METHODS = ('nearest', 'radius')
+SPATIAL_COORDS = ('latitude', 'longitude')
+SPATIAL_BATCH_SIZE = 100_000  # Left points queried per KD-tree batch
+EARTH_RADIUS_KM = 6371.0088   # Mean Earth radius
+
+# Probabilistic matching configuration
+COMPARISON_METHODS = ('exact', 'levenshtein', 'jaro_winkler', 'numeric')
+EM_MAX_ITER = 200
+EM_TOLERANCE = 1e-6
+
+# Persistent q-gram indexes (under data_work/)
+INDEX_SUBDIR = 'linkage_index'
+INDEX_FORMAT_VERSION = 1
+
+# Persistent similarity caches (under data_work/)
+SCORE_CACHE_SUBDIR = 'linkage_cache'
+SCORE_CACHE_VERSION = 2
+SCORE_CACHE_DIGEST_SIZE = 16  # blake2b bytes per string; a pair key holds both digests
+SCORE_CACHE_MAX_ENTRIES = 10_000_000  # Least recently used pairs evicted beyond this
+
 
 # ============================================================
 # LINKAGE RESULT TRACKING
@@ -71,8 +125,9 @@ class LinkageResult:
     n_source: int
     n_matched: int
     n_unmatched: int
-    match_type: str  # 'exact', 'fuzzy', 'spatial'
+    match_type: str  # 'exact', 'fuzzy', 'spatial', 'probabilistic'
     key_columns: list = field(default_factory=list)
+    diagnostics: Optional[pd.DataFrame] = field(default=None, repr=False)
 
     @property
     def match_rate(self) -> float:
@@ -162,6 +217,1156 @@ def exact_match(
     return df_merged, result
 
 
+# ============================================================
+# STREAMING EXACT MATCHING
+# ============================================================
+
+def streaming_exact_match(
+    left_path: Union[str, Path],
+    right_path: Union[str, Path],
+    on: Union[str, list[str]],
+    output_path: Union[str, Path],
+    n_buckets: int = STREAM_BUCKETS,
+    batch_size: int = STREAM_BATCH_SIZE,
+    suffixes: tuple = ('', '_right'),
+    source_name: Optional[str] = None
+) -> LinkageResult:
+    """
+    Left-join two parquet files without loading either into memory.
+
+    Both sides are hash-partitioned on the key columns into on-disk
+    parquet buckets, buckets are joined one at a time with
+    :func:`exact_match`, and each joined bucket is appended to
+    ``output_path`` as a row group. Peak memory is roughly one bucket
+    pair plus its join result. Output rows are grouped by bucket rather
+    than in input order; key columns must have the same dtype on both
+    sides so equal keys hash to the same bucket.
+
+    Parameters
+    ----------
+    left_path : str or Path
+        Primary parquet file
+    right_path : str or Path
+        Secondary parquet file to match
+    on : str or list
+        Column(s) to match on
+    output_path : str or Path
+        Parquet file for the joined rows
+    n_buckets : int
+        Number of hash partitions per side
+    batch_size : int
+        Rows read per batch while partitioning
+    suffixes : tuple
+        Suffixes for duplicate columns
+    source_name : str, optional
+        Name recorded in the linkage result (default: right file name)
+
+    Returns
+    -------
+    LinkageResult
+        Matched and unmatched counts summed over buckets
+    """
+    import pyarrow.parquet as pq
+
+    if isinstance(on, str):
+        on = [on]
+    left_path, right_path, output_path = Path(left_path), Path(right_path), Path(output_path)
+
+    left_schema = pq.read_schema(left_path).remove_metadata()
+    right_schema = pq.read_schema(right_path).remove_metadata()
+    schema = _joined_schema(left_schema, right_schema, on, suffixes)
+
+    n_matched = n_unmatched = 0
+    ensure_dir(output_path.parent)
+
+    with tempfile.TemporaryDirectory(prefix='linkage_buckets_', dir=output_path.parent) as tmp:
+        tmp = Path(tmp)
+        left_buckets = _partition_parquet(left_path, on, tmp / 'left', n_buckets, batch_size)
+        right_buckets = _partition_parquet(right_path, on, tmp / 'right', n_buckets, batch_size)
+        n_source = pq.ParquetFile(right_path).metadata.num_rows
+
+        empty_right = right_schema.empty_table().to_pandas()
+        with pq.ParquetWriter(output_path, schema) as writer:
+            for bucket, bucket_path in sorted(left_buckets.items()):
+                df_left = pq.read_table(bucket_path).to_pandas()
+                df_right = (
+                    pq.read_table(right_buckets[bucket]).to_pandas()
+                    if bucket in right_buckets else empty_right
+                )
+                df_merged, result = exact_match(df_left, df_right, on=on, suffixes=suffixes)
+                n_matched += result.n_matched
+                n_unmatched += result.n_unmatched
+
+                writer.write_table(
+                    _to_arrow(df_merged, schema),
+                    row_group_size=len(df_merged) or None
+                )
+
+    return LinkageResult(
+        source_name=source_name or right_path.name,
+        n_source=n_source,
+        n_matched=n_matched,
+        n_unmatched=n_unmatched,
+        match_type='exact',
+        key_columns=on
+    )
+
+
+def _partition_parquet(
+    path: Path,
+    on: list[str],
+    out_dir: Path,
+    n_buckets: int,
+    batch_size: int
+) -> dict[int, Path]:
+    """
+    Split a parquet file into hash buckets on the key columns.
+
+    Batches are routed with one stable sort per batch, and each bucket
+    keeps an open writer, so every input row is read and written once.
+
+    Returns
+    -------
+    dict[int, Path]
+        Bucket number to parquet path, for non-empty buckets only
+    """
+    import pyarrow.parquet as pq
+
+    ensure_dir(out_dir)
+    source = pq.ParquetFile(path)
+    schema = source.schema_arrow.remove_metadata()
+    writers, paths = {}, {}
+
+    try:
+        for batch in source.iter_batches(batch_size=batch_size):
+            keys = batch.select(on).to_pandas()
+            bucket = (
+                pd.util.hash_pandas_object(keys, index=False).to_numpy() % np.uint64(n_buckets)
+            ).astype(np.int64)
+            order = np.argsort(bucket, kind='stable')
+            counts = np.bincount(bucket, minlength=n_buckets)
+            starts = np.concatenate([[0], np.cumsum(counts)])
+            routed = batch.take(order).cast(schema)
+
+            for b in np.flatnonzero(counts):
+                if b not in writers:
+                    paths[b] = out_dir / f'bucket_{b:05d}.parquet'
+                    writers[b] = pq.ParquetWriter(paths[b], schema)
+                writers[b].write_batch(routed.slice(starts[b], counts[b]))
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    return {int(b): p for b, p in paths.items()}
+
+
+def _joined_schema(left_schema, right_schema, on: list[str], suffixes: tuple):
+    """Arrow schema of ``exact_match`` output: left columns, then right non-keys."""
+    import pyarrow as pa
+
+    overlap = (set(left_schema.names) & set(right_schema.names)) - set(on)
+    fields = [
+        f.with_name(f'{f.name}{suffixes[0]}') if f.name in overlap else f
+        for f in left_schema
+    ]
+    fields += [
+        f.with_name(f'{f.name}{suffixes[1]}') if f.name in overlap else f
+        for f in right_schema if f.name not in on
+    ]
+    return pa.schema(fields)
+
+
+def _to_arrow(df: pd.DataFrame, schema):
+    """Convert a joined bucket to ``schema`` (unmatched rows become nulls)."""
+    import pyarrow as pa
+
+    return pa.Table.from_pandas(df[schema.names], schema=schema, preserve_index=False)
+
+
+# ============================================================
+# STRING ENCODING AND BLOCKING
+# ============================================================
+
+# Code points outside the Unicode range mark q-gram padding
+_PAD_START = 0x110000
+_PAD_END = 0x110001
+_GRAM_BASE = 0x110002
+
+# Character hash buckets for the bag-distance filter
+_HIST_BUCKETS = 32
+
+
+def _normalize_strings(values) -> np.ndarray:
+    """Lower-case values into a NumPy unicode array for scoring."""
+    return pd.Series(values, dtype=object).map(str).str.lower().to_numpy(dtype=str)
+
+
+def _encode_strings(strings: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Encode strings as a fixed-width code-point matrix.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        (n, max_len) uint32 code points (zero padded) and int64 lengths
+    """
+    strings = np.asarray(strings, dtype=str)
+    if strings.dtype.itemsize == 0:
+        strings = strings.astype('<U1')
+    width = strings.dtype.itemsize // 4
+    codes = strings.view(np.uint32).reshape(len(strings), width)
+    lengths = np.char.str_len(strings).astype(np.int64)
+    return codes, lengths
+
+
+def _extract_qgrams(
+    codes: np.ndarray,
+    lengths: np.ndarray,
+    q: int,
+    padded: bool = True
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Extract the distinct q-grams of each encoded string.
+
+    Padded grams include q-1 start and end markers, so a string of length
+    m has m + q - 1 grams; unpadded grams only cover the m - q + 1 windows
+    inside the string.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Owning row and integer gram value, one entry per distinct gram
+    """
+    n, width = codes.shape
+    pad = q - 1
+    cols = np.arange(width + 2 * pad)
+
+    chars = np.zeros((n, width + 2 * pad), dtype=np.int64)
+    chars[:, :pad] = _PAD_START
+    chars[:, pad:pad + width] = codes
+    ends = lengths[:, None] + pad
+    chars[(cols >= ends) & (cols < ends + pad)] = _PAD_END
+
+    n_windows = width + pad
+    grams = np.zeros((n, n_windows), dtype=np.int64)
+    for j in range(q):
+        grams = grams * _GRAM_BASE + chars[:, j:j + n_windows]
+
+    starts = np.arange(n_windows)
+    if padded:
+        valid = starts < (lengths + pad)[:, None]
+    else:
+        valid = (starts >= pad) & (starts < lengths[:, None])
+
+    owner = np.broadcast_to(np.arange(n)[:, None], grams.shape)[valid]
+    grams = grams[valid]
+
+    # Drop repeated grams within a string
+    order = np.lexsort((grams, owner))
+    owner, grams = owner[order], grams[order]
+    distinct = np.ones(len(grams), dtype=bool)
+    distinct[1:] = (owner[1:] != owner[:-1]) | (grams[1:] != grams[:-1])
+    return owner[distinct], grams[distinct]
+
+
+def _expand_ranges(starts: np.ndarray, stops: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Expand [start, stop) ranges into flat positions.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Index of the originating range and the position within the range
+    """
+    counts = np.maximum(stops - starts, 0)
+    total = int(counts.sum())
+    owner = np.repeat(np.arange(len(starts)), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owner, np.repeat(starts, counts) + offsets
+
+
+def _group_rank(groups: np.ndarray) -> np.ndarray:
+    """Position of each element within its run of equal (sorted) group ids."""
+    positions = np.arange(len(groups))
+    group_start = np.ones(len(groups), dtype=bool)
+    group_start[1:] = groups[1:] != groups[:-1]
+    return positions - np.maximum.accumulate(np.where(group_start, positions, 0))
+
+
+def _length_bounds(
+    lengths: np.ndarray,
+    threshold: float,
+    method: str
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Bound the lengths of strings that can reach ``threshold``.
+
+    Levenshtein similarity needs |m - n| <= (1 - t) * max(m, n); Jaro-Winkler
+    is at most 0.6 * (2 + min/max) / 3 + 0.4 given the length ratio; a
+    string can only contain strings no longer than itself.
+    """
+    eps = 1e-9
+    lengths = lengths.astype(float)
+    no_limit = np.full(len(lengths), np.inf)
+
+    if method == 'contains':
+        return lengths, no_limit
+
+    if method == 'levenshtein':
+        ratio = threshold
+    else:
+        ratio = 5 * threshold - 4
+
+    if ratio <= 0:
+        return np.zeros(len(lengths)), no_limit
+
+    lower = np.ceil(lengths * ratio - eps)
+    upper = np.floor(lengths / ratio + eps)
+    return lower, upper
+
+
+class QGramIndex:
+    """
+    Inverted q-gram index over a set of reference strings.
+
+    Stores each string's code points and length alongside a CSR postings
+    list mapping every padded q-gram to the strings that contain it.
+
+    Parameters
+    ----------
+    values : array-like
+        Reference strings (matched case-insensitively)
+    q : int
+        Gram length (1-3)
+    """
+
+    def __init__(self, values, q: int = QGRAM_SIZE):
+        if not 1 <= q <= 3:
+            raise ValueError(f"q-gram size must be between 1 and 3: {q}")
+
+        self.q = q
+        self.values = _normalize_strings(values)
+        self.codes, self.lengths = _encode_strings(self.values)
+
+        owner, grams = _extract_qgrams(self.codes, self.lengths, q)
+        self.grams, inverse = np.unique(grams, return_inverse=True)
+        order = np.argsort(inverse, kind='stable')
+        self.postings = owner[order]
+        self.doc_freq = np.bincount(inverse, minlength=len(self.grams))
+        self.indptr = np.concatenate([[0], np.cumsum(self.doc_freq)])
+
+        self._init_lookups()
+
+    def _init_lookups(self):
+        """Set up the length ordering and lazily built lookup tables."""
+        self.by_length = np.argsort(self.lengths, kind='stable')
+        self.sorted_lengths = self.lengths[self.by_length]
+        self._prefix_keys = None
+        self._char_hist = None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def prepare(self, method: Optional[str], blocking: Optional[str]):
+        """
+        Build the lookup tables a matching run needs.
+
+        Tables are otherwise built on first use; building them up front lets
+        forked workers share one copy instead of each building their own.
+        """
+        if method in ('levenshtein', 'jaro_winkler') and self._char_hist is None:
+            self._char_hist = _char_histogram(self.codes, self.lengths)
+        if blocking == 'prefix' and self._prefix_keys is None:
+            keys = _prefix_keys(self.codes)
+            self._prefix_order = np.argsort(keys, kind='stable')
+            self._prefix_keys = keys[self._prefix_order]
+
+    @staticmethod
+    def fingerprint(values, q: int = QGRAM_SIZE) -> str:
+        """Content hash identifying the index built from ``values``."""
+        hashes = pd.util.hash_array(_normalize_strings(values).astype(object))
+        digest = hashlib.sha1(hashes.tobytes())
+        digest.update(f'q={q};v={INDEX_FORMAT_VERSION}'.encode())
+        return digest.hexdigest()[:16]
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Save the index as an uncompressed .npz archive."""
+        path = Path(path)
+        ensure_dir(path.parent)
+        with open(path, 'wb') as f:
+            np.savez(
+                f,
+                version=INDEX_FORMAT_VERSION,
+                q=self.q,
+                values=self.values,
+                grams=self.grams,
+                postings=self.postings,
+                doc_freq=self.doc_freq,
+                indptr=self.indptr,
+            )
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> QGramIndex:
+        """Load an index written by :meth:`save`."""
+        with np.load(path, allow_pickle=False) as data:
+            if int(data['version']) != INDEX_FORMAT_VERSION:
+                raise ValueError(f"Unsupported q-gram index version: {path}")
+
+            index = cls.__new__(cls)
+            index.q = int(data['q'])
+            index.values = data['values']
+            index.grams = data['grams']
+            index.postings = data['postings']
+            index.doc_freq = data['doc_freq']
+            index.indptr = data['indptr']
+
+        index.codes, index.lengths = _encode_strings(index.values)
+        index._init_lookups()
+        return index
+
+    def top_k(
+        self,
+        codes: np.ndarray,
+        lengths: np.ndarray,
+        k: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find the ``k`` indexed strings sharing the most q-grams with each query.
+
+        Ties are broken by index position.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            Query row, index position and shared distinct gram count
+        """
+        owner, grams = _extract_qgrams(codes, lengths, self.q)
+        if len(self) == 0 or len(owner) == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, empty
+
+        gram_id = np.minimum(np.searchsorted(self.grams, grams), len(self.grams) - 1)
+        present = self.grams[gram_id] == grams
+        owner, gram_id = owner[present], gram_id[present]
+
+        range_owner, pos = _expand_ranges(self.indptr[gram_id], self.indptr[gram_id + 1])
+
+        # Each distinct shared gram contributes one (query, string) entry
+        key = np.sort(owner[range_owner] * len(self) + self.postings[pos])
+        run_start = np.ones(len(key), dtype=bool)
+        run_start[1:] = key[1:] != key[:-1]
+        starts = np.flatnonzero(run_start)
+        shared = np.diff(np.append(starts, len(key)))
+        owner, right_id = np.divmod(key[starts], len(self))
+
+        order = np.lexsort((right_id, -shared, owner))
+        owner, right_id, shared = owner[order], right_id[order], shared[order]
+        keep = _group_rank(owner) < k
+        return owner[keep], right_id[keep], shared[keep]
+
+    def candidates(
+        self,
+        codes: np.ndarray,
+        lengths: np.ndarray,
+        threshold: float,
+        method: str,
+        blocking: Optional[str] = 'qgram',
+        top_k: Optional[int] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Generate length-compatible candidate pairs for encoded query strings.
+
+        When ``top_k`` is given, candidates are restricted to each query's
+        ``top_k`` strings by shared q-gram count and ``blocking`` is ignored.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Query row and index position of each candidate pair
+        """
+        if len(self) == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        lower, upper = _length_bounds(lengths, threshold, method)
+
+        if top_k is not None:
+            owner, right_id, _ = self.top_k(codes, lengths, top_k)
+            scanned = np.zeros(len(lengths), dtype=bool)
+        elif blocking == 'qgram':
+            owner, right_id, scanned = self._qgram_candidates(
+                codes, lengths, threshold, method
+            )
+        elif blocking == 'prefix':
+            owner, right_id = self._prefix_candidates(codes)
+            scanned = np.zeros(len(lengths), dtype=bool)
+        elif blocking is None:
+            owner = right_id = np.empty(0, dtype=np.int64)
+            scanned = np.ones(len(lengths), dtype=bool)
+        else:
+            raise ValueError(f"Unknown blocking scheme: {blocking}")
+
+        # Queries the gram filter cannot prune scan their length range
+        if scanned.any():
+            rows = np.flatnonzero(scanned)
+            starts = np.searchsorted(self.sorted_lengths, lower[rows], side='left')
+            stops = np.searchsorted(self.sorted_lengths, upper[rows], side='right')
+            range_owner, pos = _expand_ranges(starts, stops)
+            owner = np.concatenate([owner, rows[range_owner]])
+            right_id = np.concatenate([right_id, self.by_length[pos]])
+
+        n = self.lengths[right_id]
+        keep = (n >= lower[owner]) & (n <= upper[owner])
+        owner, right_id = owner[keep], right_id[keep]
+
+        # A right string may be reached through several grams
+        if blocking == 'qgram' and top_k is None:
+            key = np.sort(owner * len(self) + right_id)
+            distinct = np.ones(len(key), dtype=bool)
+            distinct[1:] = key[1:] != key[:-1]
+            owner, right_id = np.divmod(key[distinct], len(self))
+
+        if method in ('levenshtein', 'jaro_winkler') and len(owner):
+            keep = self._bag_filter(codes, lengths, owner, right_id, threshold, method)
+            owner, right_id = owner[keep], right_id[keep]
+
+        return owner, right_id
+
+    def _bag_filter(
+        self,
+        codes: np.ndarray,
+        lengths: np.ndarray,
+        owner: np.ndarray,
+        right_id: np.ndarray,
+        threshold: float,
+        method: str = 'levenshtein'
+    ) -> np.ndarray:
+        """
+        Drop pairs whose character histograms already rule out ``threshold``.
+
+        Each edit changes at most one character count on either side, so the
+        larger one-sided difference of the histograms is a lower bound on
+        the edit distance. Jaro-Winkler matches at most c characters, the
+        size of the histograms' overlap, so it is at most
+        0.6 * (c/m + c/n + 1) / 3 + 0.4. Hashing characters into buckets
+        only loosens either bound, keeping the filter lossless.
+        """
+        self.prepare(method, None)
+        query_hist = _char_histogram(codes, lengths)
+
+        keep = np.empty(len(owner), dtype=bool)
+        for start in range(0, len(owner), PAIR_CHUNK_SIZE):
+            chunk = slice(start, start + PAIR_CHUNK_SIZE)
+            o, r = owner[chunk], right_id[chunk]
+            len_a, len_b = lengths[o], self.lengths[r]
+            if method == 'jaro_winkler':
+                common = np.minimum(query_hist[o], self._char_hist[r]).sum(axis=1)
+                common = np.minimum(common, np.minimum(len_a, len_b))
+                jaro = (common / np.maximum(len_a, 1) + common / np.maximum(len_b, 1) + 1) / 3
+                # Two empty strings are identical (1.0); no shared character scores 0
+                bound = np.where(common > 0, 0.6 * jaro + 0.4, (len_a == 0) & (len_b == 0))
+                keep[chunk] = bound >= threshold - 1e-9
+            else:
+                diff = query_hist[o] - self._char_hist[r]
+                bound = np.maximum(
+                    np.maximum(diff, 0).sum(axis=1),
+                    np.maximum(-diff, 0).sum(axis=1)
+                )
+                budget = (1 - threshold) * np.maximum(len_a, len_b)
+                keep[chunk] = bound <= budget + 1e-9
+        return keep
+
+    def _qgram_candidates(
+        self,
+        codes: np.ndarray,
+        lengths: np.ndarray,
+        threshold: float,
+        method: str
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Probe the postings of each query's rarest grams.
+
+        Pairs reached through several grams are returned once per gram.
+
+        A pair within edit distance d shares at least max(m, n) + q - 1 - q*d
+        padded grams, so for Levenshtein it suffices to probe the
+        G - T + 1 rarest distinct grams of a query with G grams and bound
+        T. Containment requires every inner gram, so probing the rarest
+        one suffices. Jaro-Winkler can match strings sharing no gram, so
+        its queries scan their length range instead (pruned by the
+        character-bag bound in :meth:`_bag_filter`).
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            Query row and index position of each pair, and a mask of
+            queries that must fall back to a length-range scan
+        """
+        q = self.q
+        m = lengths.astype(float)
+
+        if method == 'levenshtein':
+            owner, grams = _extract_qgrams(codes, lengths, q)
+            _, upper = _length_bounds(lengths, threshold, method)
+            slope = 1 - q * (1 - threshold)
+            longest = m if slope >= 0 else np.maximum(upper, m)
+            required = np.ceil(longest * slope + q - 1 - 1e-9)
+            n_probe = (m + q - 1) - required + 1
+            scanned = required <= 0
+        elif method == 'contains':
+            owner, grams = _extract_qgrams(codes, lengths, q, padded=False)
+            n_probe = np.ones(len(lengths))
+            scanned = lengths < q
+        else:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.ones(len(lengths), dtype=bool)
+
+        gram_id = np.minimum(np.searchsorted(self.grams, grams), len(self.grams) - 1)
+        present = self.grams[gram_id] == grams
+        freq = np.where(present, self.doc_freq[gram_id], 0)
+
+        # Rank each query's grams from rarest to most common
+        order = np.lexsort((freq, owner))
+        owner, gram_id, present = owner[order], gram_id[order], present[order]
+        rank = _group_rank(owner)
+
+        probe = present & (rank < n_probe[owner]) & ~scanned[owner]
+        owner, gram_id = owner[probe], gram_id[probe]
+
+        range_owner, pos = _expand_ranges(self.indptr[gram_id], self.indptr[gram_id + 1])
+        return owner[range_owner], self.postings[pos], scanned
+
+    def _prefix_candidates(self, codes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Pair each query with index strings sharing its leading characters."""
+        self.prepare(None, 'prefix')
+
+        keys = _prefix_keys(codes)
+        starts = np.searchsorted(self._prefix_keys, keys, side='left')
+        stops = np.searchsorted(self._prefix_keys, keys, side='right')
+        owner, pos = _expand_ranges(starts, stops)
+        return owner, self._prefix_order[pos]
+
+
+def load_qgram_index(
+    values,
+    q: int = QGRAM_SIZE,
+    index_dir: Optional[Path] = None,
+    rebuild: bool = False
+) -> QGramIndex:
+    """
+    Load the cached q-gram index for ``values``, building it if needed.
+
+    Indexes are stored as data_work/linkage_index/qgram_<fingerprint>.npz,
+    keyed by a hash of the reference strings and q, so repeated linkage runs
+    against an unchanged reference file reuse the same index.
+
+    Parameters
+    ----------
+    values : array-like
+        Reference strings, in the order used for index positions
+    q : int
+        Gram length (1-3)
+    index_dir : Path, optional
+        Cache directory (default: data_work/linkage_index/)
+    rebuild : bool
+        Ignore any cached index and rebuild it
+
+    Returns
+    -------
+    QGramIndex
+        Index over ``values``
+    """
+    index_dir = Path(index_dir) if index_dir else get_data_dir('work') / INDEX_SUBDIR
+    path = index_dir / f'qgram_{QGramIndex.fingerprint(values, q)}.npz'
+
+    if path.exists() and not rebuild:
+        return QGramIndex.load(path)
+
+    index = QGramIndex(values, q=q)
+    index.save(path)
+    return index
+
+
+def _char_histogram(codes: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Count characters of encoded strings into ``_HIST_BUCKETS`` hash buckets."""
+    n, width = codes.shape
+    valid = np.arange(width) < lengths[:, None]
+    rows = np.broadcast_to(np.arange(n)[:, None], codes.shape)[valid]
+    buckets = codes[valid].astype(np.int64) % _HIST_BUCKETS
+    hist = np.bincount(rows * _HIST_BUCKETS + buckets, minlength=n * _HIST_BUCKETS)
+    return hist.reshape(n, _HIST_BUCKETS).astype(np.int16)
+
+
+def _prefix_keys(codes: np.ndarray) -> np.ndarray:
+    """Pack the leading characters of encoded strings into integer keys."""
+    keys = np.zeros(len(codes), dtype=np.int64)
+    for j in range(BLOCK_PREFIX_LENGTH):
+        column = codes[:, j] if j < codes.shape[1] else np.zeros(len(codes))
+        keys = keys * _GRAM_BASE + column.astype(np.int64)
+    return keys
+
+
+# ============================================================
+# VECTORIZED SCORING
+# ============================================================
+
+def _score_pairs(
+    codes: np.ndarray,
+    lengths: np.ndarray,
+    index: QGramIndex,
+    owner: np.ndarray,
+    right_id: np.ndarray,
+    method: str,
+    strings: np.ndarray,
+    threshold: float = 0.0,
+    cache: Optional[SimilarityCache] = None,
+    keys: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Score candidate pairs in chunks of ``PAIR_CHUNK_SIZE``.
+
+    Pairs that cannot reach ``threshold`` may be scored 0. With a
+    ``cache`` (and the pairs' ``keys``), only cache misses are scored and
+    their results are stored back.
+    """
+    scores = np.empty(len(owner))
+    todo = np.arange(len(owner))
+    if cache is not None:
+        scores, hit = cache.lookup(keys, threshold)
+        todo = np.flatnonzero(~hit)
+
+    for start in range(0, len(todo), PAIR_CHUNK_SIZE):
+        chunk = todo[start:start + PAIR_CHUNK_SIZE]
+        o, r = owner[chunk], right_id[chunk]
+        scores[chunk] = _pair_similarity(
+            codes[o], lengths[o], strings[o],
+            index.codes[r], index.lengths[r], index.values[r],
+            method, threshold
+        )
+
+    if cache is not None:
+        cache.store(keys[todo], scores[todo], threshold)
+
+    return scores
+
+
+def _pair_similarity(
+    codes_a: np.ndarray,
+    len_a: np.ndarray,
+    strings_a: np.ndarray,
+    codes_b: np.ndarray,
+    len_b: np.ndarray,
+    strings_b: np.ndarray,
+    method: str,
+    threshold: float = 0.0
+) -> np.ndarray:
+    """
+    Similarity of aligned pairs of normalized, encoded strings.
+
+    Pairs that cannot reach ``threshold`` may be scored 0.
+    """
+    if len(len_a) == 0:
+        return np.empty(0)
+
+    if method == 'levenshtein':
+        width_a = max(int(len_a.max()), 1)
+        width_b = max(int(len_b.max()), 1)
+        max_len = np.maximum(np.maximum(len_a, len_b), 1)
+        max_dist = _edit_budget(max_len, threshold)
+        distance = _levenshtein_batch(
+            codes_a[:, :width_a], len_a, codes_b[:, :width_b], len_b, max_dist
+        )
+        return np.where(
+            (len_a == 0) & (len_b == 0), 1.0,
+            np.where(distance > max_dist, 0.0, 1.0 - distance / max_len)
+        )
+
+    if method == 'jaro_winkler':
+        return _jaro_winkler_batch(codes_a, len_a, codes_b, len_b)
+
+    return (np.char.find(strings_b, strings_a) >= 0).astype(float)
+
+
+def jaro_winkler_batch(left, right) -> np.ndarray:
+    """
+    Jaro-Winkler similarity of aligned pairs of strings.
+
+    Strings are lower-cased and encoded once; results equal
+    :func:`_jaro_winkler_similarity` applied pair by pair.
+
+    Parameters
+    ----------
+    left : array-like
+        Left strings
+    right : array-like
+        Right strings, same length as ``left``
+
+    Returns
+    -------
+    np.ndarray
+        Similarities (0-1)
+    """
+    codes_a, len_a = _encode_strings(_normalize_strings(left))
+    codes_b, len_b = _encode_strings(_normalize_strings(right))
+    if len(len_a) != len(len_b):
+        raise ValueError("left and right must have the same length")
+    return _jaro_winkler_batch(codes_a, len_a, codes_b, len_b)
+
+
+def _jaro_winkler_batch(
+    a: np.ndarray,
+    len_a: np.ndarray,
+    b: np.ndarray,
+    len_b: np.ndarray
+) -> np.ndarray:
+    """
+    Jaro-Winkler similarity for aligned rows of two code-point matrices.
+
+    The greedy window matching of the scalar version is sequential in the
+    left string only, so it runs as one vectorized step per left position
+    across all pairs. Matched characters are then compacted in order to
+    count transpositions. Arithmetic follows the scalar version exactly.
+    """
+    n = len(len_a)
+    if n == 0:
+        return np.empty(0)
+
+    width_a = int(len_a.max())
+    width_b = int(len_b.max())
+    a, b = a[:, :width_a], b[:, :width_b]
+    cols = np.arange(width_b)
+
+    window = np.maximum(np.maximum(len_a, len_b) // 2 - 1, 0)
+    a_matched = np.zeros((n, width_a), dtype=bool)
+    b_taken = cols >= len_b[:, None]
+
+    for i in range(width_a):
+        # Padding never equals a live character, but rows past their
+        # length still need masking where b holds a zero code point
+        hit = (b == a[:, i, None]) & ~b_taken & (np.abs(cols - i) <= window[:, None])
+        hit &= (len_a > i)[:, None]
+        j = hit.argmax(axis=1)
+        rows = np.flatnonzero(hit[np.arange(n), j])
+        a_matched[rows, i] = True
+        b_taken[rows, j[rows]] = True
+
+    b_matched = b_taken & (cols < len_b[:, None])
+    matches = a_matched.sum(axis=1)
+
+    # Matched characters in order on each side; mismatches are transpositions
+    width = min(width_a, width_b)
+    a_seq = _compact_rows(a, a_matched, width)
+    b_seq = _compact_rows(b, b_matched, width)
+    transpositions = (
+        (a_seq[:, :width] != b_seq[:, :width]) & (np.arange(width) < matches[:, None])
+    ).sum(axis=1)
+
+    # Common prefix of up to four characters
+    p = min(width, 4)
+    same = (a[:, :p] == b[:, :p]) & (np.arange(p) < np.minimum(len_a, len_b)[:, None])
+    prefix = np.cumprod(same, axis=1).sum(axis=1)
+
+    m = np.maximum(matches, 1)
+    jaro = (matches / np.maximum(len_a, 1) + matches / np.maximum(len_b, 1) +
+            (matches - transpositions / 2) / m) / 3
+    similarity = np.where(matches > 0, jaro + prefix * 0.1 * (1 - jaro), 0.0)
+
+    identical = (len_a == len_b) & (a[:, :width] == b[:, :width]).all(axis=1)
+    return np.where(identical, 1.0, similarity)
+
+
+def _compact_rows(codes: np.ndarray, mask: np.ndarray, width: int) -> np.ndarray:
+    """Move the masked entries of each row to its front, keeping their order."""
+    out = np.zeros((len(codes), width), dtype=codes.dtype)
+    rows, cols = np.nonzero(mask)
+    out[rows, np.cumsum(mask, axis=1)[rows, cols] - 1] = codes[rows, cols]
+    return out
+
+
+def _levenshtein_batch(
+    a: np.ndarray,
+    len_a: np.ndarray,
+    b: np.ndarray,
+    len_b: np.ndarray,
+    max_dist: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Bounded edit distances between rows of two code-point matrices.
+
+    Runs the Wagner-Fischer recurrence one row at a time across all pairs,
+    keeping two rows and only the diagonal band |i - j| <= max(max_dist).
+    Insertions within a row are resolved with a running minimum, since
+    cur[j] = min_k (tmp[k] + j - k) = j + cummin(tmp - k). A pair leaves
+    the batch once its band minimum exceeds its bound, since row minima
+    never decrease.
+
+    Returns
+    -------
+    np.ndarray
+        Exact distances where they are within ``max_dist``, else max_dist + 1
+    """
+    if max_dist is None:
+        max_dist = np.maximum(len_a, len_b)
+    max_dist = np.asarray(max_dist, dtype=np.int64)
+
+    distance = np.minimum(len_b, max_dist + 1)
+    feasible = np.abs(len_a - len_b) <= max_dist
+    distance[~feasible] = max_dist[~feasible] + 1
+
+    # Process pairs in order of length so finished rows drop off together
+    idx = np.flatnonzero(feasible & (len_a > 0))
+    idx = idx[np.argsort(len_a[idx], kind='stable')]
+    if len(idx) == 0:
+        return distance
+
+    # Pair-minor layout keeps each DP column contiguous across pairs
+    a, b = a[idx].T.copy(), b[idx].T.copy()
+    len_a, len_b, bound = len_a[idx], len_b[idx], max_dist[idx]
+    distance[idx] = bound + 1
+
+    band = int(bound.max())
+    cap = band + 1
+    width_b = b.shape[0]
+    cols = np.arange(width_b + 1)[:, None]
+
+    prev = np.broadcast_to(np.minimum(cols, cap), (width_b + 1, len(idx))).astype(np.int32)
+    cur = np.empty_like(prev)
+
+    for i in range(1, int(len_a.max()) + 1):
+        lo, hi = max(1, i - band), min(width_b, i + band)
+
+        cur[0] = min(i, cap)
+        if lo > 1:
+            cur[lo - 1] = cap
+        if hi < width_b:
+            cur[hi + 1] = cap
+
+        cost = b[lo - 1:hi] != a[i - 1]
+        tmp = np.minimum(prev[lo:hi + 1] + 1, prev[lo - 1:hi] + cost)
+
+        offsets = cols[:hi - lo + 2]
+        segment = np.concatenate([cur[lo - 1:lo], tmp]) - offsets
+        cur[lo - 1:hi + 1] = np.minimum.accumulate(segment, axis=0) + offsets
+
+        done = len_a == i
+        if done.any():
+            final = cur[len_b[done], np.flatnonzero(done)]
+            distance[idx[done]] = np.minimum(final, bound[done] + 1)
+
+        prev, cur = cur, prev
+
+        alive = ~done & (prev[lo - 1:hi + 1].min(axis=0) <= bound)
+        if not alive.any():
+            break
+        if alive.sum() < 0.75 * len(alive):
+            a, b, prev, cur = a[:, alive], b[:, alive], prev[:, alive], cur[:, alive]
+            len_a, len_b, bound, idx = len_a[alive], len_b[alive], bound[alive], idx[alive]
+
+    return distance
+
+
+# ============================================================
+# SIMILARITY CACHE
+# ============================================================
+
+class SimilarityCache:
+    """
+    Similarity scores for (normalized left, normalized right) pairs of one method.
+
+    Pairs are keyed by the 128-bit blake2b digests of both strings, left
+    then right, as one fixed-width bytes value; keys are held in sorted
+    arrays, so lookups are a single ``searchsorted`` per batch. A stored
+    value is either an exact score (>= 0) or, for pairs the bounded
+    Levenshtein kernel pruned, ``-t`` meaning "below threshold t"; a
+    bound answers any later query at a threshold >= t and is otherwise a
+    miss. New entries are buffered until :meth:`flush`, which also evicts
+    the least recently used entries beyond ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        path: Optional[Union[str, Path]] = None,
+        max_entries: int = SCORE_CACHE_MAX_ENTRIES
+    ):
+        self.method = method
+        self.path = Path(path) if path else None
+        self.max_entries = max_entries
+        self.keys = np.empty(0, dtype=self.key_dtype())
+        self.values = np.empty(0)
+        self.last_used = np.empty(0, dtype=np.int64)
+        self.clock = 0
+        self._pending = []
+        self._touched = []
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @staticmethod
+    def key_dtype() -> np.dtype:
+        """Fixed-width bytes dtype of pair keys."""
+        return np.dtype(f'S{2 * SCORE_CACHE_DIGEST_SIZE}')
+
+    @staticmethod
+    def string_hashes(strings) -> np.ndarray:
+        """blake2b digests of normalized strings, one uint8 row per string."""
+        digests = b''.join(
+            hashlib.blake2b(str(s).encode('utf-8'), digest_size=SCORE_CACHE_DIGEST_SIZE).digest()
+            for s in strings
+        )
+        return np.frombuffer(digests, dtype=np.uint8).reshape(-1, SCORE_CACHE_DIGEST_SIZE)
+
+    @classmethod
+    def pair_keys(cls, left_hash: np.ndarray, right_hash: np.ndarray) -> np.ndarray:
+        """Order-sensitive keys for aligned (left, right) digest rows."""
+        pairs = np.ascontiguousarray(np.hstack([left_hash, right_hash]))
+        return pairs.view(cls.key_dtype()).ravel()
+
+    def lookup(self, keys: np.ndarray, threshold: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Cached scores for ``keys`` at ``threshold``.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Scores (0 where only known to be below ``threshold``) and a
+            mask of cache hits
+        """
+        scores = np.zeros(len(keys))
+        if len(self.keys) == 0 or len(keys) == 0:
+            return scores, np.zeros(len(keys), dtype=bool)
+
+        pos = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+        values = self.values[pos]
+        found = self.keys[pos] == keys
+        hit = found & ((values >= 0) | (threshold >= -values))
+
+        scores[hit] = np.maximum(values[hit], 0.0)
+        self.last_used[pos[hit]] = self.clock
+        self._touched.append(keys[hit])
+        return scores, hit
+
+    def store(self, keys: np.ndarray, scores: np.ndarray, threshold: float):
+        """Buffer newly computed scores (below-threshold Levenshtein scores as bounds)."""
+        if len(keys) == 0:
+            return
+        values = scores.astype(float)
+        if self.method == 'levenshtein' and threshold > 0:
+            values = np.where(values < threshold, -threshold, values)
+        self._pending.append((keys, values))
+
+    def drain(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Hand over buffered entries and touched keys (from a worker process)."""
+        keys, values = self._take_pending()
+        touched = np.concatenate(self._touched) if self._touched else np.empty(0, dtype=self.key_dtype())
+        self._touched = []
+        return keys, values, touched
+
+    def absorb(self, drained: tuple[np.ndarray, np.ndarray, np.ndarray]):
+        """Merge the output of :meth:`drain` from another process."""
+        keys, values, touched = drained
+        if len(keys):
+            self._pending.append((keys, values))
+        if len(touched) and len(self.keys):
+            pos = np.minimum(np.searchsorted(self.keys, touched), len(self.keys) - 1)
+            self.last_used[pos[self.keys[pos] == touched]] = self.clock
+
+    def flush(self):
+        """Merge buffered entries, newest winning, then evict beyond ``max_entries``."""
+        self._touched = []
+        new_keys, new_values = self._take_pending()
+        if len(new_keys) == 0 and len(self.keys) <= self.max_entries:
+            return
+
+        keys = np.concatenate([self.keys, new_keys])
+        values = np.concatenate([self.values, new_values])
+        last_used = np.concatenate([
+            self.last_used, np.full(len(new_keys), self.clock, dtype=np.int64)
+        ])
+
+        # Stable sort keeps insertion order within a key; keep the newest
+        order = np.argsort(keys, kind='stable')
+        newest = np.ones(len(order), dtype=bool)
+        newest[:-1] = keys[order[1:]] != keys[order[:-1]]
+        keep = order[newest]
+
+        if len(keep) > self.max_entries:
+            recent = np.argsort(-last_used[keep], kind='stable')[:self.max_entries]
+            keep = keep[np.sort(recent)]
+
+        self.keys = keys[keep]
+        self.values = values[keep]
+        self.last_used = last_used[keep]
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> Path:
+        """Flush and save the cache as an uncompressed .npz archive."""
+        self.flush()
+        path = Path(path) if path else self.path
+        ensure_dir(path.parent)
+        with open(path, 'wb') as f:
+            np.savez(
+                f,
+                version=SCORE_CACHE_VERSION,
+                method=self.method,
+                keys=self.keys,
+                values=self.values,
+                last_used=self.last_used,
+                clock=self.clock,
+            )
+        return path
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, Path],
+        max_entries: int = SCORE_CACHE_MAX_ENTRIES
+    ) -> SimilarityCache:
+        """Load a cache written by :meth:`save`; entries used from now on count as newer."""
+        with np.load(path, allow_pickle=False) as data:
+            if int(data['version']) != SCORE_CACHE_VERSION:
+                raise ValueError(f"Unsupported similarity cache version: {path}")
+
+            cache = cls(str(data['method']), path, max_entries)
+            cache.keys = data['keys']
+            cache.values = data['values']
+            cache.last_used = data['last_used']
+            cache.clock = int(data['clock']) + 1
+
+        return cache
+
+    def _take_pending(self) -> tuple[np.ndarray, np.ndarray]:
+        """Concatenate and clear the buffered entries."""
+        if not self._pending:
+            return np.empty(0, dtype=self.key_dtype()), np.empty(0)
+        keys, values = (np.concatenate(parts) for parts in zip(*self._pending))
+        self._pending = []
+        return keys, values
+
+
+def load_similarity_cache(
+    method: str,
+    cache_dir: Optional[Path] = None,
+    max_entries: int = SCORE_CACHE_MAX_ENTRIES
+) -> SimilarityCache:
+    """
+    Load the persistent similarity cache for ``method``.
+
+    Caches are stored as data_work/linkage_cache/scores_<method>.npz. A
+    new, empty cache is returned when none exists yet or the stored one
+    was written in an older format.
+    """
+    cache_dir = Path(cache_dir) if cache_dir else get_data_dir('work') / SCORE_CACHE_SUBDIR
+    path = cache_dir / f'scores_{method}.npz'
+
+    if path.exists():
+        try:
+            return SimilarityCache.load(path, max_entries)
+        except ValueError:
+            print(f"  Similarity cache {path.name} has an older format; starting a new one")
+    return SimilarityCache(method, path, max_entries)
+
+
 # ============================================================
 # FUZZY MATCHING
 # ============================================================
@@ -172,11 +1377,26 @@ def fuzzy_match(
     left_on: str,
     right_on: str,
     threshold: float = 0.8,
-    method: Literal['levenshtein', 'jaro_winkler', 'contains'] = 'levenshtein'
+    method: Literal['levenshtein', 'jaro_winkler', 'contains'] = 'levenshtein',
+    blocking: Optional[Literal['qgram', 'prefix']] = 'qgram',
+    batch_size: int = FUZZY_BATCH_SIZE,
+    top_k: Optional[int] = None,
+    index: Optional[QGramIndex] = None,
+    persist_index: bool = False,
+    workers: int = 1,
+    cache: Optional[SimilarityCache] = None,
+    persist_cache: bool = False,
+    assignment: Optional[Literal['greedy', 'optimal']] = None
 ) -> tuple[pd.DataFrame, LinkageResult]:
     """
     Perform fuzzy string matching.
 
+    Unique left values are matched in batches against an index over the
+    unique right values. Candidate pairs come from the blocking scheme, are
+    pruned by length bounds that no pair meeting ``threshold`` can violate,
+    and are scored over NumPy arrays. Ties go to the right value that
+    appears first in ``df_right``.
+
     Parameters
     ----------
     df_left : pd.DataFrame
@@ -191,51 +1411,92 @@ def fuzzy_match(
         Minimum similarity score (0-1)
     method : str
         Matching method
+    blocking : str, optional
+        Candidate generation: 'qgram' (shared q-grams; lossless for every
+        method, as 'jaro_winkler' scans the length range with a
+        character-bag filter), 'prefix' (shared leading characters), or
+        None to compare every length-compatible pair
+    batch_size : int
+        Number of unique left values scored per batch
+    top_k : int, optional
+        Only score each left value against the ``top_k`` right values
+        sharing the most q-grams (overrides ``blocking``; approximate)
+    index : QGramIndex, optional
+        Prebuilt index over ``df_right[right_on].unique()``
+    persist_index : bool
+        Load or save the right-side index under data_work/linkage_index/
+    workers : int
+        Number of worker processes; left values are sharded in batches of
+        ``batch_size`` and results are identical to a serial run
+    cache : SimilarityCache, optional
+        Pair scores to reuse; new scores are added to it
+    persist_cache : bool
+        Load or save the similarity cache under data_work/linkage_cache/
+    assignment : str, optional
+        Link one-to-one so each right row is used at most once: 'greedy'
+        (highest scores first) or 'optimal' (maximum total score). The
+        output then has one row per left row, with overlapping right
+        columns suffixed '_right'
 
     Returns
     -------
     tuple[pd.DataFrame, LinkageResult]
         Merged DataFrame and linkage result
     """
-    matches = []
+    if method not in SIMILARITY_METHODS:
+        raise ValueError(f"Unknown matching method: {method}")
+    if assignment is not None and assignment not in ASSIGNMENT_METHODS:
+        raise ValueError(f"Unknown assignment method: {assignment}")
 
     # Get unique values from right side for matching
     right_values = df_right[right_on].unique()
+    right_strings = pd.Series(right_values, dtype=object).map(str).to_numpy()
+    if index is None:
+        if persist_index:
+            index = load_qgram_index(right_strings)
+        else:
+            index = QGramIndex(right_strings)
+    elif len(index) != len(right_values):
+        raise ValueError(
+            f"Index covers {len(index)} values but {right_on} has {len(right_values)}"
+        )
 
-    for idx, row in df_left.iterrows():
-        left_val = str(row[left_on])
-        best_match = None
-        best_score = 0
-
-        for right_val in right_values:
-            right_val_str = str(right_val)
+    if cache is None and persist_cache:
+        cache = load_similarity_cache(method)
+    elif cache is not None and cache.method != method:
+        raise ValueError(f"Cache holds {cache.method} scores, not {method}")
 
-            if method == 'levenshtein':
-                score = _levenshtein_similarity(left_val, right_val_str)
-            elif method == 'jaro_winkler':
-                score = _jaro_winkler_similarity(left_val, right_val_str)
-            elif method == 'contains':
-                score = 1.0 if left_val.lower() in right_val_str.lower() else 0.0
-            else:
-                score = 1.0 if left_val == right_val_str else 0.0
+    # Score each distinct left value once
+    left_codes, left_uniques = pd.factorize(df_left[left_on].astype(object).map(str))
+    match_args = (
+        index, threshold, method, blocking, batch_size, top_k, cache, assignment is not None
+    )
+    if workers > 1 and len(left_uniques) > batch_size:
+        matches = _match_values_parallel(left_uniques.to_numpy(), match_args, workers)
+    else:
+        matches = _match_values(left_uniques.to_numpy(), *match_args)
 
-            if score > best_score and score >= threshold:
-                best_score = score
-                best_match = right_val
+    if cache is not None and persist_cache:
+        cache.save()
+    elif cache is not None:
+        cache.flush()
 
-        matches.append({
-            'left_idx': idx,
-            'match_value': best_match,
-            'match_score': best_score
-        })
+    if assignment is not None:
+        return _assign_rows(
+            df_left, df_right, left_codes, right_on, matches, assignment,
+            [left_on, right_on], method
+        )
+    best_idx, best_score = matches
 
-    # Create match DataFrame
-    match_df = pd.DataFrame(matches)
+    # Map best matches back to rows
+    row_idx = best_idx[left_codes]
+    matched = row_idx >= 0
+    match_values = pd.Series(right_values).reindex(np.where(matched, row_idx, -1))
 
     # Merge matches back
     df_left = df_left.copy()
-    df_left['_fuzzy_match'] = match_df['match_value'].values
-    df_left['_fuzzy_score'] = match_df['match_score'].values
+    df_left['_fuzzy_match'] = match_values.to_numpy()
+    df_left['_fuzzy_score'] = np.where(matched, best_score[left_codes], 0.0)
 
     # Join with right DataFrame
     df_merged = df_left.merge(
@@ -262,34 +1523,399 @@ def fuzzy_match(
     return df_merged, result
 
 
-def _levenshtein_similarity(s1: str, s2: str) -> float:
-    """Calculate Levenshtein similarity (0-1)."""
+def _match_values(
+    left_values: np.ndarray,
+    index: QGramIndex,
+    threshold: float,
+    method: str,
+    blocking: Optional[str],
+    batch_size: int,
+    top_k: Optional[int] = None,
+    cache: Optional[SimilarityCache] = None,
+    all_pairs: bool = False
+) -> tuple[np.ndarray, ...]:
+    """
+    Find the best-scoring indexed value for each left value.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Position of the best match in the index (-1 if none) and its score
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        With ``all_pairs``, every pair reaching ``threshold`` instead: left
+        position, index position and score (only these are kept, so memory
+        grows with passing pairs rather than candidates)
+    """
+    n_left = len(left_values)
+    best_idx = np.full(n_left, -1, dtype=np.int64)
+    best_score = np.zeros(n_left)
+    pairs = []
+    if cache is not None:
+        right_hash = SimilarityCache.string_hashes(index.values)
+
+    for start in range(0, n_left, batch_size):
+        batch = _normalize_strings(left_values[start:start + batch_size])
+        codes, lengths = _encode_strings(batch)
+
+        owner, right_id = index.candidates(
+            codes, lengths, threshold, method, blocking, top_k
+        )
+        if len(owner) == 0:
+            continue
+
+        keys = None
+        if cache is not None:
+            left_hash = SimilarityCache.string_hashes(batch)
+            keys = SimilarityCache.pair_keys(left_hash[owner], right_hash[right_id])
+
+        scores = _score_pairs(
+            codes, lengths, index, owner, right_id, method, batch, threshold, cache, keys
+        )
+
+        # Keep the highest score per left value, first right value on ties
+        keep = (scores >= threshold) & (scores > 0)
+        owner, right_id, scores = owner[keep], right_id[keep], scores[keep]
+        if all_pairs:
+            pairs.append((start + owner, right_id, scores))
+            continue
+
+        order = np.lexsort((right_id, -scores, owner))
+        owner, right_id, scores = owner[order], right_id[order], scores[order]
+        first = np.ones(len(owner), dtype=bool)
+        first[1:] = owner[1:] != owner[:-1]
+
+        best_idx[start + owner[first]] = right_id[first]
+        best_score[start + owner[first]] = scores[first]
+
+    if all_pairs:
+        return _concat_pairs(pairs)
+    return best_idx, best_score
+
+
+def _concat_pairs(pairs: list[tuple]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Concatenate (left, right, score) pair batches."""
+    if not pairs:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0)
+    return tuple(np.concatenate(parts) for parts in zip(*pairs))
+
+
+def one_to_one_assignment(
+    left: np.ndarray,
+    right: np.ndarray,
+    score: np.ndarray,
+    left_capacity: Optional[np.ndarray] = None,
+    right_capacity: Optional[np.ndarray] = None,
+    method: str = 'greedy'
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Assign scored (left, right) pairs so no node exceeds its capacity.
+
+    Nodes stand for distinct values and capacities for how many records
+    share them, so a capacity-respecting assignment of values is a
+    one-to-one assignment of records. 'greedy' takes pairs in order of
+    score (ties: lower left, then lower right); it runs vectorized rounds
+    that fix every pair that is the best remaining option of both its
+    nodes (equivalent to the sequential greedy pass) until rounds stop
+    making progress, then finishes sequentially. 'optimal' maximises
+    the total score with a sparse minimum-weight bipartite matching over
+    record-level copies of the nodes.
+
+    Parameters
+    ----------
+    left, right : np.ndarray
+        Node ids of each pair (non-negative integers)
+    score : np.ndarray
+        Pair scores
+    left_capacity, right_capacity : np.ndarray, optional
+        Capacity per node id (default: 1)
+    method : str
+        'greedy' or 'optimal'
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        Left id, right id and number of units of each assigned pair
+    """
+    if method not in ASSIGNMENT_METHODS:
+        raise ValueError(f"Unknown assignment method: {method}")
+
+    left, right = np.asarray(left, dtype=np.int64), np.asarray(right, dtype=np.int64)
+    score = np.asarray(score, dtype=float)
+    n_left = int(left.max()) + 1 if len(left) else 0
+    n_right = int(right.max()) + 1 if len(right) else 0
+    left_cap = (
+        np.ones(n_left, dtype=np.int64) if left_capacity is None
+        else np.asarray(left_capacity, dtype=np.int64)[:n_left].copy()
+    )
+    right_cap = (
+        np.ones(n_right, dtype=np.int64) if right_capacity is None
+        else np.asarray(right_capacity, dtype=np.int64)[:n_right].copy()
+    )
+
+    if method == 'optimal':
+        return _optimal_assignment(left, right, score, left_cap, right_cap)
+
+    # Pair position in priority order doubles as its rank
+    order = np.lexsort((right, left, -score))
+    left, right = left[order], right[order]
+    alive = np.flatnonzero((left_cap[left] > 0) & (right_cap[right] > 0))
+    chosen, units = [], []
+
+    while len(alive):
+        best_left = np.full(n_left, len(order))
+        best_right = np.full(n_right, len(order))
+        np.minimum.at(best_left, left[alive], alive)
+        np.minimum.at(best_right, right[alive], alive)
+
+        mutual = alive[(best_left[left[alive]] == alive) & (best_right[right[alive]] == alive)]
+        take = np.minimum(left_cap[left[mutual]], right_cap[right[mutual]])
+        left_cap[left[mutual]] -= take
+        right_cap[right[mutual]] -= take
+        chosen.append(mutual)
+        units.append(take)
+
+        n_alive = len(alive)
+        alive = alive[(left_cap[left[alive]] > 0) & (right_cap[right[alive]] > 0)]
+        if len(alive) > GREEDY_MIN_PROGRESS * n_alive:
+            break
+
+    # Tied scores can chain rounds that settle few pairs; finish in one pass
+    if len(alive):
+        rest, take = _sequential_greedy(alive, left[alive], right[alive], left_cap, right_cap)
+        chosen.append(rest)
+        units.append(take)
+
+    chosen = np.concatenate(chosen) if chosen else np.empty(0, dtype=np.int64)
+    units = np.concatenate(units) if units else np.empty(0, dtype=np.int64)
+    chosen_order = np.argsort(chosen, kind='stable')
+    chosen = chosen[chosen_order]
+    return left[chosen], right[chosen], units[chosen_order]
+
+
+def _sequential_greedy(
+    pairs: np.ndarray,
+    left: np.ndarray,
+    right: np.ndarray,
+    left_cap: np.ndarray,
+    right_cap: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Greedy assignment over pairs already in priority order (one pass)."""
+    left_cap, right_cap = left_cap.tolist(), right_cap.tolist()
+    chosen, units = [], []
+    for k, a, b in zip(pairs.tolist(), left.tolist(), right.tolist()):
+        take = min(left_cap[a], right_cap[b])
+        if take > 0:
+            left_cap[a] -= take
+            right_cap[b] -= take
+            chosen.append(k)
+            units.append(take)
+    return np.array(chosen, dtype=np.int64), np.array(units, dtype=np.int64)
+
+
+def _optimal_assignment(
+    left: np.ndarray,
+    right: np.ndarray,
+    score: np.ndarray,
+    left_cap: np.ndarray,
+    right_cap: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Maximum-score capacitated assignment.
+
+    Each node is split into one copy per unit of capacity and solved as a
+    sparse minimum-weight bipartite matching (scipy's LAPJVsp). Every left
+    copy also gets a private dummy column, so leaving it unmatched is
+    always feasible; real edges cost ``2 - score`` and dummies cost 2,
+    making the minimum cost matching the maximum score one.
+    """
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import min_weight_full_bipartite_matching
+
+    if len(left) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty
+
+    # Copies only for nodes that appear in some pair
+    left_nodes, left_node = np.unique(left, return_inverse=True)
+    right_nodes, right_node = np.unique(right, return_inverse=True)
+    left_copies = left_cap[left_nodes]
+    right_copies = right_cap[right_nodes]
+    left_start = np.cumsum(left_copies) - left_copies
+    right_start = np.cumsum(right_copies) - right_copies
+
+    per_pair = left_copies[left_node] * right_copies[right_node]
+    if per_pair.sum() > ASSIGNMENT_MAX_EDGES:
+        raise ValueError(
+            f"Optimal assignment needs {per_pair.sum():,} record-level edges; "
+            "use assignment='greedy' or raise the threshold"
+        )
+    pair, offset = _expand_ranges(np.zeros(len(per_pair), dtype=np.int64), per_pair)
+    i, j = np.divmod(offset, right_copies[right_node[pair]])
+    rows = left_start[left_node[pair]] + i
+    cols = right_start[right_node[pair]] + j
+
+    n_rows = int(left_copies.sum())
+    n_cols = int(right_copies.sum())
+    costs = csr_matrix(
+        (
+            np.concatenate([2.0 - score[pair], np.full(n_rows, 2.0)]),
+            (np.concatenate([rows, np.arange(n_rows)]),
+             np.concatenate([cols, n_cols + np.arange(n_rows)])),
+        ),
+        shape=(n_rows, n_cols + n_rows),
+    )
+    row_ind, col_ind = min_weight_full_bipartite_matching(costs)
+    real = col_ind < n_cols
+    row_ind, col_ind = row_ind[real], col_ind[real]
+
+    # Collapse matched copies back to value pairs
+    left_of_row = np.repeat(left_nodes, left_copies)
+    right_of_col = np.repeat(right_nodes, right_copies)
+    base = int(right_nodes.max()) + 1
+    key, units = np.unique(left_of_row[row_ind] * base + right_of_col[col_ind], return_counts=True)
+    pair_left, pair_right = np.divmod(key, base)
+
+    pair_key = left * base + right
+    by_key = np.argsort(pair_key)
+    pair_score = score[by_key[np.searchsorted(pair_key[by_key], key)]]
+    order = np.lexsort((pair_right, pair_left, -pair_score))
+    return pair_left[order], pair_right[order], units[order]
+
+
+def _assign_rows(
+    df_left: pd.DataFrame,
+    df_right: pd.DataFrame,
+    left_codes: np.ndarray,
+    right_on: str,
+    pairs: tuple[np.ndarray, np.ndarray, np.ndarray],
+    assignment: str,
+    key_columns: list[str],
+    method: str
+) -> tuple[pd.DataFrame, LinkageResult]:
+    """One-to-one fuzzy linkage of rows from value-level scored pairs."""
+    left_value, right_value, score = pairs
+    right_codes, _ = pd.factorize(df_right[right_on], use_na_sentinel=False)
+    left_count = np.bincount(left_codes, minlength=int(left_codes.max(initial=-1)) + 1)
+    right_count = np.bincount(right_codes, minlength=int(right_codes.max(initial=-1)) + 1)
+
+    left_value, right_value, units = one_to_one_assignment(
+        left_value, right_value, score, left_count, right_count, assignment
+    )
+
+    # Hand out record slots in assignment order: a value's first rows get
+    # its highest-priority partners
+    unit_left = np.repeat(left_value, units)
+    unit_right = np.repeat(right_value, units)
+    by_left = np.argsort(unit_left, kind='stable')
+    by_right = np.argsort(unit_right, kind='stable')
+
+    left_rows = np.argsort(left_codes, kind='stable')
+    right_rows = np.argsort(right_codes, kind='stable')
+    left_start = np.cumsum(left_count) - left_count
+    right_start = np.cumsum(right_count) - right_count
+
+    unit_left_row = np.empty(len(unit_left), dtype=np.int64)
+    unit_right_row = np.empty(len(unit_right), dtype=np.int64)
+    unit_left_row[by_left] = left_rows[
+        left_start[unit_left[by_left]] + _group_rank(unit_left[by_left])
+    ]
+    unit_right_row[by_right] = right_rows[
+        right_start[unit_right[by_right]] + _group_rank(unit_right[by_right])
+    ]
+
+    right_pos = np.full(len(df_left), -1, dtype=np.int64)
+    right_pos[unit_left_row] = unit_right_row
+    df_merged = _attach_rows(df_left, df_right, right_pos)
+
+    n_matched = len(unit_left_row)
+    result = LinkageResult(
+        source_name=getattr(df_right, 'name', 'secondary'),
+        n_source=len(df_right),
+        n_matched=n_matched,
+        n_unmatched=len(df_left) - n_matched,
+        match_type=f'fuzzy_{method}',
+        key_columns=key_columns
+    )
+
+    return df_merged, result
+
+
+def _edit_budget(max_len, threshold: float):
+    """Largest edit distance whose similarity 1 - d / max_len meets ``threshold``."""
+    return np.floor((1 - threshold) * max_len + 1e-9).astype(np.int64)
+
+
+def _levenshtein_similarity(s1: str, s2: str, threshold: float = 0.0) -> float:
+    """
+    Calculate Levenshtein similarity (0-1).
+
+    Scores below ``threshold`` are returned as 0.0; scores that meet it are
+    exact.
+    """
     if len(s1) == 0 and len(s2) == 0:
         return 1.0
     if len(s1) == 0 or len(s2) == 0:
         return 0.0
 
-    # Simple edit distance calculation
+    max_len = max(len(s1), len(s2))
+    budget = int(_edit_budget(max_len, threshold))
+    distance = _levenshtein_distance(s1, s2, budget)
+    if distance > budget:
+        return 0.0
+    return 1.0 - (distance / max_len)
+
+
+def _levenshtein_distance(s1: str, s2: str, max_dist: Optional[int] = None) -> int:
+    """
+    Case-insensitive edit distance, bounded by ``max_dist``.
+
+    Uses two rows restricted to the diagonal band |i - j| <= max_dist and
+    stops once every cell in a row exceeds the bound.
+
+    Returns
+    -------
+    int
+        Exact distance if it is at most ``max_dist``, else max_dist + 1
+    """
+    if len(s1) > len(s2):
+        s1, s2 = s2, s1
     m, n = len(s1), len(s2)
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
+    if max_dist is None:
+        max_dist = n
+    cap = max_dist + 1
+    if n - m > max_dist:
+        return cap
 
-    for i in range(m + 1):
-        dp[i][0] = i
-    for j in range(n + 1):
-        dp[0][j] = j
+    a = [c.lower() for c in s1]
+    b = [c.lower() for c in s2]
 
-    for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            cost = 0 if s1[i-1].lower() == s2[j-1].lower() else 1
-            dp[i][j] = min(
-                dp[i-1][j] + 1,      # deletion
-                dp[i][j-1] + 1,      # insertion
-                dp[i-1][j-1] + cost  # substitution
-            )
+    prev = [min(j, cap) for j in range(n + 1)]
+    cur = [cap] * (n + 1)
 
-    distance = dp[m][n]
-    max_len = max(m, n)
-    return 1.0 - (distance / max_len)
+    for i in range(1, m + 1):
+        lo, hi = max(1, i - max_dist), min(n, i + max_dist)
+        cur[0] = min(i, cap)
+        cur[lo - 1] = cap if lo > 1 else cur[0]
+        if hi < n:
+            cur[hi + 1] = cap
+
+        c1 = a[i - 1]
+        left = row_min = cur[lo - 1]
+        for j in range(lo, hi + 1):
+            value = prev[j - 1] if c1 == b[j - 1] else prev[j - 1] + 1
+            if prev[j] + 1 < value:
+                value = prev[j] + 1
+            if left + 1 < value:
+                value = left + 1
+            cur[j] = left = value
+            if value < row_min:
+                row_min = value
+
+        if row_min > max_dist:
+            return cap
+        prev, cur = cur, prev
+
+    return min(prev[n], cap)
 
 
 def _jaro_winkler_similarity(s1: str, s2: str) -> float:
@@ -351,6 +1977,648 @@ def _jaro_winkler_similarity(s1: str, s2: str) -> float:
     return jaro + prefix * 0.1 * (1 - jaro)
 
 
+# ============================================================
+# PROBABILISTIC (FELLEGI-SUNTER) MATCHING
+# ============================================================
+
+@dataclass
+class FieldComparison:
+    """
+    Agreement rule for one field in probabilistic matching.
+
+    String methods agree when similarity reaches ``threshold``; 'numeric'
+    agrees when the absolute difference is within ``tolerance`` (in days
+    for datetime columns). Missing values neither agree nor disagree.
+    """
+    left: str
+    right: Optional[str] = None
+    method: str = 'exact'
+    threshold: float = 0.85
+    tolerance: float = 0.0
+
+    def __post_init__(self):
+        self.right = self.right or self.left
+        if self.method not in COMPARISON_METHODS:
+            raise ValueError(f"Unknown comparison method: {self.method}")
+
+    @property
+    def name(self) -> str:
+        """Label used in diagnostics."""
+        return self.left if self.left == self.right else f'{self.left}:{self.right}'
+
+
+@dataclass
+class FellegiSunterModel:
+    """Fellegi-Sunter m/u probabilities and match prior."""
+    fields: list
+    m: np.ndarray
+    u: np.ndarray
+    prior: float
+    n_iter: int = 0
+    converged: bool = False
+    n_pairs: int = 0
+
+    def log_likelihood_ratio(self, gamma: np.ndarray) -> np.ndarray:
+        """Sum of per-field log match weights for agreement patterns."""
+        agree = np.log(self.m / self.u)
+        disagree = np.log((1 - self.m) / (1 - self.u))
+        weights = np.where(gamma == 1, agree, np.where(gamma == 0, disagree, 0.0))
+        return weights.sum(axis=1)
+
+    def match_probability(self, gamma: np.ndarray) -> np.ndarray:
+        """Posterior match probability for agreement patterns."""
+        log_odds = np.log(self.prior / (1 - self.prior)) + self.log_likelihood_ratio(gamma)
+        return 1 / (1 + np.exp(-log_odds))
+
+    def to_frame(self) -> pd.DataFrame:
+        """Per-field parameters and match weights (log2)."""
+        return pd.DataFrame({
+            'field': self.fields,
+            'm_probability': self.m,
+            'u_probability': self.u,
+            'agree_weight': np.log2(self.m / self.u),
+            'disagree_weight': np.log2((1 - self.m) / (1 - self.u)),
+            'prior': self.prior,
+            'n_pairs': self.n_pairs,
+            'em_iterations': self.n_iter,
+            'converged': self.converged,
+        })
+
+
+def block_pairs(
+    df_left: pd.DataFrame,
+    df_right: pd.DataFrame,
+    block_on: Optional[list[str]] = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Candidate pairs that agree exactly on the blocking columns.
+
+    Parameters
+    ----------
+    df_left : pd.DataFrame
+        Primary DataFrame
+    df_right : pd.DataFrame
+        Secondary DataFrame
+    block_on : list, optional
+        Columns present in both frames; None pairs every row (small data only)
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Row positions of each pair in ``df_left`` and ``df_right``
+    """
+    if not block_on:
+        left_pos = np.repeat(np.arange(len(df_left)), len(df_right))
+        right_pos = np.tile(np.arange(len(df_right)), len(df_left))
+        return left_pos, right_pos
+
+    left = df_left[block_on].reset_index(drop=True).dropna()
+    right = df_right[block_on].reset_index(drop=True).dropna()
+    pairs = (
+        left.assign(_left_pos=left.index)
+        .merge(right.assign(_right_pos=right.index), on=block_on)
+    )
+    return pairs['_left_pos'].to_numpy(), pairs['_right_pos'].to_numpy()
+
+
+def compare_fields(
+    df_left: pd.DataFrame,
+    df_right: pd.DataFrame,
+    left_pos: np.ndarray,
+    right_pos: np.ndarray,
+    comparisons: list[FieldComparison]
+) -> np.ndarray:
+    """
+    Agreement patterns for candidate pairs.
+
+    Each field is compared across all pairs at once. String similarities
+    are computed once per distinct value pair.
+
+    Returns
+    -------
+    np.ndarray
+        (n_pairs, n_fields) int8 array: 1 agree, 0 disagree, -1 missing
+    """
+    gamma = np.empty((len(left_pos), len(comparisons)), dtype=np.int8)
+
+    for k, comp in enumerate(comparisons):
+        left_vals = df_left[comp.left]
+        right_vals = df_right[comp.right]
+        missing = left_vals.isna().to_numpy()[left_pos] | right_vals.isna().to_numpy()[right_pos]
+
+        if comp.method == 'exact':
+            codes, _ = pd.factorize(pd.concat([left_vals, right_vals], ignore_index=True))
+            agree = codes[:len(left_vals)][left_pos] == codes[len(left_vals):][right_pos]
+        elif comp.method == 'numeric':
+            diff = np.abs(_as_numeric(left_vals)[left_pos] - _as_numeric(right_vals)[right_pos])
+            agree = diff <= comp.tolerance
+        else:
+            agree = _string_agreement(left_vals, right_vals, left_pos, right_pos, comp)
+
+        gamma[:, k] = np.where(missing, -1, agree)
+
+    return gamma
+
+
+def _as_numeric(values: pd.Series) -> np.ndarray:
+    """Float values for numeric comparison; datetimes become days."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        days = values.to_numpy(dtype='datetime64[ns]').astype(np.int64) / 86_400e9
+        return np.where(values.isna().to_numpy(), np.nan, days)
+    return pd.to_numeric(values, errors='coerce').to_numpy(dtype=float)
+
+
+def _string_agreement(
+    left_vals: pd.Series,
+    right_vals: pd.Series,
+    left_pos: np.ndarray,
+    right_pos: np.ndarray,
+    comp: FieldComparison
+) -> np.ndarray:
+    """Whether string similarity reaches the comparison threshold, per pair."""
+    left_codes, left_uniques = pd.factorize(left_vals.astype(object).map(str))
+    right_codes, right_uniques = pd.factorize(right_vals.astype(object).map(str))
+
+    pair_key = left_codes[left_pos].astype(np.int64) * len(right_uniques) + right_codes[right_pos]
+    unique_keys, inverse = np.unique(pair_key, return_inverse=True)
+    unique_left, unique_right = np.divmod(unique_keys, len(right_uniques))
+
+    strings_l = _normalize_strings(left_uniques.to_numpy())
+    strings_r = _normalize_strings(right_uniques.to_numpy())
+    codes_l, len_l = _encode_strings(strings_l)
+    codes_r, len_r = _encode_strings(strings_r)
+
+    scores = np.empty(len(unique_keys))
+    for start in range(0, len(unique_keys), PAIR_CHUNK_SIZE):
+        chunk = slice(start, start + PAIR_CHUNK_SIZE)
+        ul, ur = unique_left[chunk], unique_right[chunk]
+        scores[chunk] = _pair_similarity(
+            codes_l[ul], len_l[ul], strings_l[ul],
+            codes_r[ur], len_r[ur], strings_r[ur],
+            comp.method, comp.threshold
+        )
+
+    return scores[inverse] >= comp.threshold
+
+
+def fit_fellegi_sunter(
+    gamma: np.ndarray,
+    fields: list[str],
+    prior: float = 0.1,
+    max_iter: int = EM_MAX_ITER,
+    tol: float = EM_TOLERANCE
+) -> FellegiSunterModel:
+    """
+    Estimate m/u probabilities and the match prior by EM.
+
+    Pairs are collapsed to their distinct agreement patterns first, so
+    each iteration costs O(patterns x fields) regardless of pair count.
+    Missing comparisons are ignored (conditional independence given
+    match status is assumed).
+
+    Parameters
+    ----------
+    gamma : np.ndarray
+        Agreement patterns from :func:`compare_fields`
+    fields : list
+        Field labels
+    prior : float
+        Starting match prior
+    max_iter : int
+        Maximum EM iterations
+    tol : float
+        Convergence tolerance on parameter changes
+
+    Returns
+    -------
+    FellegiSunterModel
+        Fitted model
+    """
+    eps = 1e-6
+    n_fields = gamma.shape[1]
+    powers = 3 ** np.arange(n_fields, dtype=np.int64)
+    codes, counts = np.unique((gamma.astype(np.int64) + 1) @ powers, return_counts=True)
+    patterns = (codes[:, None] // powers % 3 - 1).astype(np.int8)
+
+    agree = (patterns == 1).astype(float)
+    observed = (patterns >= 0).astype(float)
+    counts = counts.astype(float)
+
+    # Most candidate pairs are non-matches, so overall agreement starts u
+    u = np.clip((counts @ agree) / np.maximum(counts @ observed, 1), eps, 0.5)
+    m = np.full(n_fields, 0.9)
+    model = FellegiSunterModel(list(fields), m, u, prior, n_pairs=len(gamma))
+
+    for iteration in range(1, max_iter + 1):
+        weight = model.match_probability(patterns)
+        match_counts = counts * weight
+        nonmatch_counts = counts - match_counts
+
+        m = np.clip((match_counts @ agree) / np.maximum(match_counts @ observed, eps), eps, 1 - eps)
+        u = np.clip((nonmatch_counts @ agree) / np.maximum(nonmatch_counts @ observed, eps), eps, 1 - eps)
+        prior = float(np.clip(match_counts.sum() / counts.sum(), eps, 1 - eps))
+
+        change = max(np.abs(m - model.m).max(), np.abs(u - model.u).max(), abs(prior - model.prior))
+        model.m, model.u, model.prior, model.n_iter = m, u, prior, iteration
+        if change < tol:
+            model.converged = True
+            break
+
+    return model
+
+
+def probabilistic_match(
+    df_left: pd.DataFrame,
+    df_right: pd.DataFrame,
+    comparisons: list[FieldComparison],
+    block_on: Optional[list[str]] = None,
+    threshold: float = 0.5,
+    model: Optional[FellegiSunterModel] = None,
+    suffixes: tuple = ('', '_right')
+) -> tuple[pd.DataFrame, LinkageResult]:
+    """
+    Perform Fellegi-Sunter probabilistic matching on several fields.
+
+    All fields are compared in one pass over the blocked candidate pairs,
+    m/u weights are estimated by EM (unless ``model`` is given), and each
+    left row is linked to its most probable right row.
+
+    Parameters
+    ----------
+    df_left : pd.DataFrame
+        Primary DataFrame
+    df_right : pd.DataFrame
+        Secondary DataFrame
+    comparisons : list[FieldComparison]
+        Fields to compare
+    block_on : list, optional
+        Columns both records must share to be compared
+    threshold : float
+        Minimum match probability to link
+    model : FellegiSunterModel, optional
+        Pre-fitted parameters; estimated from the candidate pairs if None
+    suffixes : tuple
+        Suffixes for duplicate columns
+
+    Returns
+    -------
+    tuple[pd.DataFrame, LinkageResult]
+        Left rows with the linked right columns and ``match_probability``,
+        and a linkage result whose diagnostics hold the m/u table
+    """
+    left_pos, right_pos = block_pairs(df_left, df_right, block_on)
+    gamma = compare_fields(df_left, df_right, left_pos, right_pos, comparisons)
+
+    if model is None:
+        model = fit_fellegi_sunter(gamma, [c.name for c in comparisons])
+    probability = model.match_probability(gamma)
+
+    # Most probable right row per left row, first right row on ties
+    keep = probability >= threshold
+    left_pos, right_pos, probability = left_pos[keep], right_pos[keep], probability[keep]
+    order = np.lexsort((right_pos, -probability, left_pos))
+    left_pos, right_pos, probability = left_pos[order], right_pos[order], probability[order]
+    first = _group_rank(left_pos) == 0
+
+    best_right = np.full(len(df_left), -1, dtype=np.int64)
+    best_prob = np.full(len(df_left), np.nan)
+    best_right[left_pos[first]] = right_pos[first]
+    best_prob[left_pos[first]] = probability[first]
+
+    df_merged = _attach_rows(df_left, df_right, best_right, suffixes)
+    df_merged['match_probability'] = best_prob
+
+    n_matched = int((best_right >= 0).sum())
+    result = LinkageResult(
+        source_name=getattr(df_right, 'name', 'secondary'),
+        n_source=len(df_right),
+        n_matched=n_matched,
+        n_unmatched=len(df_left) - n_matched,
+        match_type='probabilistic',
+        key_columns=[c.left for c in comparisons],
+        diagnostics=model.to_frame()
+    )
+
+    return df_merged, result
+
+
+def _attach_rows(
+    df_left: pd.DataFrame,
+    df_right: pd.DataFrame,
+    right_pos: np.ndarray,
+    suffixes: tuple = ('', '_right')
+) -> pd.DataFrame:
+    """Append the right row at ``right_pos`` (-1 for none) to each left row."""
+    right = df_right.reset_index(drop=True).reindex(right_pos).reset_index(drop=True)
+    overlap = set(df_left.columns) & set(right.columns)
+    left = df_left.reset_index(drop=True).rename(
+        columns={c: f'{c}{suffixes[0]}' for c in overlap}
+    )
+    right = right.rename(columns={c: f'{c}{suffixes[1]}' for c in overlap})
+    return pd.concat([left, right], axis=1)
+
+
+# ============================================================
+# SPATIAL MATCHING
+# ============================================================
+
+def haversine_distance(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray
+) -> np.ndarray:
+    """Great-circle distance in km between coordinate arrays (degrees)."""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=float)) for v in (lat1, lon1, lat2, lon2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+def _unit_vectors(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """Points on the unit sphere; chord length is monotone in arc length."""
+    lat, lon = np.radians(lat), np.radians(lon)
+    cos_lat = np.cos(lat)
+    return np.column_stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)])
+
+
+def _chord_length(distance_km: float) -> float:
+    """Chord length on the unit sphere for a great-circle distance."""
+    return 2 * np.sin(min(distance_km / EARTH_RADIUS_KM, np.pi) / 2)
+
+
+class SpatialIndex:
+    """
+    KD-tree over reference coordinates for great-circle queries.
+
+    Points are stored as 3-D unit vectors, so Euclidean nearest neighbours
+    and radius queries in the tree are exact great-circle ones; reported
+    distances are recomputed with :func:`haversine_distance`. Rows with
+    missing coordinates are left out of the index.
+    """
+
+    def __init__(self, lat, lon):
+        from scipy.spatial import cKDTree
+
+        lat = np.asarray(lat, dtype=float)
+        lon = np.asarray(lon, dtype=float)
+        self.positions = np.flatnonzero(~(np.isnan(lat) | np.isnan(lon)))
+        self.lat = lat[self.positions]
+        self.lon = lon[self.positions]
+        self.tree = cKDTree(_unit_vectors(self.lat, self.lon))
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def nearest(
+        self,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        max_distance_km: Optional[float] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Nearest reference point for each query point.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Reference row position (-1 if none within ``max_distance_km``
+            or coordinates missing) and distance in km (NaN if none)
+        """
+        lat = np.asarray(lat, dtype=float)
+        lon = np.asarray(lon, dtype=float)
+        right_pos = np.full(len(lat), -1, dtype=np.int64)
+        distance = np.full(len(lat), np.nan)
+
+        valid = np.flatnonzero(~(np.isnan(lat) | np.isnan(lon)))
+        if len(valid) == 0 or len(self) == 0:
+            return right_pos, distance
+
+        bound = np.inf if max_distance_km is None else _chord_length(max_distance_km)
+        _, hit = self.tree.query(_unit_vectors(lat[valid], lon[valid]), distance_upper_bound=bound)
+        found = hit < len(self)
+        valid, hit = valid[found], hit[found]
+
+        right_pos[valid] = self.positions[hit]
+        distance[valid] = haversine_distance(lat[valid], lon[valid], self.lat[hit], self.lon[hit])
+        return right_pos, distance
+
+    def within(
+        self,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        radius_km: float
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        All reference points within ``radius_km`` of each query point.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            Query position, reference row position and distance in km,
+            sorted by query position then distance
+        """
+        from scipy.spatial import cKDTree
+
+        lat = np.asarray(lat, dtype=float)
+        lon = np.asarray(lon, dtype=float)
+        valid = np.flatnonzero(~(np.isnan(lat) | np.isnan(lon)))
+        if len(valid) == 0 or len(self) == 0:
+            empty = np.array([], dtype=np.int64)
+            return empty, empty, np.array([])
+
+        query_tree = cKDTree(_unit_vectors(lat[valid], lon[valid]))
+        pairs = query_tree.sparse_distance_matrix(
+            self.tree, _chord_length(radius_km), output_type='ndarray'
+        )
+        left_pos = valid[pairs['i']]
+        hit = pairs['j']
+        distance = haversine_distance(lat[left_pos], lon[left_pos], self.lat[hit], self.lon[hit])
+
+        # The chord bound is exact up to rounding; trim on the haversine distance
+        keep = distance <= radius_km
+        left_pos, hit, distance = left_pos[keep], hit[keep], distance[keep]
+        order = np.lexsort((hit, distance, left_pos))
+        return left_pos[order], self.positions[hit[order]], distance[order]
+
+
+def spatial_match(
+    df_left: pd.DataFrame,
+    df_right: pd.DataFrame,
+    left_coords: tuple[str, str] = SPATIAL_COORDS,
+    right_coords: Optional[tuple[str, str]] = None,
+    method: str = 'nearest',
+    radius_km: Optional[float] = None,
+    batch_size: int = SPATIAL_BATCH_SIZE,
+    index: Optional[SpatialIndex] = None,
+    suffixes: tuple = ('', '_right')
+) -> tuple[pd.DataFrame, LinkageResult]:
+    """
+    Perform spatial matching on latitude/longitude columns.
+
+    Parameters
+    ----------
+    df_left : pd.DataFrame
+        Primary DataFrame
+    df_right : pd.DataFrame
+        Reference locations
+    left_coords : tuple
+        (latitude, longitude) columns in ``df_left``
+    right_coords : tuple, optional
+        (latitude, longitude) columns in ``df_right`` (default: ``left_coords``)
+    method : str
+        'nearest' links each left row to its closest reference point (within
+        ``radius_km`` if given); 'radius' links it to every reference point
+        within ``radius_km``, one output row per pair
+    radius_km : float, optional
+        Search radius in km (required for 'radius')
+    batch_size : int
+        Left points queried per batch
+    index : SpatialIndex, optional
+        Prebuilt index over ``df_right`` coordinates
+    suffixes : tuple
+        Suffixes for duplicate columns
+
+    Returns
+    -------
+    tuple[pd.DataFrame, LinkageResult]
+        Left rows with linked reference columns and ``match_distance_km``,
+        and the linkage result (counts are left rows with any match)
+    """
+    if method not in SPATIAL_METHODS:
+        raise ValueError(f"Unknown spatial method: {method}")
+    if method == 'radius' and radius_km is None:
+        raise ValueError("radius_km is required for method='radius'")
+
+    right_coords = right_coords or left_coords
+    if index is None:
+        index = SpatialIndex(df_right[right_coords[0]], df_right[right_coords[1]])
+
+    lat = df_left[left_coords[0]].to_numpy(dtype=float)
+    lon = df_left[left_coords[1]].to_numpy(dtype=float)
+    n_left = len(df_left)
+
+    if method == 'nearest':
+        right_pos = np.full(n_left, -1, dtype=np.int64)
+        distance = np.full(n_left, np.nan)
+        for start in range(0, n_left, batch_size):
+            batch = slice(start, start + batch_size)
+            right_pos[batch], distance[batch] = index.nearest(lat[batch], lon[batch], radius_km)
+
+        df_merged = _attach_rows(df_left, df_right, right_pos, suffixes)
+        df_merged['match_distance_km'] = distance
+        n_matched = int((right_pos >= 0).sum())
+    else:
+        pieces = []
+        for start in range(0, n_left, batch_size):
+            batch = slice(start, start + batch_size)
+            pos, hit, dist = index.within(lat[batch], lon[batch], radius_km)
+            pieces.append((pos + start, hit, dist))
+        left_pos, right_pos, distance = (np.concatenate(p) for p in zip(*pieces)) if pieces else (
+            np.array([], dtype=np.int64), np.array([], dtype=np.int64), np.array([])
+        )
+
+        # Keep unmatched left rows, as in a left join
+        matched = np.zeros(n_left, dtype=bool)
+        matched[left_pos] = True
+        unmatched = np.flatnonzero(~matched)
+        left_pos = np.concatenate([left_pos, unmatched])
+        right_pos = np.concatenate([right_pos, np.full(len(unmatched), -1, dtype=np.int64)])
+        distance = np.concatenate([distance, np.full(len(unmatched), np.nan)])
+        order = np.argsort(left_pos, kind='stable')
+        left_pos, right_pos, distance = left_pos[order], right_pos[order], distance[order]
+
+        df_merged = _attach_rows(
+            df_left.iloc[left_pos], df_right, right_pos, suffixes
+        )
+        df_merged['match_distance_km'] = distance
+        n_matched = int(matched.sum())
+
+    result = LinkageResult(
+        source_name=getattr(df_right, 'name', 'secondary'),
+        n_source=len(df_right),
+        n_matched=n_matched,
+        n_unmatched=n_left - n_matched,
+        match_type='spatial',
+        key_columns=list(left_coords)
+    )
+
+    return df_merged, result
+
+
+# ============================================================
+# PARALLEL MATCHING
+# ============================================================
+
+# Per-worker matching state, set once by _init_match_worker
+_WORKER_STATE: Optional[tuple] = None
+
+
+def _init_match_worker(left_values: np.ndarray, match_args: tuple):
+    """Store the left values and right-side index in a worker process."""
+    global _WORKER_STATE
+    _WORKER_STATE = (left_values, match_args)
+
+
+def _match_shard(bounds: tuple[int, int]) -> tuple[int, tuple, Optional[tuple]]:
+    """Match one contiguous shard of left values inside a worker."""
+    left_values, match_args = _WORKER_STATE
+    start, stop = bounds
+    result = _match_values(left_values[start:stop], *match_args)
+    cache = match_args[6]
+    return start, result, cache.drain() if cache is not None else None
+
+
+def _match_values_parallel(
+    left_values: np.ndarray,
+    match_args: tuple,
+    workers: int
+) -> tuple[np.ndarray, ...]:
+    """
+    Run :func:`_match_values` over shards of ``left_values`` in a process pool.
+
+    Workers receive the index once at start-up: under the 'fork' start
+    method they inherit it copy-on-write, otherwise it is pickled once per
+    worker rather than once per shard. Shards are written back by offset,
+    so the output does not depend on completion order. Workers score
+    against a read-only copy of the similarity cache and send their new
+    entries back to be merged here.
+    """
+    index, threshold, method, blocking, batch_size, top_k, cache, all_pairs = match_args
+    index.prepare(method, blocking)
+
+    n_left = len(left_values)
+    shards = [(start, min(start + batch_size, n_left)) for start in range(0, n_left, batch_size)]
+
+    best_idx = np.full(n_left, -1, dtype=np.int64)
+    best_score = np.zeros(n_left)
+    pairs = {}
+
+    methods = mp.get_all_start_methods()
+    ctx = mp.get_context('fork' if 'fork' in methods else 'spawn')
+    with ctx.Pool(
+        processes=workers,
+        initializer=_init_match_worker,
+        initargs=(left_values, match_args)
+    ) as pool:
+        for start, result, drained in pool.imap_unordered(_match_shard, shards):
+            if all_pairs:
+                owner, right_id, scores = result
+                pairs[start] = (owner + start, right_id, scores)
+            else:
+                shard_idx, shard_score = result
+                best_idx[start:start + len(shard_idx)] = shard_idx
+                best_score[start:start + len(shard_score)] = shard_score
+            if drained is not None:
+                cache.absorb(drained)
+
+    if all_pairs:
+        return _concat_pairs([pairs[start] for start in sorted(pairs)])
+    return best_idx, best_score
+
+
 # ============================================================
 # DIAGNOSTICS
 # ============================================================
@@ -381,6 +2649,12 @@ def generate_linkage_diagnostics(
     ensure_dir(output_dir)
     save_diagnostic(summary_df, 'linkage_summary')
 
+    # Per-source detail tables (e.g. Fellegi-Sunter weights)
+    for r in results:
+        if r.diagnostics is not None:
+            name = f'{Path(str(r.source_name)).stem}_{r.match_type}'
+            save_diagnostic(r.diagnostics, name, subdir='linkage')
+
     return summary_df
 
 
@@ -391,6 +2665,9 @@ def generate_linkage_diagnostics(
 def main(
     additional_sources: Optional[list[str]] = None,
     key_columns: Optional[list[str]] = None,
+    fuzzy_key_columns: Optional[tuple[str, str]] = None,
+    workers: int = 1,
+    streaming: bool = False,
     verbose: bool = True
 ):
     """
@@ -402,6 +2679,15 @@ def main(
         Additional parquet files to link
     key_columns : list, optional
         Columns to use for matching
+    fuzzy_key_columns : tuple, optional
+        (left, right) columns for fuzzy matching sources that share no key
+        column (default: FUZZY_KEY_COLUMNS)
+    workers : int
+        Worker processes for fuzzy matching; only used when a source is
+        fuzzy matched
+    streaming : bool
+        Join additional sources out-of-core (exact matches only). Has no
+        effect without ``additional_sources``; a warning is printed.
     verbose : bool
         Print detailed output
     """
@@ -416,8 +2702,13 @@ def main(
     output_path = work_dir / OUTPUT_FILE
 
     key_columns = key_columns or DEFAULT_KEY_COLUMNS
+    fuzzy_key_columns = fuzzy_key_columns or FUZZY_KEY_COLUMNS
     linkage_results = []
 
+    if workers > 1 and not (additional_sources and fuzzy_key_columns):
+        print(f"  Warning: --workers {workers} has no effect without sources to fuzzy match "
+              "(pass --sources and --fuzzy-key)")
+
     # Load primary data
     print(f"\n  Loading primary data: {INPUT_FILE}")
     if not input_path.exists():
@@ -425,6 +2716,14 @@ def main(
         print("  Run 'ingest_data' stage first.")
         sys.exit(1)
 
+    if streaming and not additional_sources:
+        print("  Warning: --streaming needs sources to join (pass --sources); "
+              "running the in-memory pass-through instead")
+    elif streaming:
+        return _main_streaming(
+            input_path, output_path, additional_sources, key_columns, diag_dir
+        )
+
     df = load_data(input_path)
     print(f"    -> {len(df):,} rows, {len(df.columns)} columns")
 
@@ -444,6 +2743,22 @@ def main(
                     df, result = exact_match(df, df_source, on=common_cols)
                     linkage_results.append(result)
                     print(f"    Match rate: {result.match_rate:.1%}")
+                elif (
+                    fuzzy_key_columns
+                    and fuzzy_key_columns[0] in df.columns
+                    and fuzzy_key_columns[1] in df_source.columns
+                ):
+                    left_on, right_on = fuzzy_key_columns
+                    print(f"    Fuzzy matching {left_on} -> {right_on} ({workers} worker(s))")
+                    df, result = fuzzy_match(
+                        df, df_source, left_on, right_on,
+                        threshold=FUZZY_THRESHOLD,
+                        persist_index=True,
+                        workers=workers,
+                        persist_cache=True
+                    )
+                    linkage_results.append(result)
+                    print(f"    Match rate: {result.match_rate:.1%}")
                 else:
                     print(f"    Warning: No common key columns found")
             else:
@@ -503,5 +2818,60 @@ def main(
     return df
 
 
+def _main_streaming(
+    input_path: Path,
+    output_path: Path,
+    additional_sources: list[str],
+    key_columns: list[str],
+    diag_dir: Path
+) -> None:
+    """Chain out-of-core exact joins from ``input_path`` into ``output_path``."""
+    import pyarrow.parquet as pq
+
+    work_dir = input_path.parent
+    linkage_results = []
+    current = input_path
+
+    with tempfile.TemporaryDirectory(prefix='linkage_stream_', dir=work_dir) as tmp:
+        for i, source in enumerate(additional_sources):
+            source_path = work_dir / source
+            if not source_path.exists():
+                print(f"  Warning: Source not found: {source_path}")
+                continue
+
+            source_cols = pq.read_schema(source_path).names
+            current_cols = pq.read_schema(current).names
+            common_cols = [c for c in key_columns if c in source_cols and c in current_cols]
+            if not common_cols:
+                print(f"  Warning: No common key columns for streaming join: {source}")
+                continue
+
+            print(f"\n  Streaming join: {source} on {', '.join(common_cols)}")
+            target = Path(tmp) / f'linked_{i}.parquet'
+            result = streaming_exact_match(current, source_path, common_cols, target)
+            linkage_results.append(result)
+            print(f"    Match rate: {result.match_rate:.1%}")
+            current = target
+
+        if current == input_path:
+            print("\n  No sources linked; output not written.")
+            return None
+        Path(current).replace(output_path)
+
+    print("\n  Generating linkage diagnostics...")
+    generate_linkage_diagnostics(linkage_results, diag_dir)
+
+    metadata = pq.ParquetFile(output_path).metadata
+    print(f"\n  Saved to: {output_path}")
+    print(f"  Final dataset: {metadata.num_rows:,} rows, {metadata.num_columns} columns, "
+          f"{metadata.num_row_groups} row groups")
+
+    print("\n" + "=" * 60)
+    print("Stage 01 complete.")
+    print("=" * 60)
+
+    return None
+
+
 if __name__ == '__main__':
     main()
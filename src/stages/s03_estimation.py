@@ -6,8 +6,10 @@ Purpose: Run primary estimation specifications.
 
 This stage handles:
 - Specification registry management
-- Fixed effects estimation
-- Standard error clustering
+- Fixed effects estimation (multi-way absorption by alternating projections)
+- Standard error clustering (one-way and multi-way) and wild cluster bootstrap
+- Event-study estimation (binned leads and lags)
+- Staggered-adoption group-time ATTs (Callaway-Sant'Anna)
 - Results formatting and export
 
 Input Files
@@ -18,18 +20,34 @@ Output Files
 ------------
 - data_work/diagnostics/estimation_results.csv
 - data_work/diagnostics/coefficients.csv
+- data_work/diagnostics/event_study.csv
+- data_work/diagnostics/group_time_att.csv
+- data_work/diagnostics/group_time_att_event.csv
+- data_work/fe_cache/*.npy (with --fe-cache: demeaned columns reused across runs)
 
 Usage
 -----
     python src/pipeline.py run_estimation --specification baseline
     python src/pipeline.py run_estimation -s robust --sample subset
+    python src/pipeline.py run_estimation --streaming
+    python src/pipeline.py run_estimation --all
+    python src/pipeline.py run_estimation --all --streaming --jobs 4
+    python src/pipeline.py run_estimation --all --fe-cache
+    python src/pipeline.py run_estimation --bootstrap webb --n-boot 9999 --seed 1
 """
 from __future__ import annotations
 
 from pathlib import Path
 from typing import Optional, Union, Literal
 from dataclasses import dataclass, field
+from itertools import combinations
+import hashlib
+import multiprocessing as mp
+import os
 import sys
+import tempfile
+import time
+import warnings
 
 # Add parent directory for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -42,11 +60,15 @@ from utils.helpers import (
     load_data,
     save_data,
     save_diagnostic,
+    share_columns,
+    load_shared_columns,
     ensure_dir,
     format_coefficient,
     format_pvalue,
     add_significance_stars,
 )
+from utils.solvers import least_squares, solve_normal_equations, CrossProducts
+from utils.inference import two_sided_pvalue, critical_value
 
 
 # ============================================================
@@ -63,6 +85,35 @@ TREATMENT_VAR = 'treatment'
 UNIT_FE = 'unit_fe'
 TIME_FE = 'time_fe'
 
+# Fixed effects absorption
+FE_TOLERANCE = 1e-8   # Max change per sweep, relative to each column's scale
+FE_MAX_ITER = 1_000   # Alternating-projection iterations before giving up
+FE_CACHE_SUBDIR = 'fe_cache'
+FE_CACHE_VERSION = 1
+FE_CACHE_MAX_BYTES = 2 * 2**30   # Spilled entries beyond this are evicted, least recently used first
+
+# Event study
+EVENT_TIME_VAR = 'event_time'
+EVENT_REFERENCE = -1                  # Omitted relative period
+EVENT_WINDOW = (-12, 12)              # Relative periods outside are binned into the endpoints
+EVENT_BLOCK_BYTES = 256 * 2**20       # Dense working memory per block of indicator columns
+
+# Staggered adoption (group-time ATTs)
+COHORT_VAR = 'treatment_period'       # First treated period; missing for never-treated
+CONTROL_GROUPS = ('never_treated', 'not_yet_treated')
+BASE_PERIODS = ('varying', 'universal')
+
+# Wild cluster bootstrap
+BOOTSTRAP_REPS = 9_999
+BOOTSTRAP_WEIGHTS = {
+    'rademacher': np.array([-1.0, 1.0]),
+    'webb': np.array([-np.sqrt(1.5), -1.0, -np.sqrt(0.5), np.sqrt(0.5), 1.0, np.sqrt(1.5)]),
+}
+BOOTSTRAP_BATCH_BYTES = 64 * 2**20    # Working memory per batch of replications
+
+# Streaming (out-of-core) estimation
+STREAM_BATCH_SIZE = 500_000   # Rows per batch read from panel.parquet
+
 
 # ============================================================
 # SPECIFICATION REGISTRY
@@ -101,6 +152,14 @@ SPECIFICATIONS = {
         'cluster': 'id',
         'description': 'Unit fixed effects only'
     },
+    'twoway_cluster': {
+        'name': 'Two-Way Clustered',
+        'formula': f'{OUTCOME_VAR} ~ {TREATMENT_VAR}',
+        'controls': [],
+        'fe': [UNIT_FE, TIME_FE],
+        'cluster': ['id', 'period'],
+        'description': 'Baseline with SEs clustered by unit and period'
+    },
 }
 
 
@@ -124,7 +183,10 @@ class EstimationResult:
     r_squared: float
     controls: list = field(default_factory=list)
     fe: list = field(default_factory=list)
-    cluster: Optional[str] = None
+    cluster: Optional[Union[str, list[str]]] = None
+    elapsed_seconds: Optional[float] = None
+    bootstrap_p_value: Optional[float] = None
+    bootstrap_weights: Optional[str] = None
 
     @property
     def significant_05(self) -> bool:
@@ -157,12 +219,488 @@ class EstimationResult:
             'r_squared': self.r_squared,
             'controls': ','.join(self.controls),
             'fe': ','.join(self.fe),
-            'cluster': self.cluster or 'none',
+            'cluster': ','.join(_as_list(self.cluster)) or 'none',
             'significant_05': self.significant_05,
-            'significant_01': self.significant_01
+            'significant_01': self.significant_01,
+            'elapsed_seconds': self.elapsed_seconds,
+            'bootstrap_p_value': self.bootstrap_p_value,
+            'bootstrap_weights': self.bootstrap_weights
         }
 
 
+# ============================================================
+# FIXED EFFECTS ABSORPTION
+# ============================================================
+
+@dataclass
+class AbsorbedFE:
+    """Variables with fixed effects partialled out."""
+    values: np.ndarray
+    n_iter: int
+    converged: bool
+
+
+def encode_fe(df: pd.DataFrame, fe_vars: list[str]) -> list[np.ndarray]:
+    """Integer codes (0..G-1) for each fixed effect column."""
+    return [pd.factorize(df[fe], sort=False)[0] for fe in fe_vars]
+
+
+def absorb_fe(
+    values: np.ndarray,
+    fe_codes: list[np.ndarray],
+    tol: float = FE_TOLERANCE,
+    max_iter: int = FE_MAX_ITER,
+    accelerate: bool = True
+) -> AbsorbedFE:
+    """
+    Partial multi-way fixed effects out of variables by alternating projections.
+
+    Each sweep subtracts group means for every fixed effect in turn, using
+    ``np.bincount`` group sums over integer codes, for all variables at
+    once. Sweeps repeat until no variable changes by more than ``tol``
+    times its scale; a variable that has converged is not swept again.
+    The first two iterations are plain in-place sweeps, which settle
+    balanced panels; with ``accelerate``, later iterations take two
+    sweeps and extrapolate along them (Irons-Tuck), which cuts iterations
+    sharply on unbalanced panels. A single fixed effect is absorbed
+    exactly in one sweep.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        (n,) or (n, k) variables to demean
+    fe_codes : list[np.ndarray]
+        Integer codes per fixed effect, e.g. from :func:`encode_fe`
+    tol : float
+        Convergence tolerance
+    max_iter : int
+        Maximum iterations
+    accelerate : bool
+        Use Irons-Tuck acceleration
+
+    Returns
+    -------
+    AbsorbedFE
+        Demeaned values (same shape as ``values``), iterations and
+        convergence flag
+    """
+    values = np.asarray(values, dtype=float)
+    x = np.array(values.reshape(len(values), -1), dtype=float, order='F')
+    groups = [(codes, np.bincount(codes)) for codes in fe_codes]
+
+    if not groups:
+        return AbsorbedFE(x.reshape(values.shape), 0, True)
+    if len(groups) == 1:
+        _sweep(x, groups)
+        return AbsorbedFE(x.reshape(values.shape), 1, True)
+
+    scale = np.maximum(np.abs(x).max(axis=0, initial=0.0), 1.0)
+    active = np.arange(x.shape[1])
+    n_iter = 0
+
+    while len(active) and n_iter < max_iter:
+        n_iter += 1
+        full = len(active) == x.shape[1]
+        xa = x if full else np.asfortranarray(x[:, active])
+
+        if accelerate and n_iter > 2:
+            x0 = xa.copy(order='F')
+            x1 = _sweep(xa, groups)[0].copy(order='F')
+            change = _sweep(xa, groups)[1]
+            step = xa - x1
+            curvature = step - (x1 - x0)
+            denom = (curvature ** 2).sum(axis=0)
+            nu = np.divide(
+                (step * curvature).sum(axis=0), denom,
+                out=np.zeros(len(active)), where=denom > 0
+            )
+            xa -= nu * step
+        else:
+            # Plain sweeps first: balanced panels are exact after one,
+            # which the second confirms
+            change = _sweep(xa, groups)[1]
+
+        if not full:
+            x[:, active] = xa
+
+        done = change <= tol * scale[active]
+        active = active[~done]
+
+    converged = len(active) == 0
+    if not converged:
+        warnings.warn(
+            f"Fixed effects absorption did not converge in {max_iter} iterations",
+            RuntimeWarning
+        )
+
+    return AbsorbedFE(x.reshape(values.shape), n_iter, converged)
+
+
+def _sweep(
+    x: np.ndarray,
+    groups: list[tuple[np.ndarray, np.ndarray]]
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Subtract group means for each fixed effect in turn (in place).
+
+    Also returns, per column, the sum over fixed effects of the largest
+    group mean removed, which bounds how much any value changed.
+    """
+    change = np.zeros(x.shape[1])
+    for codes, counts in groups:
+        for j in range(x.shape[1]):
+            means = np.bincount(codes, weights=x[:, j], minlength=len(counts)) / counts
+            x[:, j] -= means[codes]
+            change[j] += np.abs(means).max(initial=0.0)
+    return x, change
+
+
+def _array_digest(*arrays) -> str:
+    """Content hash of one or more arrays (values and order)."""
+    h = hashlib.blake2b(digest_size=16)
+    for arr in arrays:
+        h.update(pd.util.hash_array(np.asarray(arr)).tobytes())
+    return h.hexdigest()
+
+
+class FECache:
+    """
+    Demeaned columns keyed by (fixed effects, sample, column).
+
+    The sample is identified by a hash of the selected rows and their
+    fixed effect values, and each column by a hash of its values, so an
+    entry is only reused when absorbing it again would give the same
+    result. Entries live in memory and, when ``path`` is set, are also
+    spilled to ``<path>/<key>.npy`` and memory-mapped back on later runs.
+    Spilled files are kept under ``max_bytes`` by deleting the least
+    recently used ones (by modification time, refreshed on every hit).
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_bytes: int = FE_CACHE_MAX_BYTES
+    ):
+        self.path = Path(path) if path else None
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def sample_key(df: pd.DataFrame, fe_vars: list[str]) -> str:
+        """Hash of the sample rows (index) and their fixed effect values."""
+        return _array_digest(df.index.to_numpy(), *(df[fe].to_numpy() for fe in fe_vars))
+
+    @staticmethod
+    def key(fe_vars: list[str], sample_key: str, column: str, values: np.ndarray) -> str:
+        """Entry key for a column's values absorbed on a sample."""
+        token = f"{FE_CACHE_VERSION}|{','.join(fe_vars)}|{sample_key}|{column}|{_array_digest(values)}"
+        return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Cached demeaned values, or None."""
+        values = self._entries.get(key)
+        if self.path is not None:
+            file = self.path / f'{key}.npy'
+            try:
+                if values is None:
+                    values = np.load(file, mmap_mode='r')
+                    self._entries[key] = values
+                os.utime(file)  # Mark as recently used for eviction
+            except FileNotFoundError:
+                pass
+
+        if values is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return values
+
+    def put(self, key: str, values: np.ndarray):
+        """Store demeaned values (and spill them to disk when persistent)."""
+        values = np.ascontiguousarray(values, dtype=float)
+        self._entries[key] = values
+
+        if self.path is not None:
+            ensure_dir(self.path)
+            # Write then rename so concurrent readers never see a partial file
+            tmp = self.path / f'{key}.{os.getpid()}.tmp.npy'
+            np.save(tmp, values)
+            os.replace(tmp, self.path / f'{key}.npy')
+            self._evict()
+
+    def _evict(self):
+        """Delete the least recently used spilled files beyond ``max_bytes``."""
+        files = []
+        for file in self.path.glob('*.npy'):
+            try:
+                stat = file.stat()
+            except FileNotFoundError:  # Removed by a concurrent process
+                continue
+            files.append((stat.st_mtime, stat.st_size, file))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, file in sorted(files, key=lambda f: f[0]):
+            if total <= self.max_bytes:
+                break
+            file.unlink(missing_ok=True)
+            total -= size
+
+
+def load_fe_cache(
+    cache_dir: Optional[Path] = None,
+    max_bytes: int = FE_CACHE_MAX_BYTES
+) -> FECache:
+    """
+    Fixed effects cache, persistent when ``cache_dir`` is given.
+
+    ``main`` uses data_work/fe_cache/ when run with ``--fe-cache``; with
+    ``cache_dir=None`` entries are kept in memory only and nothing is
+    written. Entries are content-addressed, so the directory can be
+    deleted at any time to reclaim space.
+    """
+    return FECache(cache_dir, max_bytes)
+
+
+# ============================================================
+# CLUSTER-ROBUST VARIANCE
+# ============================================================
+
+def _as_list(value: Optional[Union[str, list[str]]]) -> list[str]:
+    """Normalize an optional column name or list of names to a list."""
+    if value is None:
+        return []
+    return [value] if isinstance(value, str) else list(value)
+
+
+def cluster_score_sums(scores: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """
+    Sum score rows within clusters.
+
+    Rows are sorted by cluster code once and summed over contiguous runs
+    with ``np.add.reduceat``, so the cost is O(n log n) regardless of the
+    number of clusters.
+
+    Parameters
+    ----------
+    scores : np.ndarray
+        (n, k) per-observation scores (regressors times residuals)
+    codes : np.ndarray
+        Cluster identifiers for each row
+
+    Returns
+    -------
+    np.ndarray
+        (G, k) per-cluster score sums, one row per distinct cluster
+    """
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    return np.add.reduceat(scores[order], starts, axis=0)
+
+
+def _intersect_codes(codes: list[np.ndarray]) -> np.ndarray:
+    """Integer codes for the intersection of several clusterings."""
+    combined = codes[0]
+    for other in codes[1:]:
+        combined = combined * np.int64(other.max() + 1) + other
+        combined = pd.factorize(combined)[0].astype(np.int64)
+    return combined
+
+
+def cluster_vcov(
+    X: np.ndarray,
+    residuals: np.ndarray,
+    XtX_inv: np.ndarray,
+    clusters: list[np.ndarray]
+) -> np.ndarray:
+    """
+    Cluster-robust variance matrix, one-way or multi-way.
+
+    With several clustering dimensions the variance is the
+    Cameron-Gelbach-Miller inclusion-exclusion sum over every
+    combination of dimensions (clustered on their intersection), each
+    with its own G/(G-1) correction. Negative eigenvalues, which the
+    sum can produce in small samples, are set to zero.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        (n, k) design matrix
+    residuals : np.ndarray
+        (n,) OLS residuals
+    XtX_inv : np.ndarray
+        (k, k) inverse of X'X
+    clusters : list[np.ndarray]
+        Cluster identifiers per dimension
+
+    Returns
+    -------
+    np.ndarray
+        (k, k) variance matrix
+    """
+    n, k = X.shape
+    codes = [pd.factorize(c)[0].astype(np.int64) for c in clusters]
+    scores = X * residuals[:, None]
+
+    score_sums = {
+        dims: cluster_score_sums(scores, _intersect_codes([codes[d] for d in dims]))
+        for dims in _cluster_combinations(len(codes))
+    }
+    V = _cluster_sandwich(XtX_inv, score_sums, n, k)
+    return _clip_psd(V) if len(codes) > 1 else V
+
+
+def _cluster_combinations(n_dims: int) -> list[tuple[int, ...]]:
+    """Every non-empty combination of clustering dimensions."""
+    return [
+        dims
+        for size in range(1, n_dims + 1)
+        for dims in combinations(range(n_dims), size)
+    ]
+
+
+def _cluster_sandwich(
+    XtX_inv: np.ndarray,
+    score_sums: dict[tuple[int, ...], np.ndarray],
+    n: int,
+    k: int
+) -> np.ndarray:
+    """Sandwich variance from per-cluster score sums for each combination."""
+    meat = np.zeros((len(XtX_inv),) * 2)
+    for dims, sums in score_sums.items():
+        sign = 1.0 if len(dims) % 2 else -1.0
+        n_clusters = len(sums)
+        correction = (n_clusters / (n_clusters - 1)) * ((n - 1) / (n - k))
+        meat += sign * correction * (sums.T @ sums)
+
+    return XtX_inv @ meat @ XtX_inv
+
+
+def _clip_psd(V: np.ndarray) -> np.ndarray:
+    """Set negative eigenvalues of a variance matrix to zero."""
+    eigval, eigvec = np.linalg.eigh(V)
+    if eigval.min() < 0:
+        V = (eigvec * np.maximum(eigval, 0.0)) @ eigvec.T
+    return V
+
+
+# ============================================================
+# WILD CLUSTER BOOTSTRAP
+# ============================================================
+
+def wild_cluster_bootstrap(
+    df: pd.DataFrame,
+    y_var: str,
+    x_vars: list[str],
+    cluster_var: str,
+    weights: str = 'rademacher',
+    n_boot: int = BOOTSTRAP_REPS,
+    seed: Optional[int] = None
+) -> dict:
+    """
+    Wild cluster restricted (WCR) bootstrap test of the first regressor.
+
+    Bootstrap samples are y* = X b_r + u_r * v_g, where b_r and u_r come
+    from the regression with the null (coefficient zero) imposed and v_g
+    is one weight per cluster. Every replication is linear in v, so the
+    rows are visited once to form per-cluster scores X_g'u_r and
+    X_g'X_g a (a = (X'X)^{-1} e_1); each replication's coefficient and
+    CRV1 standard error then cost O(G k), and replications are
+    evaluated in batches as matrix products.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Data (already demeaned when fixed effects are absorbed)
+    y_var : str
+        Outcome variable
+    x_vars : list
+        Regressors; the first is tested
+    cluster_var : str
+        Cluster variable (one-way)
+    weights : str
+        'rademacher' or 'webb' (six-point, better with very few clusters)
+    n_boot : int
+        Replications
+    seed : int, optional
+        Random seed
+
+    Returns
+    -------
+    dict
+        Observed t-statistic, symmetric bootstrap p-value, replications,
+        clusters and weight type
+    """
+    if weights not in BOOTSTRAP_WEIGHTS:
+        raise ValueError(f"Unknown bootstrap weights: {weights}")
+    cluster_vars = _as_list(cluster_var)
+    if not cluster_vars:
+        raise ValueError("Wild cluster bootstrap requires a cluster variable")
+    if len(cluster_vars) > 1:
+        raise ValueError("Wild cluster bootstrap requires one-way clustering")
+
+    all_vars = list(dict.fromkeys([y_var] + x_vars + cluster_vars))
+    df_clean = df[all_vars].dropna()
+    n = len(df_clean)
+    y = df_clean[y_var].to_numpy(dtype=float)
+    X = np.column_stack([np.ones(n)] + [df_clean[x].to_numpy(dtype=float) for x in x_vars])
+    codes = pd.factorize(df_clean[cluster_vars[0]])[0].astype(np.int64)
+
+    fit = least_squares(X, y)
+    if not fit.keep[1]:
+        raise ValueError(f"{x_vars[0]} is collinear with the other regressors")
+    X = X[:, fit.keep]
+    n, k = X.shape
+    j = 1                                   # Tested column among kept ones
+
+    # Restricted fit: drop the tested column
+    restricted = least_squares(np.delete(X, j, axis=1), y)
+
+    # Per-cluster pieces in one pass: X_g'u_r, X_g'X_g a and the observed scores
+    a = fit.XtX_inv[:, j]
+    Xa = X @ a
+    sums = cluster_score_sums(
+        np.column_stack([X * restricted.residuals[:, None], X * Xa[:, None], Xa * fit.residuals]),
+        codes
+    )
+    S, D, observed_scores = sums[:, :k], sums[:, k:2 * k], sums[:, -1]
+    G = len(S)
+    if G < 2:
+        raise ValueError("Wild cluster bootstrap needs at least two clusters")
+
+    c = S @ a                                # Bootstrap coefficient is c'v
+    P = S @ fit.XtX_inv                      # X'X^{-1} S' v = P'v
+    correction = G / (G - 1) * (n - 1) / (n - k)
+
+    # Observed statistic with the same CRV1 formula
+    t_obs = fit.beta[fit.keep][j] / np.sqrt(correction * observed_scores @ observed_scores)
+
+    rng = np.random.default_rng(seed)
+    points = BOOTSTRAP_WEIGHTS[weights]
+    batch = max(1, BOOTSTRAP_BATCH_BYTES // (8 * 3 * G))
+    exceed = 0
+    for start in range(0, n_boot, batch):
+        v = points[rng.integers(0, len(points), size=(G, min(batch, n_boot - start)))]
+        coef = c @ v
+        # Cluster scores of the bootstrap residuals: v_g c_g - d_g' (X'X)^{-1} S' v
+        scores = c[:, None] * v - D @ (P.T @ v)
+        t_boot = coef / np.sqrt(correction * (scores ** 2).sum(axis=0))
+        exceed += int((np.abs(t_boot) >= abs(t_obs)).sum())
+
+    return {
+        't_stat': float(t_obs),
+        'p_value': exceed / n_boot,
+        'n_boot': n_boot,
+        'n_clusters': G,
+        'weights': weights
+    }
+
+
 # ============================================================
 # ESTIMATION FUNCTIONS
 # ============================================================
@@ -171,7 +709,7 @@ def run_ols(
     df: pd.DataFrame,
     y_var: str,
     x_vars: list[str],
-    cluster_var: Optional[str] = None
+    cluster_var: Optional[Union[str, list[str]]] = None
 ) -> dict:
     """
     Run OLS regression.
@@ -184,8 +722,9 @@ def run_ols(
         Outcome variable
     x_vars : list
         Regressor variables
-    cluster_var : str, optional
-        Variable for clustered standard errors
+    cluster_var : str or list, optional
+        Variable(s) for clustered standard errors; several variables
+        give multi-way clustering
 
     Returns
     -------
@@ -193,9 +732,8 @@ def run_ols(
         Regression results
     """
     # Drop missing values
-    all_vars = [y_var] + x_vars
-    if cluster_var:
-        all_vars.append(cluster_var)
+    cluster_vars = _as_list(cluster_var)
+    all_vars = list(dict.fromkeys([y_var] + x_vars + cluster_vars))
     df_clean = df[all_vars].dropna()
 
     n = len(df_clean)
@@ -206,36 +744,28 @@ def run_ols(
     y = df_clean[y_var].values
     X = np.column_stack([np.ones(n)] + [df_clean[x].values for x in x_vars])
 
-    # OLS estimation
-    XtX = X.T @ X
-    XtX_inv = np.linalg.inv(XtX)
-    beta = XtX_inv @ X.T @ y
-
-    # Residuals and R-squared
-    y_hat = X @ beta
-    residuals = y - y_hat
-    ss_res = np.sum(residuals ** 2)
+    # OLS estimation (collinear regressors are dropped)
+    fit = least_squares(X, y)
+    if not fit.keep[1]:
+        raise ValueError(f"{x_vars[0]} is collinear with the other regressors")
+    if fit.dropped:
+        names = ['const'] + x_vars
+        warnings.warn(f"Dropped collinear regressors: {[names[j] for j in fit.dropped]}")
+        X = X[:, fit.keep]
+    beta = fit.beta[fit.keep]
+    XtX_inv = fit.XtX_inv
+    residuals = fit.residuals
+
+    # R-squared
+    ss_res = fit.ssr
     ss_tot = np.sum((y - y.mean()) ** 2)
     r_squared = 1 - ss_res / ss_tot
 
     # Standard errors
-    if cluster_var:
-        # Clustered standard errors
-        clusters = df_clean[cluster_var].values
-        unique_clusters = np.unique(clusters)
-        n_clusters = len(unique_clusters)
-
-        # Cluster-robust variance
-        meat = np.zeros((X.shape[1], X.shape[1]))
-        for c in unique_clusters:
-            mask = clusters == c
-            u_c = residuals[mask]
-            X_c = X[mask]
-            meat += (X_c.T * u_c) @ (X_c.T * u_c).T
-
-        # Small sample correction
-        correction = (n_clusters / (n_clusters - 1)) * ((n - 1) / (n - X.shape[1]))
-        V = correction * XtX_inv @ meat @ XtX_inv
+    if cluster_vars:
+        # Clustered standard errors from per-cluster score sums
+        clusters = [df_clean[c].values for c in cluster_vars]
+        V = cluster_vcov(X, residuals, XtX_inv, clusters)
         se = np.sqrt(np.diag(V))
     else:
         # Homoskedastic standard errors
@@ -244,13 +774,16 @@ def run_ols(
         se = np.sqrt(np.diag(V))
 
     # Treatment coefficient (first regressor after constant)
-    coef = beta[1]
-    se_coef = se[1]
+    return _coefficient_summary(beta[1], se[1], n, X.shape[1], r_squared)
+
+
+def _coefficient_summary(coef: float, se_coef: float, n: int, k: int, r_squared: float) -> dict:
+    """t-statistic, p-value and 95% CI for one coefficient."""
     t_stat = coef / se_coef
-    p_value = 2 * (1 - _t_cdf(abs(t_stat), n - X.shape[1]))
+    p_value = two_sided_pvalue(t_stat, n - k)
 
     # Confidence interval
-    t_crit = _t_ppf(0.975, n - X.shape[1])
+    t_crit = critical_value(0.05, n - k)
     ci_lower = coef - t_crit * se_coef
     ci_upper = coef + t_crit * se_coef
 
@@ -266,42 +799,24 @@ def run_ols(
     }
 
 
-def _t_cdf(x: float, df: int) -> float:
-    """Approximate t-distribution CDF."""
-    # Use normal approximation for large df
-    if df > 100:
-        from math import erf, sqrt
-        return 0.5 * (1 + erf(x / sqrt(2)))
-
-    # Simple approximation
-    t = x / np.sqrt(df)
-    return 0.5 + 0.5 * np.sign(t) * (1 - (1 + t**2/df)**(-df/2))
-
-
-def _t_ppf(p: float, df: int) -> float:
-    """Approximate t-distribution PPF (inverse CDF)."""
-    if df > 100:
-        # Normal approximation
-        from math import sqrt
-        # Approximate normal PPF
-        a = 8 * (np.pi - 3) / (3 * np.pi * (4 - np.pi))
-        x = 2 * p - 1
-        inner = (2 / (np.pi * a) + np.log(1 - x**2) / 2)
-        return np.sign(x) * sqrt(sqrt(inner**2 - np.log(1 - x**2) / a) - inner)
-
-    # For small df, use approximation
-    return 1.96 * (1 + 0.5 / df)
-
-
 def demean_by_fe(
     df: pd.DataFrame,
     y_var: str,
     x_vars: list[str],
-    fe_vars: list[str]
+    fe_vars: list[str],
+    tol: float = FE_TOLERANCE,
+    max_iter: int = FE_MAX_ITER,
+    accelerate: bool = True,
+    cache: Optional[FECache] = None
 ) -> pd.DataFrame:
     """
     Demean variables by fixed effects (within transformation).
 
+    Multiple fixed effects are absorbed jointly with :func:`absorb_fe`,
+    iterating to ``tol``; other columns are passed through unchanged.
+    With a ``cache``, columns already absorbed on the same sample and
+    fixed effects are reused and only the rest are absorbed.
+
     Parameters
     ----------
     df : pd.DataFrame
@@ -312,27 +827,61 @@ def demean_by_fe(
         Regressor variables
     fe_vars : list
         Fixed effect variables
+    tol : float
+        Convergence tolerance for multi-way absorption
+    max_iter : int
+        Maximum alternating-projection iterations
+    accelerate : bool
+        Use Irons-Tuck acceleration
+    cache : FECache, optional
+        Cache of demeaned columns
 
     Returns
     -------
     pd.DataFrame
         Demeaned data
     """
-    df_demeaned = df.copy()
-    vars_to_demean = [y_var] + x_vars
+    vars_to_demean = list(dict.fromkeys(v for v in [y_var] + x_vars if v in df.columns))
+    demeaned = {}
+    keys = {}
 
-    for fe in fe_vars:
+    if cache is not None:
+        sample_key = FECache.sample_key(df, fe_vars)
         for var in vars_to_demean:
-            if var in df_demeaned.columns:
-                group_mean = df_demeaned.groupby(fe)[var].transform('mean')
-                df_demeaned[var] = df_demeaned[var] - group_mean
+            keys[var] = FECache.key(fe_vars, sample_key, var, df[var].to_numpy())
+            cached = cache.get(keys[var])
+            if cached is not None:
+                demeaned[var] = cached
+
+    to_absorb = [v for v in vars_to_demean if v not in demeaned]
+    if to_absorb:
+        absorbed = absorb_fe(
+            df[to_absorb].to_numpy(dtype=float),
+            encode_fe(df, fe_vars),
+            tol=tol,
+            max_iter=max_iter,
+            accelerate=accelerate
+        )
+        for j, var in enumerate(to_absorb):
+            demeaned[var] = absorbed.values[:, j]
+            if cache is not None and absorbed.converged:
+                cache.put(keys[var], demeaned[var])
+
+    # Shallow copy: only the demeaned columns are replaced
+    df_demeaned = df.copy(deep=False)
+    for var in vars_to_demean:
+        df_demeaned[var] = np.asarray(demeaned[var])
 
     return df_demeaned
 
 
 def run_fe_estimation(
     df: pd.DataFrame,
-    spec_name: str
+    spec_name: str,
+    fe_cache: Optional[FECache] = None,
+    bootstrap: Optional[str] = None,
+    n_boot: int = BOOTSTRAP_REPS,
+    seed: Optional[int] = None
 ) -> EstimationResult:
     """
     Run fixed effects estimation for a specification.
@@ -343,6 +892,16 @@ def run_fe_estimation(
         Panel data
     spec_name : str
         Specification name from SPECIFICATIONS
+    fe_cache : FECache, optional
+        Cache of demeaned columns shared across specifications
+    bootstrap : str, optional
+        Wild cluster bootstrap weights ('rademacher' or 'webb') for a
+        bootstrap p-value of the treatment coefficient; skipped with a
+        warning unless the specification clusters on one variable
+    n_boot : int
+        Bootstrap replications
+    seed : int, optional
+        Seed for the bootstrap weights
 
     Returns
     -------
@@ -351,19 +910,20 @@ def run_fe_estimation(
     """
     if spec_name not in SPECIFICATIONS:
         raise ValueError(f"Unknown specification: {spec_name}")
+    if bootstrap is not None and bootstrap not in BOOTSTRAP_WEIGHTS:
+        raise ValueError(f"Unknown bootstrap weights: {bootstrap}")
 
     spec = SPECIFICATIONS[spec_name]
     x_vars = [TREATMENT_VAR] + spec['controls']
 
-    # Filter to valid observations
-    all_vars = [OUTCOME_VAR] + x_vars + spec['fe']
-    if spec['cluster']:
-        all_vars.append(spec['cluster'])
-    df_valid = df[df[all_vars].notna().all(axis=1)].copy()
+    # Filter to valid observations, keeping only the columns needed
+    all_vars = [OUTCOME_VAR] + x_vars + spec['fe'] + _as_list(spec['cluster'])
+    keep_cols = list(dict.fromkeys(all_vars + [c for c in ('id', 'period') if c in df.columns]))
+    df_valid = df.loc[df[all_vars].notna().all(axis=1), keep_cols]
 
     # Demean by fixed effects
     if spec['fe']:
-        df_est = demean_by_fe(df_valid, OUTCOME_VAR, x_vars, spec['fe'])
+        df_est = demean_by_fe(df_valid, OUTCOME_VAR, x_vars, spec['fe'], cache=fe_cache)
     else:
         df_est = df_valid
 
@@ -375,6 +935,20 @@ def run_fe_estimation(
         cluster_var=spec['cluster']
     )
 
+    # The WCR bootstrap needs one-way clustering; other specifications
+    # keep their analytic inference
+    boot = None
+    if bootstrap is not None and len(_as_list(spec['cluster'])) == 1:
+        boot = wild_cluster_bootstrap(
+            df_est, OUTCOME_VAR, x_vars, spec['cluster'],
+            weights=bootstrap, n_boot=n_boot, seed=seed
+        )
+    elif bootstrap is not None:
+        warnings.warn(
+            f"Wild cluster bootstrap skipped for {spec_name}: it requires one-way clustering",
+            RuntimeWarning
+        )
+
     # Count units and periods
     n_units = df_valid['id'].nunique() if 'id' in df_valid.columns else 0
     n_periods = df_valid['period'].nunique() if 'period' in df_valid.columns else 0
@@ -393,10 +967,896 @@ def run_fe_estimation(
         r_squared=results['r_squared'],
         controls=spec['controls'],
         fe=spec['fe'],
+        cluster=spec['cluster'],
+        bootstrap_p_value=boot['p_value'] if boot else None,
+        bootstrap_weights=bootstrap if boot else None
+    )
+
+
+def _cluster_cross_products(values: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """
+    Per-cluster cross-products [1 Z_g]'[1 Z_g], shape (G, m + 1, m + 1).
+
+    Rows are sorted by cluster once; each product column is then summed
+    over contiguous runs, so working memory stays O(n) beyond the result.
+    """
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+
+    Z = np.column_stack([np.ones(len(values)), values])[order]
+    m = Z.shape[1]
+    products = np.empty((len(starts), m, m))
+    for a in range(m):
+        for b in range(a, m):
+            products[:, a, b] = products[:, b, a] = np.add.reduceat(Z[:, a] * Z[:, b], starts)
+    return products
+
+
+def sweep_specifications(
+    df: pd.DataFrame,
+    spec_names: Optional[list[str]] = None,
+    fe_cache: Optional[FECache] = None
+) -> list[EstimationResult]:
+    """
+    Estimate many specifications from shared sufficient statistics.
+
+    Specifications are grouped by fixed effects and estimation sample
+    (the rows :func:`run_fe_estimation` would use for each). For each
+    group the union of their variables is demeaned once and
+    [1 y X]'[1 y X] is accumulated in a single pass; every specification
+    is then solved from a sub-block of that matrix without touching the
+    rows again. For clustered specifications the per-cluster blocks
+    [1 y X]_g'[1 y X]_g are accumulated once per clustering, and each
+    cluster's score sum is X_g'y_g - X_g'X_g b, so results (including
+    multi-way clustering) equal :func:`run_fe_estimation`. Memory for a
+    clustering grows as G (k + 2)^2 for G clusters and k regressors.
+    Each result's ``elapsed_seconds`` is its own solve time plus an equal
+    share of its group's absorption and accumulation time.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Panel data
+    spec_names : list, optional
+        Specifications to run (default: all, in registry order)
+    fe_cache : FECache, optional
+        Cache of demeaned columns
+
+    Returns
+    -------
+    list[EstimationResult]
+        Results in the order of ``spec_names``
+    """
+    spec_names = list(spec_names or SPECIFICATIONS)
+    unknown = [name for name in spec_names if name not in SPECIFICATIONS]
+    if unknown:
+        raise ValueError(f"Unknown specification: {unknown}")
+
+    groups = {}
+    for name in spec_names:
+        spec = SPECIFICATIONS[name]
+        all_vars = [OUTCOME_VAR, TREATMENT_VAR] + spec['controls'] + spec['fe'] + _as_list(spec['cluster'])
+        valid = df[all_vars].notna().all(axis=1).to_numpy()
+        groups.setdefault((tuple(spec['fe']), _array_digest(valid)), (valid, []))[1].append(name)
+
+    results = {}
+    for (fe, _), (valid, names) in groups.items():
+        group_start = time.perf_counter()
+        fe = list(fe)
+        specs = [SPECIFICATIONS[name] for name in names]
+        x_union = list(dict.fromkeys(
+            var for spec in specs for var in [TREATMENT_VAR] + spec['controls']
+        ))
+        columns = [OUTCOME_VAR] + x_union
+        cluster_union = list(dict.fromkeys(c for spec in specs for c in _as_list(spec['cluster'])))
+
+        keep_cols = list(dict.fromkeys(
+            columns + fe + cluster_union + [c for c in ('id', 'period') if c in df.columns]
+        ))
+        df_valid = df.loc[valid, keep_cols]
+        df_est = demean_by_fe(df_valid, OUTCOME_VAR, x_union, fe, cache=fe_cache) if fe else df_valid
+
+        values = df_est[columns].to_numpy(dtype=float)
+        cp = CrossProducts(columns).update(values)
+        total_ss = cp.total_ss(OUTCOME_VAR)
+        n_units = df_valid['id'].nunique() if 'id' in df_valid.columns else 0
+        n_periods = df_valid['period'].nunique() if 'period' in df_valid.columns else 0
+
+        # Per-cluster cross-products, once per clustering combination
+        codes = {c: pd.factorize(df_valid[c])[0].astype(np.int64) for c in cluster_union}
+        cluster_blocks = {}
+        shared_seconds = (time.perf_counter() - group_start) / len(names)
+
+        for name, spec in zip(names, specs):
+            spec_start = time.perf_counter()
+            x_vars = [TREATMENT_VAR] + spec['controls']
+            fit = cp.ols(OUTCOME_VAR, x_vars)
+            if not fit.keep[1]:
+                raise ValueError(f"{TREATMENT_VAR} is collinear with the other regressors in {name}")
+
+            cluster_vars = _as_list(spec['cluster'])
+            beta = fit.beta[fit.keep]
+            if cluster_vars:
+                cols = np.array([0] + [cp.columns.index(x) + 1 for x in x_vars])[fit.keep]
+                score_sums = {}
+                for dims in _cluster_combinations(len(cluster_vars)):
+                    combo = tuple(cluster_vars[d] for d in dims)
+                    if combo not in cluster_blocks:
+                        cluster_blocks[combo] = _cluster_cross_products(
+                            values, _intersect_codes([codes[c] for c in combo])
+                        )
+                    blocks = cluster_blocks[combo]
+                    score_sums[dims] = blocks[:, cols, 1] - blocks[:, cols][:, :, cols] @ beta
+                V = _cluster_sandwich(fit.XtX_inv, score_sums, cp.n, fit.rank)
+                V = _clip_psd(V) if len(cluster_vars) > 1 else V
+                se = np.sqrt(V[1, 1])
+            else:
+                se = np.sqrt(fit.ssr / (cp.n - fit.rank) * fit.XtX_inv[1, 1])
+
+            summary = _coefficient_summary(beta[1], se, cp.n, fit.rank, 1 - fit.ssr / total_ss)
+            results[name] = EstimationResult(
+                specification=name,
+                coefficient=summary['coefficient'],
+                std_error=summary['std_error'],
+                t_stat=summary['t_stat'],
+                p_value=summary['p_value'],
+                ci_lower=summary['ci_lower'],
+                ci_upper=summary['ci_upper'],
+                n_obs=summary['n_obs'],
+                n_units=n_units,
+                n_periods=n_periods,
+                r_squared=summary['r_squared'],
+                controls=spec['controls'],
+                fe=spec['fe'],
+                cluster=spec['cluster'],
+                elapsed_seconds=shared_seconds + time.perf_counter() - spec_start
+            )
+
+    return [results[name] for name in spec_names]
+
+
+# ============================================================
+# EVENT STUDY
+# ============================================================
+
+def event_study(
+    df: pd.DataFrame,
+    window: Optional[tuple[int, int]] = EVENT_WINDOW,
+    reference: int = EVENT_REFERENCE,
+    fe: Optional[list[str]] = None,
+    cluster: Optional[Union[str, list[str]]] = 'id',
+    tol: float = FE_TOLERANCE,
+    max_iter: int = FE_MAX_ITER
+) -> pd.DataFrame:
+    """
+    Dynamic treatment effects on binned leads and lags of treatment.
+
+    Relative-period indicators are built as a sparse matrix D (one
+    nonzero per treated row); never-treated rows (missing event time)
+    have none. Periods outside ``window`` are binned into the endpoints,
+    and ``reference`` is omitted. With the fixed effects absorbed by
+    :func:`absorb_fe`, the coefficients solve (D'MD) b = D'My. D'MD is
+    accumulated block by block, demeaning only as many indicator columns
+    at once as fit in EVENT_BLOCK_BYTES, so hundreds of bins never
+    materialize a dense n x B design. A second blockwise pass
+    accumulates per-cluster score sums for cluster-robust errors.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Panel data with an event_time column
+    window : tuple, optional
+        (first, last) relative period; None uses all observed periods
+    reference : int
+        Omitted relative period
+    fe : list, optional
+        Fixed effects to absorb (default: unit and time)
+    cluster : str or list, optional
+        Cluster variable(s); None gives homoskedastic errors
+    tol : float
+        Convergence tolerance for fixed effects absorption
+    max_iter : int
+        Maximum alternating-projection iterations
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per relative period (event_time, coefficient, std_error,
+        t_stat, p_value, ci_lower, ci_upper, n_obs); the reference period
+        is included with a zero coefficient, and bins that cannot be
+        identified have NaN estimates
+    """
+    from scipy import sparse
+
+    fe = [UNIT_FE, TIME_FE] if fe is None else fe
+    cluster_vars = _as_list(cluster)
+    required = list(dict.fromkeys([OUTCOME_VAR] + fe + cluster_vars))
+    keep_cols = list(dict.fromkeys(required + [EVENT_TIME_VAR]))
+    df_valid = df.loc[df[required].notna().all(axis=1), keep_cols]
+    n = len(df_valid)
+
+    # Binned relative periods for treated rows
+    rel = df_valid[EVENT_TIME_VAR].to_numpy(dtype=float)
+    rows = np.flatnonzero(~np.isnan(rel))
+    rel = np.rint(rel[rows]).astype(np.int64)
+    if not len(rel):
+        raise ValueError("No treated observations with event time")
+    first, last = window if window is not None else (rel.min(), rel.max())
+    if not first <= reference <= last:
+        raise ValueError(f"Reference period {reference} is outside the window ({first}, {last})")
+    rel = np.clip(rel, first, last)
+
+    event_times = np.array([t for t in range(first, last + 1) if t != reference])
+    in_design = rel != reference
+    col = rel[in_design] - first - (rel[in_design] > reference)
+    B = len(event_times)
+    D = sparse.csc_matrix((np.ones(len(col)), (rows[in_design], col)), shape=(n, B))
+
+    # Fixed effects (a constant is absorbed when there are none)
+    codes = encode_fe(df_valid, fe) if fe else [np.zeros(n, dtype=np.int64)]
+
+    def absorb(values):
+        return absorb_fe(values, codes, tol=tol, max_iter=max_iter).values
+
+    y = absorb(df_valid[OUTCOME_VAR].to_numpy(dtype=float))
+    block = max(1, EVENT_BLOCK_BYTES // (8 * max(n, 1)))
+
+    DtD = np.zeros((B, B))
+    for start in range(0, B, block):
+        stop = min(start + block, B)
+        DtD[:, start:stop] = D.T @ absorb(D[:, start:stop].toarray())
+    DtD = (DtD + DtD.T) / 2
+
+    beta, XtX_inv, keep = solve_normal_equations(DtD, D.T @ y)
+    kept = np.flatnonzero(keep)
+    k = len(kept)
+    residuals = y - absorb(D[:, kept] @ beta[kept])
+
+    # Variance of the identified coefficients
+    if cluster_vars:
+        cluster_codes = [pd.factorize(df_valid[c])[0].astype(np.int64) for c in cluster_vars]
+        combos = {
+            dims: _intersect_codes([cluster_codes[d] for d in dims])
+            for dims in _cluster_combinations(len(cluster_vars))
+        }
+        score_sums = {dims: [] for dims in combos}
+        for start in range(0, k, block):
+            cols = kept[start:start + block]
+            scores = absorb(D[:, cols].toarray()) * residuals[:, None]
+            for dims, c in combos.items():
+                score_sums[dims].append(cluster_score_sums(scores, c))
+        score_sums = {dims: np.hstack(parts) for dims, parts in score_sums.items()}
+        V = _cluster_sandwich(XtX_inv, score_sums, n, k)
+        if len(cluster_vars) > 1:
+            V = _clip_psd(V)
+    else:
+        V = (residuals @ residuals) / (n - k) * XtX_inv
+    se = np.full(B, np.nan)
+    se[kept] = np.sqrt(np.diag(V))
+
+    t_stat = beta / se
+    t_crit = critical_value(0.05, n - k)
+    results = pd.DataFrame({
+        'event_time': event_times,
+        'coefficient': beta,
+        'std_error': se,
+        't_stat': t_stat,
+        'p_value': two_sided_pvalue(t_stat, n - k),
+        'ci_lower': beta - t_crit * se,
+        'ci_upper': beta + t_crit * se,
+        'n_obs': np.bincount(col, minlength=B),
+    })
+
+    reference_row = pd.DataFrame({
+        'event_time': [reference], 'coefficient': [0.0], 'std_error': [0.0], 't_stat': [np.nan],
+        'p_value': [np.nan], 'ci_lower': [0.0], 'ci_upper': [0.0], 'n_obs': [int((rel == reference).sum())]
+    })
+
+    return pd.concat([results, reference_row]).sort_values('event_time', ignore_index=True)
+
+
+# ============================================================
+# STAGGERED ADOPTION (GROUP-TIME ATTs)
+# ============================================================
+
+@dataclass
+class GroupTimeATT:
+    """Group-time ATTs and their aggregations."""
+    group_time: pd.DataFrame
+    event_time: pd.DataFrame
+    overall_att: float
+    overall_se: float
+    control_group: str
+    base_period: str
+
+    def format_overall(self, decimals: int = 3) -> str:
+        """Format the overall ATT with stars and SE."""
+        p_value = two_sided_pvalue(self.overall_att / self.overall_se)
+        stars = add_significance_stars(p_value)
+        return f"{self.overall_att:.{decimals}f}{stars} ({self.overall_se:.{decimals}f})"
+
+
+def _cohort_tables(
+    y: np.ndarray,
+    unit_codes: np.ndarray,
+    period_codes: np.ndarray,
+    unit_cohort: np.ndarray,
+    n_cohorts: int,
+    n_periods: int
+) -> tuple[np.ndarray, np.ndarray, list[np.ndarray]]:
+    """
+    Cohort-period means, cohort sizes and covariance matrices of the means.
+
+    Built once from the unit x period outcome matrix. Covariances use
+    the units observed in both periods, so unbalanced panels are handled
+    and the result is exact for means of the available observations.
+    """
+    n_units = len(unit_cohort)
+    flat = unit_codes * n_periods + period_codes
+    cell_n = np.bincount(flat, minlength=n_units * n_periods)
+    cell_sum = np.bincount(flat, weights=y, minlength=n_units * n_periods)
+    observed = (cell_n > 0).reshape(n_units, n_periods)
+    wide = np.divide(cell_sum, cell_n, out=np.zeros(len(cell_n)), where=cell_n > 0).reshape(n_units, n_periods)
+
+    means = np.full((n_cohorts, n_periods), np.nan)
+    sizes = np.bincount(unit_cohort, minlength=n_cohorts).astype(float)
+    covariances = []
+    for c in range(n_cohorts):
+        W = wide[unit_cohort == c]
+        O = observed[unit_cohort == c].astype(float)
+        pair_n = O.T @ O
+        pair_sum = W.T @ O               # [t, b]: sum of Y_t over units seen at t and b
+        cross = W.T @ W
+
+        n_t = np.diag(pair_n)
+        means[c] = np.divide(np.diag(pair_sum), n_t, out=np.full(n_periods, np.nan), where=n_t > 0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = (cross - pair_sum * pair_sum.T / pair_n) / pair_n
+            cov_means = cov * pair_n / np.outer(n_t, n_t)
+        covariances.append(np.nan_to_num(cov_means))
+
+    return means, sizes, covariances
+
+
+def _linear_variance(L, covariances: list[np.ndarray], n_periods: int) -> np.ndarray:
+    """Variance of each row of L @ vec(means), cohorts being independent."""
+    var = np.zeros(L.shape[0])
+    for c, cov in enumerate(covariances):
+        block = L[:, c * n_periods:(c + 1) * n_periods]
+        if block.nnz:
+            var += np.asarray((block @ cov) * block.toarray()).sum(axis=1)
+    return var
+
+
+def group_time_att(
+    df: pd.DataFrame,
+    unit_var: str = 'id',
+    time_var: str = 'period',
+    cohort_var: Optional[str] = None,
+    control_group: str = 'never_treated',
+    base_period: str = 'varying',
+    alpha: float = 0.05
+) -> GroupTimeATT:
+    """
+    Callaway-Sant'Anna group-time average treatment effects.
+
+    Each ATT(g, t) is a 2x2 comparison of cohort g with the control
+    group between period t and a base period (g - 1, or t - 1 before
+    treatment with ``base_period='varying'``). Every comparison is a
+    sparse linear combination of one cohort x period table of means, so
+    the panel is touched once to build the tables; all ATTs, their
+    event-time and overall aggregations (weighted by cohort size) and
+    their standard errors then cost O(cohorts x periods) each. Standard
+    errors treat units as independent across cohorts and use the
+    within-cohort covariance of period means.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Panel data
+    unit_var : str
+        Unit identifier
+    time_var : str
+        Integer-ordered period
+    cohort_var : str, optional
+        First treated period per row (missing for never-treated); by
+        default COHORT_VAR if present, otherwise the first period with
+        treatment == 1
+    control_group : str
+        'never_treated' or 'not_yet_treated'
+    base_period : str
+        'varying' or 'universal'
+    alpha : float
+        Significance level for confidence intervals
+
+    Returns
+    -------
+    GroupTimeATT
+        Group-time ATTs, event-time aggregation and overall ATT
+    """
+    from scipy import sparse
+    if control_group not in CONTROL_GROUPS:
+        raise ValueError(f"Unknown control group: {control_group}")
+    if base_period not in BASE_PERIODS:
+        raise ValueError(f"Unknown base period: {base_period}")
+
+    df_valid = df[df[[OUTCOME_VAR, unit_var, time_var]].notna().all(axis=1)]
+    if cohort_var is None and COHORT_VAR in df_valid.columns:
+        cohort_var = COHORT_VAR
+    if cohort_var is not None:
+        first_treated = df_valid.groupby(unit_var)[cohort_var].min()
+    else:
+        first_treated = df_valid.loc[df_valid[TREATMENT_VAR] == 1].groupby(unit_var)[time_var].min()
+
+    periods = np.sort(df_valid[time_var].unique())
+    n_periods = len(periods)
+    unit_codes, units = pd.factorize(df_valid[unit_var])
+    period_codes = np.searchsorted(periods, df_valid[time_var].to_numpy())
+
+    # Cohort of each unit as a period index; treated after the panel ends counts as never
+    start = first_treated.reindex(units).to_numpy(dtype=float)
+    start_idx = np.where(np.isnan(start), n_periods, np.searchsorted(periods, np.nan_to_num(start)))
+    cohort_periods = np.unique(start_idx[(start_idx > 0) & (start_idx < n_periods)])
+    # Always-treated units have no pre-period and are dropped
+    usable = start_idx > 0
+    never = len(cohort_periods)
+    unit_cohort = np.where(start_idx >= n_periods, never, np.searchsorted(cohort_periods, start_idx))
+
+    rows = usable[unit_codes]
+    keep_units = np.cumsum(usable) - 1
+    means, sizes, covariances = _cohort_tables(
+        df_valid[OUTCOME_VAR].to_numpy(dtype=float)[rows],
+        keep_units[unit_codes[rows]],
+        period_codes[rows],
+        unit_cohort[usable],
+        never + 1,
+        n_periods
+    )
+
+    # Cells (g, t) with their base periods
+    g = np.repeat(cohort_periods, n_periods)
+    cohort = np.repeat(np.arange(never), n_periods)
+    t = np.tile(np.arange(n_periods), never)
+    b = np.where((base_period == 'varying') & (t < g), t - 1, g - 1)
+    valid = (b >= 0) & (t != b)
+    g, cohort, t, b = g[valid], cohort[valid], t[valid], b[valid]
+    K = len(t)
+
+    # Control weights per cell: never-treated, or cohorts not yet treated by max(t, b)
+    control_w = np.zeros((K, never + 1))
+    control_w[:, never] = sizes[never]
+    if control_group == 'not_yet_treated':
+        later = cohort_periods[None, :] > np.maximum(t, b)[:, None]
+        later &= np.arange(never)[None, :] != cohort[:, None]
+        control_w[:, :never] = later * sizes[:never]
+    n_control = control_w.sum(axis=1)
+    control_w = np.divide(control_w, n_control[:, None], out=np.zeros_like(control_w), where=n_control[:, None] > 0)
+
+    # L maps vec(means) (cohort-major) to each ATT(g, t)
+    c_idx, k_idx = np.nonzero(control_w.T)
+    w = control_w[k_idx, c_idx]
+    L = sparse.csr_matrix((
+        np.concatenate([np.ones(K), -np.ones(K), -w, w]),
+        (
+            np.concatenate([np.arange(K), np.arange(K), k_idx, k_idx]),
+            np.concatenate([cohort * n_periods + t, cohort * n_periods + b,
+                            c_idx * n_periods + t[k_idx], c_idx * n_periods + b[k_idx]])
+        )
+    ), shape=(K, (never + 1) * n_periods))
+
+    att = L @ np.nan_to_num(means).ravel()
+    att[(n_control == 0) | np.isnan(means[cohort, t]) | np.isnan(means[cohort, b])] = np.nan
+    se = np.sqrt(_linear_variance(L, covariances, n_periods))
+    z = critical_value(alpha)
+
+    event = t - g
+    group_time = pd.DataFrame({
+        'cohort': periods[g],
+        'period': periods[t],
+        'event_time': event,
+        'att': att,
+        'std_error': se,
+        'ci_lower': att - z * se,
+        'ci_upper': att + z * se,
+        'n_treated': sizes[cohort].astype(int),
+        'n_control': n_control.astype(int),
+    })
+
+    # Aggregations: cohort-size weights within each event time, and over post cells
+    ok = np.isfinite(att)
+    event_values = np.unique(event[ok])
+    cell_w = sizes[cohort] * ok
+    agg_rows = np.searchsorted(event_values, event[ok])
+    A_event = sparse.csr_matrix((cell_w[ok], (agg_rows, np.flatnonzero(ok))), shape=(len(event_values), K))
+    post = ok & (event >= 0)
+    A_overall = sparse.csr_matrix((cell_w[post], (np.zeros(post.sum(), dtype=int), np.flatnonzero(post))), shape=(1, K))
+
+    aggregates = []
+    for A in (A_event, A_overall):
+        totals = np.asarray(A.sum(axis=1)).ravel()
+        A = sparse.diags(np.divide(1.0, totals, out=np.zeros_like(totals), where=totals > 0)) @ A
+        value = A @ np.nan_to_num(att)
+        value[totals == 0] = np.nan
+        aggregates.append((value, np.sqrt(_linear_variance(A @ L, covariances, n_periods))))
+
+    (event_att, event_se), (overall_att, overall_se) = aggregates
+    event_df = pd.DataFrame({
+        'event_time': event_values,
+        'att': event_att,
+        'std_error': event_se,
+        'ci_lower': event_att - z * event_se,
+        'ci_upper': event_att + z * event_se,
+        'n_cohorts': np.bincount(agg_rows, minlength=len(event_values)),
+    })
+
+    return GroupTimeATT(
+        group_time=group_time,
+        event_time=event_df,
+        overall_att=float(overall_att[0]),
+        overall_se=float(overall_se[0]),
+        control_group=control_group,
+        base_period=base_period
+    )
+
+
+# ============================================================
+# STREAMING ESTIMATION
+# ============================================================
+
+class _GroupIndex:
+    """Integer codes for values, assigned incrementally across chunks."""
+
+    def __init__(self):
+        self.levels = None
+
+    def __len__(self) -> int:
+        return 0 if self.levels is None else len(self.levels)
+
+    def codes(self, values: Union[np.ndarray, pd.Index]) -> np.ndarray:
+        """Codes for ``values``, adding unseen values as new levels."""
+        values = pd.Index(values)
+        if self.levels is None:
+            self.levels = values.unique()
+        codes = self.levels.get_indexer(values)
+        new = codes < 0
+        if new.any():
+            self.levels = self.levels.append(values[new].unique())
+            codes[new] = self.levels.get_indexer(values[new])
+        return codes
+
+
+def _add_group_sums(sums: np.ndarray, codes: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+    """Add per-group row sums of ``values`` into ``sums``, growing it to ``n_groups`` rows."""
+    if len(sums) < n_groups:
+        sums = np.vstack([sums, np.zeros((n_groups - len(sums), sums.shape[1]))])
+    if len(codes):
+        order = np.argsort(codes, kind='stable')
+        sorted_codes = codes[order]
+        starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+        sums[sorted_codes[starts]] += np.add.reduceat(values[order], starts, axis=0)
+    return sums
+
+
+def run_streaming_estimation(
+    path: Union[str, Path],
+    spec_name: str,
+    batch_size: int = STREAM_BATCH_SIZE,
+    tol: float = FE_TOLERANCE,
+    max_iter: int = FE_MAX_ITER
+) -> EstimationResult:
+    """
+    Estimate a specification out-of-core from a parquet panel.
+
+    Only the needed columns are read, one batch at a time. Fixed effects
+    are absorbed by solving the dummy regression's normal equations
+    D'D a = D'[y X] by conjugate gradients over batches: the state is
+    each fixed effect's per-level coefficients (L x (k + 1) for L
+    levels), and each iteration is one pass that sums every row's total
+    effect by level for all fixed effects at once. Dividing by group
+    sizes preconditions the system, so a single fixed effect is solved
+    from the first pass (which also counts levels) and several take one
+    pass per iteration until every level's mean residual is within
+    ``tol`` of each column's scale. A further pass accumulates
+    [1 y X]'[1 y X] over the demeaned values, and a last one per-cluster
+    score sums for clustered errors; with fixed effects a run reads the
+    file iterations + 2 times, plus one when clustering. Memory is
+    bounded by the per-level effects, the cross-product matrix and
+    per-cluster sums, never by the row count. Results match
+    :func:`run_fe_estimation` at convergence.
+
+    Parameters
+    ----------
+    path : str or Path
+        Panel parquet file
+    spec_name : str
+        Specification name from SPECIFICATIONS
+    batch_size : int
+        Rows per batch
+    tol : float
+        Convergence tolerance for multi-way absorption
+    max_iter : int
+        Maximum conjugate-gradient iterations (one pass each)
+
+    Returns
+    -------
+    EstimationResult
+        Estimation results
+    """
+    import pyarrow.parquet as pq
+
+    if spec_name not in SPECIFICATIONS:
+        raise ValueError(f"Unknown specification: {spec_name}")
+
+    spec = SPECIFICATIONS[spec_name]
+    x_vars = [TREATMENT_VAR] + spec['controls']
+    fe_vars = spec['fe']
+    cluster_vars = _as_list(spec['cluster'])
+    value_vars = [OUTCOME_VAR] + x_vars
+
+    parquet = pq.ParquetFile(path)
+    counted = [c for c in ('id', 'period') if c in parquet.schema_arrow.names]
+    required = list(dict.fromkeys(value_vars + fe_vars + cluster_vars))
+    columns = list(dict.fromkeys(required + counted))
+
+    def batches(cols):
+        for batch in parquet.iter_batches(batch_size=batch_size, columns=cols):
+            chunk = batch.to_pandas()
+            yield chunk[chunk[required].notna().all(axis=1)]
+
+    fe_index = [_GroupIndex() for _ in fe_vars]
+    effects = [np.zeros((0, len(value_vars))) for _ in fe_vars]
+
+    def demeaned(chunk):
+        # y and X net of every fixed effect's estimated effects
+        values = chunk[value_vars].to_numpy(dtype=float, copy=True)
+        for i, (fe, index) in enumerate(zip(fe_vars, fe_index)):
+            values -= effects[i][index.levels.get_indexer(chunk[fe].to_numpy())]
+        return values
+
+    if fe_vars:
+        # Pass 0: fixed effect levels, group sizes, per-level sums of y
+        # and X (the right-hand side D'[y X]) and column scales
+        counts = [np.zeros(0) for _ in fe_vars]
+        rhs = [np.zeros((0, len(value_vars))) for _ in fe_vars]
+        scale = np.ones(len(value_vars))
+        for chunk in batches(required):
+            values = chunk[value_vars].to_numpy(dtype=float)
+            scale = np.maximum(scale, np.abs(values).max(axis=0, initial=0.0))
+            for i, (fe, index) in enumerate(zip(fe_vars, fe_index)):
+                codes = index.codes(chunk[fe].to_numpy())
+                counts[i] = np.r_[counts[i], np.zeros(len(index) - len(counts[i]))]
+                counts[i] += np.bincount(codes, minlength=len(index))
+                rhs[i] = _add_group_sums(rhs[i], codes, values, len(index))
+
+        def normal_product(direction):
+            # One pass for every fixed effect at once: D'D p, the per-level
+            # sums of each row's total effect D p
+            sums = [np.zeros((len(index), len(value_vars))) for index in fe_index]
+            for chunk in batches(required):
+                codes = [index.levels.get_indexer(chunk[fe].to_numpy()) for fe, index in zip(fe_vars, fe_index)]
+                fitted = sum(d[c] for d, c in zip(direction, codes))
+                for i, c in enumerate(codes):
+                    sums[i] = _add_group_sums(sums[i], c, fitted, len(fe_index[i]))
+            return sums
+
+        # Conjugate gradients on D'D a = D'[y X], preconditioned by group
+        # sizes: the preconditioned residual is each level's mean residual,
+        # the change one more projection would make
+        residual = rhs
+        precond = [r / c[:, None] for r, c in zip(residual, counts)]
+        if len(fe_vars) == 1:
+            effects = precond
+        else:
+            effects = [np.zeros_like(r) for r in residual]
+            direction = [z.copy() for z in precond]
+            rz = sum((r * z).sum(axis=0) for r, z in zip(residual, precond))
+            n_iter = 0
+            while True:
+                change = np.max([np.abs(z).max(axis=0, initial=0.0) for z in precond], axis=0)
+                if np.all(change <= tol * scale) or n_iter == max_iter:
+                    break
+                n_iter += 1
+                product = normal_product(direction)
+                curvature = sum((d * q).sum(axis=0) for d, q in zip(direction, product))
+                step = np.divide(rz, curvature, out=np.zeros(len(value_vars)), where=curvature > 0)
+                effects = [e + step * d for e, d in zip(effects, direction)]
+                residual = [r - step * q for r, q in zip(residual, product)]
+                precond = [r / c[:, None] for r, c in zip(residual, counts)]
+                rz_next = sum((r * z).sum(axis=0) for r, z in zip(residual, precond))
+                ratio = np.divide(rz_next, rz, out=np.zeros(len(value_vars)), where=rz > 0)
+                direction = [z + ratio * d for z, d in zip(precond, direction)]
+                rz = rz_next
+
+            if np.any(change > tol * scale):
+                warnings.warn(
+                    f"Fixed effects absorption did not converge in {max_iter} iterations",
+                    RuntimeWarning
+                )
+
+    # Pass 1: cross-products of the demeaned values
+    cp = CrossProducts(value_vars)
+    count_index = {c: _GroupIndex() for c in counted}
+    for chunk in batches(columns):
+        cp.update(demeaned(chunk))
+        for c, index in count_index.items():
+            index.codes(chunk[c].to_numpy())
+
+    n = cp.n
+    if n < len(x_vars) + 1:
+        raise ValueError(f"Insufficient observations: {n}")
+
+    fit = cp.ols(OUTCOME_VAR, x_vars)
+    if not fit.keep[1]:
+        raise ValueError(f"{TREATMENT_VAR} is collinear with the other regressors")
+    b = fit.beta[fit.keep]
+    k = fit.rank
+
+    if cluster_vars:
+        # Pass 2: per-cluster score sums from residuals
+        kept = np.flatnonzero(fit.keep)
+        dim_index = [_GroupIndex() for _ in cluster_vars]
+        cluster_index = {dims: _GroupIndex() for dims in _cluster_combinations(len(cluster_vars))}
+        score_sums = {dims: np.zeros((0, k)) for dims in cluster_index}
+
+        for chunk in batches(columns):
+            Z = demeaned(chunk)
+            X = np.column_stack([np.ones(len(Z)), Z[:, 1:]])[:, kept]
+            scores = X * (Z[:, 0] - X @ b)[:, None]
+
+            dim_codes = [index.codes(chunk[c].to_numpy()) for c, index in zip(cluster_vars, dim_index)]
+            for dims, index in cluster_index.items():
+                codes = index.codes(pd.MultiIndex.from_arrays([dim_codes[d] for d in dims]))
+                score_sums[dims] = _add_group_sums(score_sums[dims], codes, scores, len(index))
+
+        V = _cluster_sandwich(fit.XtX_inv, score_sums, n, k)
+        V = _clip_psd(V) if len(cluster_vars) > 1 else V
+        se = np.sqrt(V[1, 1])
+    else:
+        se = np.sqrt(fit.ssr / (n - k) * fit.XtX_inv[1, 1])
+
+    summary = _coefficient_summary(b[1], se, n, k, 1 - fit.ssr / cp.total_ss(OUTCOME_VAR))
+
+    return EstimationResult(
+        specification=spec_name,
+        coefficient=summary['coefficient'],
+        std_error=summary['std_error'],
+        t_stat=summary['t_stat'],
+        p_value=summary['p_value'],
+        ci_lower=summary['ci_lower'],
+        ci_upper=summary['ci_upper'],
+        n_obs=n,
+        n_units=len(count_index['id']) if 'id' in count_index else 0,
+        n_periods=len(count_index['period']) if 'period' in count_index else 0,
+        r_squared=summary['r_squared'],
+        controls=spec['controls'],
+        fe=spec['fe'],
         cluster=spec['cluster']
     )
 
 
+# ============================================================
+# PARALLEL SPECIFICATIONS
+# ============================================================
+
+# Per-worker estimation state, set once by _init_spec_worker
+_WORKER_STATE: Optional[tuple] = None
+
+
+def _spec_columns(df_columns, spec_names: list[str]) -> list[str]:
+    """Panel columns any of the specifications reads."""
+    needed = []
+    for name in spec_names:
+        spec = SPECIFICATIONS[name]
+        needed += [OUTCOME_VAR, TREATMENT_VAR] + spec['controls'] + spec['fe'] + _as_list(spec['cluster'])
+    needed += ['id', 'period']
+    return [c for c in dict.fromkeys(needed) if c in df_columns]
+
+
+def _timed_estimation(
+    spec_name: str,
+    df: Optional[pd.DataFrame],
+    input_path: Optional[Path],
+    fe_cache: Optional[FECache],
+    bootstrap: Optional[dict] = None
+) -> tuple[str, Optional[EstimationResult], Optional[str]]:
+    """Run one specification, recording its wall time; errors are returned."""
+    start = time.perf_counter()
+    try:
+        if df is None:
+            result = run_streaming_estimation(input_path, spec_name)
+        else:
+            result = run_fe_estimation(df, spec_name, fe_cache=fe_cache, **(bootstrap or {}))
+    except Exception as e:
+        return spec_name, None, str(e)
+
+    result.elapsed_seconds = time.perf_counter() - start
+    return spec_name, result, None
+
+
+def _init_spec_worker(
+    paths: Optional[dict],
+    input_path: Optional[Path],
+    cache: Optional[tuple[Optional[Path], int]],
+    bootstrap: Optional[dict]
+):
+    """Map the shared panel (or remember the parquet path) in a worker."""
+    global _WORKER_STATE
+    df = load_shared_columns(paths) if paths is not None else None
+    fe_cache = load_fe_cache(*cache) if cache is not None else None
+    _WORKER_STATE = (df, input_path, fe_cache, bootstrap)
+
+
+def _run_spec(spec_name: str) -> tuple[str, Optional[EstimationResult], Optional[str]]:
+    """Run one specification inside a worker."""
+    df, input_path, fe_cache, bootstrap = _WORKER_STATE
+    return _timed_estimation(spec_name, df, input_path, fe_cache, bootstrap)
+
+
+def run_specifications(
+    spec_names: list[str],
+    df: Optional[pd.DataFrame] = None,
+    input_path: Optional[Path] = None,
+    jobs: int = 1,
+    fe_cache: Optional[FECache] = None,
+    bootstrap: Optional[dict] = None
+) -> list[tuple[str, Optional[EstimationResult], Optional[str]]]:
+    """
+    Run specifications serially or in a process pool.
+
+    With ``df`` the in-memory estimator is used; without it, each
+    specification streams from ``input_path``. For ``jobs > 1`` the
+    columns the specifications need are written once as .npy files and
+    memory-mapped by every worker, so the panel is never pickled. A
+    persistent ``fe_cache`` is shared through its directory; an in-memory
+    one is replaced by a fresh cache per worker. Each result
+    carries its wall time in ``elapsed_seconds``.
+
+    Parameters
+    ----------
+    spec_names : list
+        Specifications to run
+    df : pd.DataFrame, optional
+        Panel data (in-memory estimation)
+    input_path : Path, optional
+        Panel parquet file (streaming estimation when ``df`` is None)
+    jobs : int
+        Worker processes
+    fe_cache : FECache, optional
+        Cache of demeaned columns
+    bootstrap : dict, optional
+        Wild cluster bootstrap settings passed to :func:`run_fe_estimation`
+        (``bootstrap``, ``n_boot``, ``seed``); in-memory estimation only
+
+    Returns
+    -------
+    list[tuple]
+        (spec_name, result or None, error message or None), in the
+        order of ``spec_names``
+    """
+    if jobs <= 1 or len(spec_names) <= 1:
+        return [_timed_estimation(name, df, input_path, fe_cache, bootstrap) for name in spec_names]
+
+    cache = (fe_cache.path, fe_cache.max_bytes) if fe_cache is not None else None
+    methods = mp.get_all_start_methods()
+    ctx = mp.get_context('fork' if 'fork' in methods else 'spawn')
+
+    with tempfile.TemporaryDirectory(prefix='panel_') as shared_dir:
+        paths = None
+        if df is not None:
+            paths = share_columns(df, _spec_columns(df.columns, spec_names), Path(shared_dir))
+
+        with ctx.Pool(
+            processes=min(jobs, len(spec_names)),
+            initializer=_init_spec_worker,
+            initargs=(paths, input_path, cache, bootstrap)
+        ) as pool:
+            done = {name: (name, result, error) for name, result, error in pool.imap_unordered(_run_spec, spec_names)}
+
+    return [done[name] for name in spec_names]
+
+
 # ============================================================
 # MAIN ENTRY POINT
 # ============================================================
@@ -405,6 +1865,12 @@ def main(
     specification: str = 'baseline',
     sample: str = 'full',
     run_all: bool = False,
+    streaming: bool = False,
+    jobs: int = 1,
+    persist_fe_cache: bool = False,
+    bootstrap: Optional[str] = None,
+    n_boot: int = BOOTSTRAP_REPS,
+    seed: Optional[int] = None,
     verbose: bool = True
 ):
     """
@@ -418,6 +1884,22 @@ def main(
         Sample restriction ('full', 'subset', etc.)
     run_all : bool
         Run all specifications
+    streaming : bool
+        Estimate out-of-core from panel.parquet in batches
+    jobs : int
+        Worker processes for running specifications concurrently when
+        they are not swept (streaming, or if the sweep fails)
+    persist_fe_cache : bool
+        Keep demeaned columns in data_work/fe_cache/ for later runs
+        (bounded by FE_CACHE_MAX_BYTES); otherwise they are shared
+        across specifications in memory only
+    bootstrap : str, optional
+        Wild cluster bootstrap weights ('rademacher' or 'webb') for a
+        bootstrap p-value per specification (in-memory estimation only)
+    n_boot : int
+        Bootstrap replications
+    seed : int, optional
+        Seed for the bootstrap weights
     verbose : bool
         Print detailed output
     """
@@ -437,12 +1919,19 @@ def main(
         print("  Run 'build_panel' stage first.")
         sys.exit(1)
 
-    df = load_data(input_path)
-    print(f"    -> {len(df):,} rows, {len(df.columns)} columns")
+    if streaming:
+        import pyarrow.parquet as pq
+        metadata = pq.read_metadata(input_path)
+        columns = metadata.schema.names
+        print(f"    -> {metadata.num_rows:,} rows, {len(columns)} columns (streaming)")
+    else:
+        df = load_data(input_path)
+        columns = df.columns
+        print(f"    -> {len(df):,} rows, {len(df.columns)} columns")
 
     # Check required columns
     required = [OUTCOME_VAR, TREATMENT_VAR]
-    missing = [c for c in required if c not in df.columns]
+    missing = [c for c in required if c not in columns]
     if missing:
         print(f"\n  ERROR: Missing required columns: {missing}")
         sys.exit(1)
@@ -463,26 +1952,59 @@ def main(
             sys.exit(1)
         specs_to_run = [specification]
 
-    # Run estimations
+    # Run estimations, sharing demeaned columns across specifications
     results = []
-    print(f"\n  Running {len(specs_to_run)} specification(s)...")
-
-    for spec_name in specs_to_run:
+    fe_cache = load_fe_cache(work_dir / FE_CACHE_SUBDIR if persist_fe_cache else None)
+    outcomes = None
+
+    boot_options = None
+    if bootstrap is not None:
+        if streaming:
+            print("\n  Warning: --bootstrap is not available with --streaming; skipped")
+        else:
+            boot_options = {'bootstrap': bootstrap, 'n_boot': n_boot, 'seed': seed}
+
+    if len(specs_to_run) > 1 and not streaming and boot_options is None:
+        # One pass per fixed effects group and sample instead of one per specification
+        print(f"\n  Sweeping {len(specs_to_run)} specifications from shared cross-products...")
+        start = time.perf_counter()
+        try:
+            swept = sweep_specifications(df, specs_to_run, fe_cache=fe_cache)
+            outcomes = [(r.specification, r, None) for r in swept]
+            print(f"    Total time: {time.perf_counter() - start:.2f}s")
+        except Exception as e:
+            print(f"    Sweep failed ({e}); estimating specifications separately")
+
+    if outcomes is None:
+        print(f"\n  Running {len(specs_to_run)} specification(s) ({jobs} job(s))...")
+        outcomes = run_specifications(
+            specs_to_run,
+            df=None if streaming else df,
+            input_path=input_path,
+            jobs=jobs,
+            fe_cache=fe_cache,
+            bootstrap=boot_options
+        )
+
+    for spec_name, result, error in outcomes:
         spec = SPECIFICATIONS[spec_name]
         print(f"\n  {spec['name']}:")
         print(f"    {spec['description']}")
 
-        try:
-            result = run_fe_estimation(df, spec_name)
-            results.append(result)
-
-            print(f"    Coefficient: {result.format_coefficient()}")
-            print(f"    95% CI: [{result.ci_lower:.3f}, {result.ci_upper:.3f}]")
-            print(f"    N: {result.n_obs:,}")
-            print(f"    R²: {result.r_squared:.4f}")
-
-        except Exception as e:
-            print(f"    ERROR: {e}")
+        if error is not None:
+            print(f"    ERROR: {error}")
+            continue
+
+        results.append(result)
+        print(f"    Coefficient: {result.format_coefficient()}")
+        print(f"    95% CI: [{result.ci_lower:.3f}, {result.ci_upper:.3f}]")
+        if result.bootstrap_p_value is not None:
+            print(f"    Wild bootstrap p-value ({result.bootstrap_weights}, {n_boot:,} reps): "
+                  f"{result.bootstrap_p_value:.4f}")
+        print(f"    N: {result.n_obs:,}")
+        print(f"    R²: {result.r_squared:.4f}")
+        if result.elapsed_seconds is not None:
+            print(f"    Time: {result.elapsed_seconds:.2f}s")
 
     # Save results
     if results:
@@ -498,12 +2020,37 @@ def main(
 
         print(f"\n  Results saved to: {diag_dir}")
 
+    # Event study on binned leads and lags
+    if not streaming and EVENT_TIME_VAR in df.columns:
+        print(f"\n  Event study (window {EVENT_WINDOW}, reference {EVENT_REFERENCE}):")
+        try:
+            event_df = event_study(df)
+            ensure_dir(diag_dir)
+            save_diagnostic(event_df, 'event_study')
+            print(f"    {len(event_df)} relative periods -> event_study.csv")
+        except Exception as e:
+            print(f"    ERROR: {e}")
+
+    # Group-time ATTs for staggered adoption
+    if not streaming and COHORT_VAR in df.columns:
+        print("\n  Group-time ATTs (never-treated controls):")
+        try:
+            att = group_time_att(df)
+            ensure_dir(diag_dir)
+            save_diagnostic(att.group_time, 'group_time_att')
+            save_diagnostic(att.event_time, 'group_time_att_event')
+            print(f"    {len(att.group_time)} cohort-period cells, overall ATT {att.format_overall()}")
+        except Exception as e:
+            print(f"    ERROR: {e}")
+
     # Summary
     print("\n" + "-" * 60)
     print("ESTIMATION SUMMARY")
     print("-" * 60)
     print(f"  Specifications run: {len(results)}")
     print(f"  Sample: {sample}")
+    if jobs <= 1 and not streaming:
+        print(f"  FE cache: {fe_cache.hits} reused, {fe_cache.misses} absorbed")
 
     if results:
         print("\n  Results:")
@@ -8,6 +8,8 @@ This stage handles:
 - Alternative specifications
 - Placebo tests (time and treatment group)
 - Sample restriction tests
+- Randomization inference (unit-level treatment permutations)
+- Leave-one-cluster-out influence of each cluster
 - Alternative standard error methods
 
 Input Files
@@ -18,6 +20,7 @@ Output Files
 ------------
 - data_work/diagnostics/robustness_results.csv
 - data_work/diagnostics/placebo_results.csv
+- data_work/diagnostics/leave_one_cluster_out.csv
 
 Usage
 -----
@@ -26,9 +29,11 @@ Usage
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional, Literal
-from dataclasses import dataclass
+from typing import Optional, Literal, Callable
+from dataclasses import dataclass, field
+import multiprocessing as mp
 import sys
+import tempfile
 
 # Add parent directory for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -42,6 +47,18 @@ from utils.helpers import (
     save_diagnostic,
     ensure_dir,
     add_significance_stars,
+    share_columns,
+    load_shared_columns,
+)
+from utils.solvers import CrossProducts, least_squares
+from utils.inference import two_sided_pvalue
+from stages.s03_estimation import (
+    demean_by_fe,
+    cluster_score_sums,
+    FECache,
+    SPECIFICATIONS,
+    UNIT_FE,
+    TIME_FE,
 )
 
 
@@ -53,6 +70,19 @@ INPUT_FILE = 'panel.parquet'
 OUTCOME_VAR = 'outcome'
 TREATMENT_VAR = 'treatment'
 
+# Randomization inference
+RI_PERMUTATIONS = 9_999
+RI_SEED = 42
+RI_TASK_SIZE = 1_000           # Permutations per seeded task (fixed so results do not depend on jobs)
+RI_BATCH_BYTES = 64 * 2**20    # Working memory per batch of permutations
+RI_TABLE_BYTES = 256 * 2**20   # Largest units x distinct-paths score table; above it, score directly
+
+# Masked regressions
+MASK_CHUNK_ROWS = 262_144      # Rows per weighted cross-product update (bounds working memory)
+
+# Leave-one-cluster-out
+LOCO_MAX_COND = 1e12           # Drops leaving the design (near) singular give NaN
+
 
 # ============================================================
 # ROBUSTNESS RESULT CLASSES
@@ -62,7 +92,7 @@ TREATMENT_VAR = 'treatment'
 class RobustnessResult:
     """Result from a robustness check."""
     test_name: str
-    test_type: str  # 'specification', 'placebo', 'sample', 'se'
+    test_type: str  # 'specification', 'placebo', 'sample', 'se', 'randomization', 'jackknife'
     coefficient: float
     std_error: float
     p_value: float
@@ -83,67 +113,219 @@ class RobustnessResult:
         }
 
 
+@dataclass
+class RobustnessTask:
+    """
+    A robustness check declared over panel columns.
+
+    ``check(df[columns], **kwargs)`` returns coefficient, std_error,
+    p_value and n_obs; ``check`` must be a module-level function so the
+    task can be sent to worker processes.
+    """
+    name: str
+    test_type: str
+    description: str
+    columns: list[str]
+    check: Callable[..., dict]
+    kwargs: dict = field(default_factory=dict)
+
+
 # ============================================================
-# ROBUSTNESS TESTS
+# ESTIMATION KERNEL
 # ============================================================
 
-def run_simple_ols(df: pd.DataFrame, y_var: str, x_var: str) -> dict:
-    """Run simple OLS and return coefficient, SE, p-value."""
-    df_clean = df[[y_var, x_var]].dropna()
-    n = len(df_clean)
+def mask_weights(mask: Optional[np.ndarray], n: int) -> np.ndarray:
+    """
+    Row weights for a sample restriction.
 
-    if n < 10:
-        raise ValueError(f"Insufficient observations: {n}")
+    A boolean mask selects rows (weight 0/1); an integer index array
+    selects rows by position, counting repeats; None keeps every row.
+    """
+    if mask is None:
+        return np.ones(n)
+    mask = np.asarray(mask)
+    if mask.dtype == bool:
+        if len(mask) != n:
+            raise ValueError(f"Mask has {len(mask)} rows, expected {n}")
+        return mask.astype(float)
+    return np.bincount(mask, minlength=n).astype(float)
+
+
+def masked_ols(
+    df: pd.DataFrame,
+    y_var: str,
+    x_vars: list[str],
+    mask: Optional[np.ndarray] = None,
+    extra: Optional[dict[str, np.ndarray]] = None
+) -> dict:
+    """
+    OLS of ``y_var`` on a constant and ``x_vars`` over a masked sample.
 
-    y = df_clean[y_var].values
-    X = np.column_stack([np.ones(n), df_clean[x_var].values])
+    The regression is solved from weighted cross-products, with the
+    restriction entering as row weights. Cross-products are accumulated
+    over row slices of the shared columns (views, for memory-mapped
+    columns), MASK_CHUNK_ROWS at a time, skipping slices the mask
+    excludes, so neither a filtered copy nor a full regressor matrix is
+    made. The result matches OLS on the selected rows (with repeated
+    rows for index masks).
 
-    XtX_inv = np.linalg.inv(X.T @ X)
-    beta = XtX_inv @ X.T @ y
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Column store (may be memory-mapped)
+    y_var : str
+        Outcome variable
+    x_vars : list
+        Regressors; the first one is reported
+    mask : np.ndarray, optional
+        Boolean or index mask over the rows of ``df``
+    extra : dict, optional
+        Derived columns (name -> array over the rows of ``df``)
+
+    Returns
+    -------
+    dict
+        Coefficient, SE, p-value and observation count
+    """
+    extra = extra or {}
+    names = [y_var] + x_vars
+    columns = [extra[v] if v in extra else df[v].to_numpy() for v in names]
+    weights = mask_weights(mask, len(df))
+
+    cp = CrossProducts(names)
+    for start in range(0, len(weights), MASK_CHUNK_ROWS):
+        rows = slice(start, start + MASK_CHUNK_ROWS)
+        if weights[rows].any():
+            cp.update(np.column_stack([col[rows] for col in columns]), weights[rows])
+
+    n = cp.n
+    if n < 10:
+        raise ValueError(f"Insufficient observations: {n}")
 
-    residuals = y - X @ beta
-    s2 = np.sum(residuals ** 2) / (n - 2)
-    se = np.sqrt(s2 * XtX_inv[1, 1])
+    fit = cp.ols(y_var, x_vars)
+    if not fit.keep[1]:
+        raise ValueError(f"{x_vars[0]} has no variation")
 
-    t_stat = beta[1] / se
-    # Approximate p-value
-    p_value = 2 * (1 - min(0.99999, 0.5 + 0.5 * (1 - (1 + t_stat**2 / (n-2))**(-(n-2)/2))))
+    s2 = fit.ssr / (n - fit.rank)
+    se = np.sqrt(s2 * fit.XtX_inv[1, 1])
+    p_value = two_sided_pvalue(fit.beta[1] / se, n - fit.rank)
 
     return {
-        'coefficient': beta[1],
+        'coefficient': fit.beta[1],
         'std_error': se,
         'p_value': p_value,
         'n_obs': n
     }
 
 
-def run_placebo_time(
+def run_simple_ols(
     df: pd.DataFrame,
-    n_placebos: int = 5,
-    pre_period_end: int = 11
-) -> list[RobustnessResult]:
+    y_var: str,
+    x_var: str,
+    mask: Optional[np.ndarray] = None
+) -> dict:
+    """Run simple OLS (optionally on a masked sample) and return coefficient, SE, p-value."""
+    return masked_ols(df, y_var, [x_var], mask)
+
+
+# ============================================================
+# SAMPLE RESTRICTIONS
+# ============================================================
+
+def _mask_pre_period(df: pd.DataFrame, pre_period_end) -> np.ndarray:
+    """Periods up to ``pre_period_end``."""
+    return (df['period'] <= pre_period_end).to_numpy()
+
+
+def _mask_trim_endpoints(df: pd.DataFrame) -> np.ndarray:
+    """Drop the first and last periods."""
+    periods = df['period']
+    return ((periods > periods.min()) & (periods < periods.max())).to_numpy()
+
+
+def _mask_subsample(df: pd.DataFrame, frac: float, seed: int) -> np.ndarray:
+    """Random subsample of rows, as row positions (the rows df.sample would draw)."""
+    n = len(df)
+    return np.random.RandomState(seed).choice(n, size=round(frac * n), replace=False)
+
+
+def _mask_trim_outliers(df: pd.DataFrame, lower: float, upper: float) -> np.ndarray:
+    """Drop outcomes outside the [lower, upper] quantiles."""
+    outcome = df[OUTCOME_VAR]
+    return ((outcome >= outcome.quantile(lower)) & (outcome <= outcome.quantile(upper))).to_numpy()
+
+
+SAMPLE_RESTRICTIONS = {
+    'pre_period': _mask_pre_period,
+    'trim_endpoints': _mask_trim_endpoints,
+    'subsample': _mask_subsample,
+    'trim_outliers': _mask_trim_outliers,
+}
+
+
+def restriction_mask(df: pd.DataFrame, restriction: str, **params) -> np.ndarray:
     """
-    Run placebo tests using fake treatment timing.
+    Boolean or index mask for a named sample restriction.
 
     Parameters
     ----------
     df : pd.DataFrame
-        Panel data
-    n_placebos : int
-        Number of placebo tests to run
-    pre_period_end : int
-        Last pre-treatment period
+        Column store the mask indexes
+    restriction : str
+        Name from SAMPLE_RESTRICTIONS
+    **params
+        Restriction parameters (e.g. ``frac`` and ``seed`` for 'subsample')
 
     Returns
     -------
-    list[RobustnessResult]
-        Results from placebo tests
+    np.ndarray
+        Boolean mask or row positions
     """
-    results = []
+    if restriction not in SAMPLE_RESTRICTIONS:
+        raise ValueError(f"Unknown sample restriction: {restriction}")
+    return SAMPLE_RESTRICTIONS[restriction](df, **params)
+
+
+# ============================================================
+# ROBUSTNESS CHECKS
+# ============================================================
+
+def _check_main(df: pd.DataFrame) -> dict:
+    """Baseline regression of the outcome on treatment."""
+    return run_simple_ols(df, OUTCOME_VAR, TREATMENT_VAR)
+
+
+def _check_with_control(df: pd.DataFrame, control: str) -> dict:
+    """Regression of the outcome on treatment and one control."""
+    return masked_ols(df, OUTCOME_VAR, [TREATMENT_VAR, control])
+
 
-    # Get pre-treatment periods for placebo
+def _check_placebo(df: pd.DataFrame, placebo_period, pre_period_end) -> dict:
+    """Fake treatment from ``placebo_period`` on the pre-treatment sample."""
+    placebo_treat = df['period'] >= placebo_period
+    if 'ever_treated' in df.columns:
+        placebo_treat &= df['ever_treated'] == 1
+
+    return masked_ols(
+        df, OUTCOME_VAR, ['placebo_treat'],
+        mask=restriction_mask(df, 'pre_period', pre_period_end=pre_period_end),
+        extra={'placebo_treat': placebo_treat.to_numpy(dtype=float)}
+    )
+
+
+def _check_sample(df: pd.DataFrame, restriction: str, **params) -> dict:
+    """Baseline regression on a restricted sample."""
+    return run_simple_ols(df, OUTCOME_VAR, TREATMENT_VAR, mask=restriction_mask(df, restriction, **params))
+
+
+def placebo_tasks(
+    df: pd.DataFrame,
+    n_placebos: int = 5,
+    pre_period_end: int = 11
+) -> list[RobustnessTask]:
+    """Placebo timing checks, one per fake treatment date."""
     if 'period' not in df.columns:
-        return results
+        return []
 
     periods = sorted(df['period'].unique())
     pre_periods = [p for p in periods if p < pre_period_end]
@@ -153,36 +335,85 @@ def run_placebo_time(
 
     # Select placebo periods
     placebo_periods = pre_periods[-(n_placebos + 1):-1]
+    columns = [OUTCOME_VAR, 'period'] + [c for c in ['ever_treated'] if c in df.columns]
+
+    return [
+        RobustnessTask(
+            name=f'placebo_t{placebo_period}',
+            test_type='placebo',
+            description=f'Placebo treatment at period {placebo_period}',
+            columns=columns,
+            check=_check_placebo,
+            kwargs={'placebo_period': placebo_period, 'pre_period_end': pre_period_end}
+        )
+        for placebo_period in placebo_periods
+    ]
 
-    for i, placebo_period in enumerate(placebo_periods):
-        # Create fake treatment based on placebo period
-        df_placebo = df[df['period'] <= pre_period_end].copy()
 
-        if 'ever_treated' in df_placebo.columns:
-            df_placebo['placebo_treat'] = (
-                (df_placebo['ever_treated'] == 1) &
-                (df_placebo['period'] >= placebo_period)
-            ).astype(int)
-        else:
-            df_placebo['placebo_treat'] = (
-                (df_placebo['period'] >= placebo_period)
-            ).astype(int)
+def sample_tasks(df: pd.DataFrame) -> list[RobustnessTask]:
+    """Sample restriction checks."""
+    tasks = []
+    base = [OUTCOME_VAR, TREATMENT_VAR]
 
-        try:
-            result = run_simple_ols(df_placebo, OUTCOME_VAR, 'placebo_treat')
-            results.append(RobustnessResult(
-                test_name=f'placebo_t{placebo_period}',
-                test_type='placebo',
-                coefficient=result['coefficient'],
-                std_error=result['std_error'],
-                p_value=result['p_value'],
-                n_obs=result['n_obs'],
-                description=f'Placebo treatment at period {placebo_period}'
-            ))
-        except Exception as e:
-            print(f"    Placebo period {placebo_period} failed: {e}")
+    # Excluding first and last periods
+    if 'period' in df.columns and df['period'].nunique() > 4:
+        tasks.append(RobustnessTask(
+            'trim_endpoints', 'sample', 'Excluding first and last periods',
+            base + ['period'], _check_sample, {'restriction': 'trim_endpoints'}
+        ))
 
-    return results
+    tasks.append(RobustnessTask(
+        'subsample_80', 'sample', 'Random 80% subsample',
+        base, _check_sample, {'restriction': 'subsample', 'frac': 0.8, 'seed': 42}
+    ))
+    tasks.append(RobustnessTask(
+        'trim_outliers', 'sample', 'Excluding 1st and 99th percentile outcomes',
+        base, _check_sample, {'restriction': 'trim_outliers', 'lower': 0.01, 'upper': 0.99}
+    ))
+    return tasks
+
+
+def specification_tasks(df: pd.DataFrame) -> list[RobustnessTask]:
+    """Alternative specification checks."""
+    tasks = [RobustnessTask(
+        'main', 'specification', 'Main specification (baseline)',
+        [OUTCOME_VAR, TREATMENT_VAR], _check_main
+    )]
+
+    # Add first covariate as control if available
+    covariates = [c for c in df.columns if c.startswith('covariate_')]
+    if covariates:
+        tasks.append(RobustnessTask(
+            'with_control', 'specification', f'Including {covariates[0]} as control',
+            [OUTCOME_VAR, TREATMENT_VAR, covariates[0]], _check_with_control,
+            {'control': covariates[0]}
+        ))
+    return tasks
+
+
+def run_placebo_time(
+    df: pd.DataFrame,
+    n_placebos: int = 5,
+    pre_period_end: int = 11
+) -> list[RobustnessResult]:
+    """
+    Run placebo tests using fake treatment timing.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Panel data
+    n_placebos : int
+        Number of placebo tests to run
+    pre_period_end : int
+        Last pre-treatment period
+
+    Returns
+    -------
+    list[RobustnessResult]
+        Results from placebo tests
+    """
+    return run_robustness_tasks(df, placebo_tasks(df, n_placebos, pre_period_end))
 
 
 def run_sample_restrictions(df: pd.DataFrame) -> list[RobustnessResult]:
@@ -199,69 +430,7 @@ def run_sample_restrictions(df: pd.DataFrame) -> list[RobustnessResult]:
     list[RobustnessResult]
         Results from sample restriction tests
     """
-    results = []
-
-    # Test 1: Excluding first and last periods
-    if 'period' in df.columns:
-        periods = df['period'].unique()
-        if len(periods) > 4:
-            df_trim = df[
-                (df['period'] > periods.min()) &
-                (df['period'] < periods.max())
-            ]
-            try:
-                result = run_simple_ols(df_trim, OUTCOME_VAR, TREATMENT_VAR)
-                results.append(RobustnessResult(
-                    test_name='trim_endpoints',
-                    test_type='sample',
-                    coefficient=result['coefficient'],
-                    std_error=result['std_error'],
-                    p_value=result['p_value'],
-                    n_obs=result['n_obs'],
-                    description='Excluding first and last periods'
-                ))
-            except Exception:
-                pass
-
-    # Test 2: Random subsample (80%)
-    np.random.seed(42)
-    df_subsample = df.sample(frac=0.8)
-    try:
-        result = run_simple_ols(df_subsample, OUTCOME_VAR, TREATMENT_VAR)
-        results.append(RobustnessResult(
-            test_name='subsample_80',
-            test_type='sample',
-            coefficient=result['coefficient'],
-            std_error=result['std_error'],
-            p_value=result['p_value'],
-            n_obs=result['n_obs'],
-            description='Random 80% subsample'
-        ))
-    except Exception:
-        pass
-
-    # Test 3: Exclude extreme outcomes
-    q01 = df[OUTCOME_VAR].quantile(0.01)
-    q99 = df[OUTCOME_VAR].quantile(0.99)
-    df_trim_outcomes = df[
-        (df[OUTCOME_VAR] >= q01) &
-        (df[OUTCOME_VAR] <= q99)
-    ]
-    try:
-        result = run_simple_ols(df_trim_outcomes, OUTCOME_VAR, TREATMENT_VAR)
-        results.append(RobustnessResult(
-            test_name='trim_outliers',
-            test_type='sample',
-            coefficient=result['coefficient'],
-            std_error=result['std_error'],
-            p_value=result['p_value'],
-            n_obs=result['n_obs'],
-            description='Excluding 1st and 99th percentile outcomes'
-        ))
-    except Exception:
-        pass
-
-    return results
+    return run_robustness_tasks(df, sample_tasks(df))
 
 
 def run_alternative_specs(df: pd.DataFrame) -> list[RobustnessResult]:
@@ -278,59 +447,435 @@ def run_alternative_specs(df: pd.DataFrame) -> list[RobustnessResult]:
     list[RobustnessResult]
         Results from alternative specifications
     """
-    results = []
+    return run_robustness_tasks(df, specification_tasks(df))
+
+
+# ============================================================
+# ROBUSTNESS SCHEDULER
+# ============================================================
 
-    # Main estimate for comparison
+# Per-worker (shared panel, tasks), set once by _init_task_worker
+_TASK_STATE: Optional[tuple] = None
+
+
+def _execute_task(
+    task: RobustnessTask,
+    df: pd.DataFrame
+) -> tuple[str, Optional[RobustnessResult], Optional[str]]:
+    """Run one check on its column projection; errors are returned."""
     try:
-        main = run_simple_ols(df, OUTCOME_VAR, TREATMENT_VAR)
-        results.append(RobustnessResult(
-            test_name='main',
-            test_type='specification',
-            coefficient=main['coefficient'],
-            std_error=main['std_error'],
-            p_value=main['p_value'],
-            n_obs=main['n_obs'],
-            description='Main specification (baseline)'
-        ))
-    except Exception:
-        pass
+        result = task.check(df[task.columns], **task.kwargs)
+    except Exception as e:
+        return task.name, None, str(e)
 
-    # Add covariates if available
-    covariates = [c for c in df.columns if c.startswith('covariate_')]
-    if covariates:
-        # Run with first covariate as control
-        df_cov = df[[OUTCOME_VAR, TREATMENT_VAR, covariates[0]]].dropna()
-        n = len(df_cov)
-        if n >= 10:
-            y = df_cov[OUTCOME_VAR].values
-            X = np.column_stack([
-                np.ones(n),
-                df_cov[TREATMENT_VAR].values,
-                df_cov[covariates[0]].values
-            ])
-
-            try:
-                XtX_inv = np.linalg.inv(X.T @ X)
-                beta = XtX_inv @ X.T @ y
-                residuals = y - X @ beta
-                s2 = np.sum(residuals ** 2) / (n - 3)
-                se = np.sqrt(s2 * XtX_inv[1, 1])
-                t_stat = beta[1] / se
-                p_value = 2 * (1 - min(0.99999, 0.5 + 0.5 * (1 - (1 + t_stat**2 / (n-3))**(-(n-3)/2))))
-
-                results.append(RobustnessResult(
-                    test_name='with_control',
-                    test_type='specification',
-                    coefficient=beta[1],
-                    std_error=se,
-                    p_value=p_value,
-                    n_obs=n,
-                    description=f'Including {covariates[0]} as control'
-                ))
-            except Exception:
-                pass
-
-    return results
+    return task.name, RobustnessResult(
+        test_name=task.name,
+        test_type=task.test_type,
+        coefficient=result['coefficient'],
+        std_error=result['std_error'],
+        p_value=result['p_value'],
+        n_obs=result['n_obs'],
+        description=task.description
+    ), None
+
+
+def _init_task_worker(paths: dict, tasks: list[RobustnessTask]):
+    """Map the shared panel in a worker."""
+    global _TASK_STATE
+    _TASK_STATE = (load_shared_columns(paths), tasks)
+
+
+def _run_task(index: int) -> tuple[int, str, Optional[RobustnessResult], Optional[str]]:
+    """Run one scheduled check inside a worker."""
+    df, tasks = _TASK_STATE
+    return (index,) + _execute_task(tasks[index], df)
+
+
+def run_robustness_tasks(
+    df: pd.DataFrame,
+    tasks: list[RobustnessTask],
+    jobs: int = 1,
+    output: Optional[str] = None,
+    verbose: bool = True
+) -> list[RobustnessResult]:
+    """
+    Run robustness checks serially or in a process pool.
+
+    For ``jobs > 1`` the union of the columns the tasks declare is
+    written once as .npy files and memory-mapped read-only by every
+    worker, so the panel is neither pickled nor copied per check; each
+    check only sees its own column projection. With ``output`` each
+    result is appended to that diagnostics file as soon as it finishes.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Panel data
+    tasks : list[RobustnessTask]
+        Checks to run
+    jobs : int
+        Worker processes
+    output : str, optional
+        Diagnostic name to append results to (e.g. 'robustness_results')
+    verbose : bool
+        Print failed checks
+
+    Returns
+    -------
+    list[RobustnessResult]
+        Successful results, in the order of ``tasks``
+    """
+    done = {}
+
+    def record(index, name, result, error):
+        if error is not None:
+            if verbose:
+                print(f"    {name} failed: {error}")
+            return
+        done[index] = result
+        if output:
+            save_diagnostic(pd.DataFrame([result.to_dict()]), output, append=True)
+
+    if jobs <= 1 or len(tasks) <= 1:
+        for index, task in enumerate(tasks):
+            record(index, *_execute_task(task, df))
+    else:
+        columns = [c for c in dict.fromkeys(c for task in tasks for c in task.columns) if c in df.columns]
+        methods = mp.get_all_start_methods()
+        ctx = mp.get_context('fork' if 'fork' in methods else 'spawn')
+
+        with tempfile.TemporaryDirectory(prefix='panel_') as shared_dir:
+            paths = share_columns(df, columns, shared_dir)
+            with ctx.Pool(
+                processes=min(jobs, len(tasks)),
+                initializer=_init_task_worker,
+                initargs=(paths, tasks)
+            ) as pool:
+                for outcome in pool.imap_unordered(_run_task, range(len(tasks))):
+                    record(*outcome)
+
+    return [done[i] for i in sorted(done)]
+
+
+# ============================================================
+# RANDOMIZATION INFERENCE
+# ============================================================
+
+_WORKER_STATE: Optional[tuple] = None
+
+
+def _permutation_batch(
+    path_scores: Optional[np.ndarray],
+    outcome_wide: np.ndarray,
+    paths: np.ndarray,
+    path_codes: np.ndarray,
+    denominator: float,
+    threshold: float,
+    n_perm: int,
+    seed: np.random.SeedSequence
+) -> tuple[int, float, float]:
+    """
+    Exceedances, sum and sum of squares of permuted coefficients.
+
+    Without a ``path_scores`` table, each permutation sums y~ against
+    the paths its units receive directly.
+    """
+    rng = np.random.default_rng(seed)
+    n_units = len(path_codes)
+    exceed, total, total_sq = 0, 0.0, 0.0
+
+    row_bytes = 16 if path_scores is not None else 8 * (paths.shape[1] + 2)
+    batch = max(1, RI_BATCH_BYTES // (row_bytes * n_units))
+    for start in range(0, n_perm, batch):
+        size = min(batch, n_perm - start)
+        assigned = rng.permuted(np.broadcast_to(path_codes, (size, n_units)), axis=1)
+        if path_scores is not None:
+            coef = path_scores[np.arange(n_units), assigned].sum(axis=1) / denominator
+        else:
+            coef = np.einsum('it,bit->b', outcome_wide, paths[assigned]) / denominator
+        exceed += int((np.abs(coef) >= threshold).sum())
+        total += coef.sum()
+        total_sq += coef @ coef
+
+    return exceed, total, total_sq
+
+
+def _init_permutation_worker(state: tuple):
+    """Store the unit-by-path score table in a worker."""
+    global _WORKER_STATE
+    _WORKER_STATE = state
+
+
+def _run_permutation_batch(task: tuple[int, np.random.SeedSequence]) -> tuple[int, float, float]:
+    """Run one batch of permutations inside a worker."""
+    n_perm, seed = task
+    return _permutation_batch(*_WORKER_STATE, n_perm, seed)
+
+
+def run_randomization_inference(
+    df: pd.DataFrame,
+    n_permutations: int = RI_PERMUTATIONS,
+    fe_vars: Optional[list[str]] = None,
+    unit_var: str = 'id',
+    time_var: str = 'period',
+    jobs: int = 1,
+    seed: int = RI_SEED,
+    fe_cache: Optional[FECache] = None
+) -> RobustnessResult:
+    """
+    Randomization inference for the fixed-effects treatment coefficient.
+
+    Whole treatment paths are reassigned across units. Since the
+    outcome is demeaned once, a permuted coefficient is D_perm'y~ over
+    D'MD, and D_perm'y~ only depends on which path each unit receives:
+    a (units x distinct paths) table of y~ summed against every path is
+    built with one matrix product, and each permutation is a gather and
+    a sum over units. When paths are so irregular that the table would
+    exceed RI_TABLE_BYTES (distinct paths approach the number of units),
+    each permutation instead sums y~ against its assigned paths, which
+    costs units x periods per permutation but no extra memory. With unit
+    and time fixed effects on a balanced panel D'MD is the same for
+    every permutation, so the permuted values are exactly the
+    re-estimated coefficients; otherwise the statistic is the
+    observed-denominator rescaling, which still gives an exact test of
+    the sharp null. Permutations run in batches, in a process pool when
+    ``jobs > 1``, and results do not depend on ``jobs``.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Panel data
+    n_permutations : int
+        Random permutations of unit treatment paths
+    fe_vars : list, optional
+        Fixed effects to absorb (default: unit and time FE present in df)
+    unit_var : str
+        Unit identifier
+    time_var : str
+        Period identifier
+    jobs : int
+        Worker processes
+    seed : int
+        Random seed
+    fe_cache : FECache, optional
+        Cache of demeaned columns shared with estimation
+
+    Returns
+    -------
+    RobustnessResult
+        Observed coefficient, standard deviation of the permutation
+        distribution and the permutation p-value (1 + #{|b*| >= |b|}) / (1 + B)
+    """
+    if fe_vars is None:
+        fe_vars = [fe for fe in (UNIT_FE, TIME_FE) if fe in df.columns]
+    needed = list(dict.fromkeys([OUTCOME_VAR, TREATMENT_VAR, unit_var, time_var] + fe_vars))
+    df_valid = df.loc[df[needed].notna().all(axis=1), needed]
+    if len(df_valid) < 10:
+        raise ValueError(f"Insufficient observations: {len(df_valid)}")
+
+    if fe_vars:
+        demeaned = demean_by_fe(df_valid, OUTCOME_VAR, [TREATMENT_VAR], fe_vars, cache=fe_cache)
+    else:
+        demeaned = df_valid[[OUTCOME_VAR, TREATMENT_VAR]] - df_valid[[OUTCOME_VAR, TREATMENT_VAR]].mean()
+    y_tilde = demeaned[OUTCOME_VAR].to_numpy(dtype=float)
+    d_tilde = demeaned[TREATMENT_VAR].to_numpy(dtype=float)
+    treatment = df_valid[TREATMENT_VAR].to_numpy(dtype=float)
+
+    denominator = float(treatment @ d_tilde)
+    if denominator <= 0:
+        raise ValueError(f"{TREATMENT_VAR} has no variation within fixed effects")
+    coefficient = float(treatment @ y_tilde) / denominator
+
+    # Unit x period layout; a unit's path is its treatment, filled across its gaps
+    units, unit_idx = np.unique(df_valid[unit_var].to_numpy(), return_inverse=True)
+    periods, period_idx = np.unique(df_valid[time_var].to_numpy(), return_inverse=True)
+    paths_wide = np.full((len(units), len(periods)), np.nan)
+    paths_wide[unit_idx, period_idx] = treatment
+    paths_wide = pd.DataFrame(paths_wide).ffill(axis=1).bfill(axis=1).to_numpy()
+    paths, path_codes = np.unique(paths_wide, axis=0, return_inverse=True)
+
+    outcome_wide = np.zeros((len(units), len(periods)))
+    outcome_wide[unit_idx, period_idx] = y_tilde
+    path_scores = None
+    if 8 * len(units) * len(paths) <= RI_TABLE_BYTES:
+        path_scores = outcome_wide @ paths.T             # [i, k]: sum_t y~_it path_k(t)
+
+    state = (
+        path_scores, outcome_wide, paths, path_codes.ravel(),
+        denominator, abs(coefficient) * (1 - 1e-12)
+    )
+    sizes = [min(RI_TASK_SIZE, n_permutations - start) for start in range(0, n_permutations, RI_TASK_SIZE)]
+    tasks = list(zip(sizes, np.random.SeedSequence(seed).spawn(len(sizes))))
+
+    if jobs <= 1 or len(tasks) <= 1:
+        counts = [_permutation_batch(*state, n, s) for n, s in tasks]
+    else:
+        methods = mp.get_all_start_methods()
+        ctx = mp.get_context('fork' if 'fork' in methods else 'spawn')
+        with ctx.Pool(
+            processes=min(jobs, len(tasks)),
+            initializer=_init_permutation_worker,
+            initargs=(state,)
+        ) as pool:
+            counts = list(pool.imap_unordered(_run_permutation_batch, tasks))
+
+    exceed, total, total_sq = (sum(c[j] for c in counts) for j in range(3))
+    mean = total / n_permutations
+    std = np.sqrt(max(total_sq / n_permutations - mean ** 2, 0.0))
+
+    return RobustnessResult(
+        test_name='randomization_inference',
+        test_type='randomization',
+        coefficient=coefficient,
+        std_error=float(std),
+        p_value=(1 + exceed) / (1 + n_permutations),
+        n_obs=len(df_valid),
+        description=f'{n_permutations:,} permutations of unit treatment paths'
+    )
+
+
+# ============================================================
+# LEAVE-ONE-CLUSTER-OUT
+# ============================================================
+
+def leave_one_cluster_out(
+    df: pd.DataFrame,
+    spec_name: str = 'baseline',
+    cluster_var: Optional[str] = None,
+    fe_cache: Optional[FECache] = None
+) -> pd.DataFrame:
+    """
+    Treatment coefficient with each cluster left out, for every cluster.
+
+    One sorted pass collects each cluster's X_g'X_g and X_g'u_g. Dropping
+    cluster g then changes the coefficient by
+    (X'X)^{-1} (I - X_g'X_g (X'X)^{-1})^{-1} X_g'u_g, the
+    Sherman-Morrison-Woodbury update written in k x k form, so all G
+    leave-one-out coefficients come from G small batched solves instead
+    of G re-estimations. Fixed effects are absorbed once on the full
+    sample, so the coefficients are exact only when every fixed effect
+    is nested within clusters (e.g. unit FE with unit clusters). When one
+    is not (the baseline's time FE with unit clusters), dropping a
+    cluster would also shift the other clusters' demeaned values, which
+    the update ignores: the coefficients are then an approximation
+    (errors of a few percent of the largest influence on test panels)
+    and the ``exact`` column is False.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Panel data
+    spec_name : str
+        Specification from stage 03's registry
+    cluster_var : str, optional
+        Cluster variable (default: the specification's first cluster
+        variable, or 'id')
+    fe_cache : FECache, optional
+        Cache of demeaned columns shared with estimation
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per cluster: cluster, n_obs, coefficient without the
+        cluster, influence (change from the full-sample coefficient),
+        influence in full-sample standard errors, and exact (whether
+        the coefficients are exact rather than approximate)
+    """
+    if spec_name not in SPECIFICATIONS:
+        raise ValueError(f"Unknown specification: {spec_name}")
+    spec = SPECIFICATIONS[spec_name]
+    if cluster_var is None:
+        clusters = [spec['cluster']] if isinstance(spec['cluster'], str) else (spec['cluster'] or ['id'])
+        cluster_var = clusters[0]
+
+    x_vars = [TREATMENT_VAR] + spec['controls']
+    all_vars = list(dict.fromkeys([OUTCOME_VAR] + x_vars + spec['fe'] + [cluster_var]))
+    df_valid = df.loc[df[all_vars].notna().all(axis=1), all_vars]
+    exact = all(
+        df_valid.groupby(fe, sort=False)[cluster_var].nunique().max() <= 1 for fe in spec['fe']
+    )
+    if spec['fe']:
+        df_valid = demean_by_fe(df_valid, OUTCOME_VAR, x_vars, spec['fe'], cache=fe_cache)
+
+    n = len(df_valid)
+    y = df_valid[OUTCOME_VAR].to_numpy(dtype=float)
+    X = np.column_stack([np.ones(n)] + [df_valid[x].to_numpy(dtype=float) for x in x_vars])
+    codes, labels = pd.factorize(df_valid[cluster_var], sort=True)
+
+    fit = least_squares(X, y)
+    if not fit.keep[1]:
+        raise ValueError(f"{TREATMENT_VAR} is collinear with the other regressors")
+    X = X[:, fit.keep]
+    k = X.shape[1]
+    beta = fit.beta[fit.keep]
+    XtX_inv = fit.XtX_inv
+
+    # Per-cluster X_g'X_g (upper triangle) and scores X_g'u_g in one pass
+    upper = np.triu_indices(k)
+    sums = cluster_score_sums(
+        np.column_stack([X[:, upper[0]] * X[:, upper[1]], X * fit.residuals[:, None], np.ones(n)]),
+        codes
+    )
+    G = len(sums)
+    XtX_g = np.zeros((G, k, k))
+    XtX_g[:, upper[0], upper[1]] = sums[:, :len(upper[0])]
+    XtX_g[:, upper[1], upper[0]] = sums[:, :len(upper[0])]
+    scores = sums[:, len(upper[0]):-1]
+    n_obs = sums[:, -1].astype(int)
+
+    # Woodbury: beta_(-g) = beta - (X'X)^{-1} (I - X_g'X_g (X'X)^{-1})^{-1} X_g'u_g
+    M = np.eye(k) - XtX_g @ XtX_inv
+    singular = np.linalg.cond(M) > LOCO_MAX_COND
+    M[singular] = np.eye(k)
+    shift = np.linalg.solve(M, scores[:, :, None])[:, :, 0] @ XtX_inv
+    coefficient = beta[1] - shift[:, 1]
+    coefficient[singular] = np.nan
+
+    se = np.sqrt(fit.ssr / (n - k) * XtX_inv[1, 1])
+    influence = coefficient - beta[1]
+
+    return pd.DataFrame({
+        'cluster': np.asarray(labels),
+        'n_obs': n_obs,
+        'coefficient': coefficient,
+        'influence': influence,
+        'influence_se': influence / se,
+        'exact': exact,
+    })
+
+
+def loco_summary(influence: pd.DataFrame) -> RobustnessResult:
+    """
+    Jackknife summary of leave-one-cluster-out coefficients.
+
+    The standard error is the delete-one-cluster jackknife
+    sqrt((G - 1) / G * sum (b_(-g) - mean)^2), tested against t(G - 1).
+    The description says when the coefficients are approximate (see
+    :func:`leave_one_cluster_out`).
+    """
+    coefs = influence['coefficient'].dropna().to_numpy()
+    G = len(coefs)
+    if G < 2:
+        raise ValueError(f"Insufficient clusters: {G}")
+
+    full = float((influence['coefficient'] - influence['influence']).dropna().iloc[0])
+    se = float(np.sqrt((G - 1) / G * ((coefs - coefs.mean()) ** 2).sum()))
+    top = influence.at[influence['influence'].abs().idxmax(), 'cluster']
+    approximate = 'exact' in influence and not influence['exact'].all()
+
+    return RobustnessResult(
+        test_name='leave_one_cluster_out',
+        test_type='jackknife',
+        coefficient=full,
+        std_error=se,
+        p_value=two_sided_pvalue(full / se, G - 1),
+        n_obs=int(influence['n_obs'].sum()),
+        description=(
+            f'Jackknife over {G:,} clusters; range [{coefs.min():.4f}, {coefs.max():.4f}], '
+            f'largest shift from dropping {top}'
+            + ('; approximate (fixed effects not nested in clusters)' if approximate else '')
+        )
+    )
 
 
 # ============================================================
@@ -341,6 +886,9 @@ def main(
     run_placebos: bool = True,
     run_samples: bool = True,
     run_specs: bool = True,
+    n_permutations: int = RI_PERMUTATIONS,
+    run_loco: bool = True,
+    jobs: int = 1,
     verbose: bool = True
 ):
     """
@@ -354,6 +902,12 @@ def main(
         Run sample restriction tests
     run_specs : bool
         Run alternative specification tests
+    n_permutations : int
+        Treatment permutations for randomization inference (0 to skip)
+    run_loco : bool
+        Run the leave-one-cluster-out influence check
+    jobs : int
+        Worker processes for the robustness checks and randomization inference
     verbose : bool
         Print detailed output
     """
@@ -378,30 +932,52 @@ def main(
     df = load_data(input_path)
     print(f"    -> {len(df):,} rows")
 
-    all_results = []
-
-    # Run alternative specifications
+    # Declare the battery; results are appended to the output as they finish
+    tasks = []
     if run_specs:
-        print("\n  Running alternative specifications...")
-        spec_results = run_alternative_specs(df)
-        all_results.extend(spec_results)
-        print(f"    Completed {len(spec_results)} tests")
-
-    # Run placebo tests
+        tasks += specification_tasks(df)
     if run_placebos:
-        print("\n  Running placebo tests...")
-        placebo_results = run_placebo_time(df)
-        all_results.extend(placebo_results)
-        print(f"    Completed {len(placebo_results)} tests")
-
-    # Run sample restrictions
+        tasks += placebo_tasks(df)
     if run_samples:
-        print("\n  Running sample restriction tests...")
-        sample_results = run_sample_restrictions(df)
-        all_results.extend(sample_results)
-        print(f"    Completed {len(sample_results)} tests")
+        tasks += sample_tasks(df)
+
+    results_path = diag_dir / 'robustness_results.csv'
+    if results_path.exists():
+        results_path.unlink()
+
+    print(f"\n  Running {len(tasks)} robustness checks ({jobs} worker{'s' if jobs > 1 else ''})...")
+    all_results = run_robustness_tasks(df, tasks, jobs=jobs, output='robustness_results')
+    for test_type in dict.fromkeys(t.test_type for t in tasks):
+        n_done = sum(r.test_type == test_type for r in all_results)
+        print(f"    {test_type}: completed {n_done} tests")
+
+    # Randomization inference
+    if n_permutations > 0 and {'id', 'period'} <= set(df.columns):
+        print(f"\n  Running randomization inference ({n_permutations:,} permutations)...")
+        try:
+            ri_result = run_randomization_inference(df, n_permutations=n_permutations, jobs=jobs)
+            all_results.append(ri_result)
+            save_diagnostic(pd.DataFrame([ri_result.to_dict()]), 'robustness_results', append=True)
+            print(f"    Permutation p-value: {ri_result.p_value:.4f}")
+        except Exception as e:
+            print(f"    Randomization inference failed: {e}")
+
+    # Leave-one-cluster-out influence
+    if run_loco and 'id' in df.columns:
+        print("\n  Running leave-one-cluster-out...")
+        try:
+            influence = leave_one_cluster_out(df)
+            save_diagnostic(influence, 'leave_one_cluster_out')
+            loco_result = loco_summary(influence)
+            all_results.append(loco_result)
+            save_diagnostic(pd.DataFrame([loco_result.to_dict()]), 'robustness_results', append=True)
+            print(f"    {len(influence):,} clusters -> leave_one_cluster_out.csv")
+            if not influence['exact'].all():
+                print("    Note: approximate, fixed effects are not nested in clusters")
+        except Exception as e:
+            print(f"    Leave-one-cluster-out failed: {e}")
 
-    # Save results
+    # Rewrite in declared order
     if all_results:
         results_df = pd.DataFrame([r.to_dict() for r in all_results])
         save_diagnostic(results_df, 'robustness_results')
@@ -73,6 +73,10 @@ def plot_event_study(
     """
     Create event study plot.
 
+    Plots the estimated lead/lag coefficients from
+    data_work/diagnostics/event_study.csv when the estimation stage has
+    written them, and raw outcome means by event time otherwise.
+
     Parameters
     ----------
     df : pd.DataFrame
@@ -89,14 +93,31 @@ def plot_event_study(
     Path
         Path to saved figure
     """
-    if 'event_time' not in df.columns:
+    try:
+        estimates = load_diagnostic('event_study').set_index('event_time')
+    except FileNotFoundError:
+        estimates = None
+
+    if estimates is None and 'event_time' not in df.columns:
         print("  Warning: No event_time column, skipping event study plot")
         return None
 
-    # Calculate means by event time
-    df_valid = df[df['event_time'].notna()].copy()
-    event_means = df_valid.groupby('event_time')[OUTCOME_VAR].agg(['mean', 'std', 'count'])
-    event_means['se'] = event_means['std'] / np.sqrt(event_means['count'])
+    if estimates is not None:
+        # Regression coefficients relative to the omitted period
+        event_means = pd.DataFrame({
+            'mean': estimates['coefficient'],
+            'lower': estimates['ci_lower'],
+            'upper': estimates['ci_upper'],
+        })
+        ylabel = f'Effect on {OUTCOME_VAR.title()} (relative to reference period)'
+    else:
+        # Calculate means by event time
+        df_valid = df[df['event_time'].notna()].copy()
+        event_means = df_valid.groupby('event_time')[OUTCOME_VAR].agg(['mean', 'std', 'count'])
+        se = event_means['std'] / np.sqrt(event_means['count'])
+        event_means['lower'] = event_means['mean'] - 1.96 * se
+        event_means['upper'] = event_means['mean'] + 1.96 * se
+        ylabel = f'Mean {OUTCOME_VAR.title()}'
 
     # Filter to desired range
     event_means = event_means[
@@ -108,11 +129,11 @@ def plot_event_study(
 
     colors = get_color_palette('treatment')
 
-    # Plot means with confidence bands
+    # Plot estimates with confidence bands
     ax.fill_between(
         event_means.index,
-        event_means['mean'] - 1.96 * event_means['se'],
-        event_means['mean'] + 1.96 * event_means['se'],
+        event_means['lower'],
+        event_means['upper'],
         alpha=0.2,
         color=colors[0]
     )
@@ -123,7 +144,7 @@ def plot_event_study(
     ax.axvline(0, color='black', linestyle='--', linewidth=1, alpha=0.7, label='Treatment')
 
     ax.set_xlabel('Event Time (periods relative to treatment)')
-    ax.set_ylabel(f'Mean {OUTCOME_VAR.title()}')
+    ax.set_ylabel(ylabel)
     ax.set_title('Event Study: Dynamic Treatment Effects')
     ax.legend(loc='upper left')
 
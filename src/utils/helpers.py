@@ -383,7 +383,8 @@ def load_diagnostic(name: str, subdir: str = '') -> 'pd.DataFrame':
 def save_diagnostic(
     df: 'pd.DataFrame',
     name: str,
-    subdir: str = ''
+    subdir: str = '',
+    append: bool = False
 ) -> Path:
     """
     Save a diagnostic DataFrame to data_work/diagnostics/.
@@ -396,6 +397,8 @@ def save_diagnostic(
         Name for the output file (without .csv extension)
     subdir : str
         Optional subdirectory within diagnostics/
+    append : bool
+        Append rows (without header) to an existing file
 
     Returns
     -------
@@ -408,11 +411,71 @@ def save_diagnostic(
 
     ensure_dir(diag_dir)
     path = diag_dir / f'{name}.csv'
-    df.to_csv(path, index=False)
+    if append and path.exists():
+        df.to_csv(path, mode='a', header=False, index=False)
+    else:
+        df.to_csv(path, index=False)
 
     return path
 
 
+def share_columns(
+    df: 'pd.DataFrame',
+    columns: list[str],
+    directory: Union[str, Path]
+) -> dict[str, Path]:
+    """
+    Write DataFrame columns as .npy files for worker processes to memory-map.
+
+    Boolean columns are stored as 0.0/1.0 (True is 1.0), so treatment or
+    sample indicators keep their meaning. Non-numeric columns are stored
+    as float codes (NaN for missing), so they can still serve as group,
+    cluster or count keys.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Source data
+    columns : list
+        Columns to share (the projection workers need)
+    directory : str or Path
+        Existing directory for the files
+
+    Returns
+    -------
+    dict
+        Column name -> .npy path, for :func:`load_shared_columns`
+    """
+    import numpy as np
+    import pandas as pd
+
+    paths = {}
+    for col in columns:
+        values = df[col]
+        if pd.api.types.is_bool_dtype(values):
+            arr = values.to_numpy(dtype=float, na_value=np.nan)
+        elif pd.api.types.is_numeric_dtype(values):
+            arr = values.to_numpy(dtype=float, na_value=np.nan) if values.hasnans else values.to_numpy()
+        else:
+            codes = pd.factorize(values)[0].astype(float)
+            codes[codes < 0] = np.nan
+            arr = codes
+        paths[col] = Path(directory) / f'{len(paths)}.npy'
+        np.save(paths[col], arr)
+    return paths
+
+
+def load_shared_columns(paths: dict[str, Path]) -> 'pd.DataFrame':
+    """DataFrame backed by read-only memory-mapped columns from :func:`share_columns`."""
+    import numpy as np
+    import pandas as pd
+
+    return pd.DataFrame(
+        {col: np.load(path, mmap_mode='r') for col, path in paths.items()},
+        copy=False
+    )
+
+
 # ============================================================
 # CONFIGURATION MANAGEMENT
 # ============================================================
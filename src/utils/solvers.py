@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Least squares solvers for the estimation stages.
+
+This module solves OLS problems through a Cholesky factorization of X'X
+or a QR factorization of X, never forming an explicit inverse of X'X
+for the coefficients and never allocating a k x n intermediate.
+Regressors that are (numerically) collinear with earlier ones are
+dropped, keeping the earliest columns, as R's lm and Stata do.
+
+It also provides :class:`CrossProducts`, which accumulates [1 Z]'[1 Z]
+for a set of columns in one pass (or chunk by chunk) so that any
+regression among those columns can be solved without revisiting rows.
+
+Usage
+-----
+from utils.solvers import least_squares, solve_normal_equations, CrossProducts
+
+fit = least_squares(X, y)
+beta = fit.beta[fit.keep]
+V = s2 * fit.XtX_inv          # over kept columns
+
+cp = CrossProducts.from_frame(df, ['y', 'x1', 'x2'])
+fit = cp.ols('y', ['x1'])     # coefficients for [const, x1]
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Literal, TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# ============================================================
+# CONFIGURATION
+# ============================================================
+
+# A column is collinear when less than this share of its sum of squares
+# is left after projecting on the earlier (kept) columns
+COLLINEARITY_TOL = 1e-10
+
+
+# ============================================================
+# DATA STRUCTURES
+# ============================================================
+
+@dataclass
+class LeastSquaresFit:
+    """
+    Solution of a least squares problem.
+
+    ``beta`` has one entry per input column (NaN for dropped columns);
+    ``XtX_inv`` covers only the kept columns, in their original order.
+    """
+    beta: np.ndarray
+    XtX_inv: np.ndarray
+    keep: np.ndarray
+    ssr: float
+    residuals: Optional[np.ndarray] = None
+
+    @property
+    def rank(self) -> int:
+        """Number of kept columns."""
+        return int(self.keep.sum())
+
+    @property
+    def dropped(self) -> list[int]:
+        """Indices of columns dropped as collinear."""
+        return np.flatnonzero(~self.keep).tolist()
+
+
+# ============================================================
+# SOLVERS
+# ============================================================
+
+def solve_normal_equations(
+    XtX: np.ndarray,
+    Xty: np.ndarray,
+    tol: float = COLLINEARITY_TOL
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Solve X'X b = X'y by Cholesky, dropping collinear columns.
+
+    The factor is built one column at a time; a column whose remaining
+    pivot is below ``tol`` times its diagonal is dropped, so earlier
+    columns are always preferred. Works directly on cross-products, so
+    it also serves sufficient-statistics estimators.
+
+    Parameters
+    ----------
+    XtX : np.ndarray
+        (k, k) cross-product matrix
+    Xty : np.ndarray
+        (k,) or (k, m) right-hand side(s)
+    tol : float
+        Relative pivot tolerance
+
+    Returns
+    -------
+    tuple
+        (beta with NaN for dropped columns, (r, r) inverse of the kept
+        block, boolean keep mask)
+    """
+    from scipy.linalg import cho_solve
+
+    L, keep = _ordered_cholesky(XtX, tol)
+    factor = (L, True)
+
+    Xty = np.asarray(Xty, dtype=float)
+    beta = np.full(Xty.shape, np.nan)
+    beta[keep] = cho_solve(factor, Xty[keep])
+    XtX_inv = cho_solve(factor, np.eye(len(L)))
+
+    return beta, XtX_inv, keep
+
+
+def least_squares(
+    X: np.ndarray,
+    y: np.ndarray,
+    method: Literal['cholesky', 'qr'] = 'cholesky',
+    tol: float = COLLINEARITY_TOL
+) -> LeastSquaresFit:
+    """
+    Ordinary least squares without an explicit inverse.
+
+    ``'cholesky'`` factors X'X (fast, fine for well-conditioned designs);
+    ``'qr'`` factors X itself, which squares the condition number less,
+    and solves the semi-normal equations R'R b = X'y with one step of
+    iterative refinement. Neither stores Q or any k x n product.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        (n, k) design matrix
+    y : np.ndarray
+        (n,) outcome
+    method : str
+        'cholesky' or 'qr'
+    tol : float
+        Relative tolerance for dropping collinear columns
+
+    Returns
+    -------
+    LeastSquaresFit
+        Coefficients, kept-column inverse, keep mask, SSR and residuals
+    """
+    from scipy.linalg import cho_solve
+
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    if method == 'cholesky':
+        beta, XtX_inv, keep = solve_normal_equations(X.T @ X, X.T @ y, tol)
+        X_keep = X if keep.all() else X[:, keep]
+        residuals = y - X_keep @ beta[keep]
+
+    elif method == 'qr':
+        R = np.linalg.qr(X, mode='r')
+        col_ss = (R ** 2).sum(axis=0)
+        keep = np.diag(R) ** 2 > tol * col_ss
+        keep &= col_ss > 0
+
+        X_keep = X if keep.all() else X[:, keep]
+        if not keep.all():
+            # R of the kept columns, from the small k x r block
+            R = np.linalg.qr(R[:, keep], mode='r')
+
+        factor = (R.T, True)
+        b = cho_solve(factor, X_keep.T @ y)
+        residuals = y - X_keep @ b
+        b += cho_solve(factor, X_keep.T @ residuals)
+        residuals = y - X_keep @ b
+
+        beta = np.full(X.shape[1], np.nan)
+        beta[keep] = b
+        XtX_inv = cho_solve(factor, np.eye(len(R)))
+
+    else:
+        raise ValueError(f"Unknown solver method: {method}")
+
+    return LeastSquaresFit(
+        beta=beta,
+        XtX_inv=XtX_inv,
+        keep=keep,
+        ssr=float(residuals @ residuals),
+        residuals=residuals
+    )
+
+
+def _ordered_cholesky(XtX: np.ndarray, tol: float) -> tuple[np.ndarray, np.ndarray]:
+    """Lower Cholesky factor of the kept block, adding columns in order."""
+    from scipy.linalg import solve_triangular
+
+    XtX = np.asarray(XtX, dtype=float)
+    k = len(XtX)
+    L = np.zeros((k, k))
+    keep = np.zeros(k, dtype=bool)
+    r = 0
+
+    for j in range(k):
+        diag = XtX[j, j]
+        if diag <= 0:
+            continue
+
+        cross = XtX[keep, j]
+        row = solve_triangular(L[:r, :r], cross, lower=True) if r else cross
+        pivot = diag - row @ row
+        if pivot <= tol * diag:
+            continue
+
+        L[r, :r] = row
+        L[r, r] = np.sqrt(pivot)
+        keep[j] = True
+        r += 1
+
+    return L[:r, :r], keep
+
+
+# ============================================================
+# SUFFICIENT STATISTICS
+# ============================================================
+
+class CrossProducts:
+    """
+    Cross-product matrix [1 Z]'[1 Z] over a set of columns.
+
+    Row 0 / column 0 is the constant, so the matrix also holds n and the
+    column sums. Accumulated with :meth:`update` (one pass, or one call
+    per chunk); any OLS of one column on others, with or without a
+    constant, is then solved from a sub-block by :meth:`ols`. Row
+    weights give weighted cross-products [1 Z]'W[1 Z]; 0/1 weights
+    restrict the sample without subsetting the rows.
+    """
+
+    def __init__(self, columns: list[str]):
+        self.columns = list(columns)
+        self.matrix = np.zeros((len(self.columns) + 1,) * 2)
+        self._index = {col: j + 1 for j, col in enumerate(self.columns)}
+
+    @property
+    def n(self) -> int:
+        """Rows accumulated."""
+        return int(self.matrix[0, 0])
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: 'pd.DataFrame',
+        columns: list[str],
+        weights: Optional[np.ndarray] = None
+    ) -> CrossProducts:
+        """Cross-products over the rows of ``df`` complete on all ``columns``."""
+        cp = cls(columns)
+        cp.update(df[cp.columns].to_numpy(dtype=float), weights)
+        return cp
+
+    def update(self, values: np.ndarray, weights: Optional[np.ndarray] = None) -> CrossProducts:
+        """
+        Add (rows, m) values in column order; rows with NaN are skipped.
+
+        ``weights`` (rows,) multiplies each row's contribution; n then
+        counts the total weight.
+        """
+        values = np.asarray(values, dtype=float)
+        complete = np.isfinite(values).all(axis=1)
+        if weights is not None:
+            weights = np.asarray(weights, dtype=float)
+            complete &= weights != 0
+        if not complete.all():
+            values = values[complete]
+            weights = weights[complete] if weights is not None else None
+
+        if weights is None:
+            sums = values.sum(axis=0)
+            self.matrix[0, 0] += len(values)
+            self.matrix[1:, 1:] += values.T @ values
+        else:
+            sums = weights @ values
+            self.matrix[0, 0] += weights.sum()
+            self.matrix[1:, 1:] += (values * weights[:, None]).T @ values
+        self.matrix[0, 1:] += sums
+        self.matrix[1:, 0] += sums
+        return self
+
+    def merge(self, other: CrossProducts) -> CrossProducts:
+        """Add another accumulator over the same columns."""
+        if other.columns != self.columns:
+            raise ValueError("Cannot merge cross-products over different columns")
+        self.matrix += other.matrix
+        return self
+
+    def ols(
+        self,
+        y: str,
+        x_vars: list[str],
+        constant: bool = True,
+        tol: float = COLLINEARITY_TOL
+    ) -> LeastSquaresFit:
+        """
+        Solve the regression of ``y`` on ``x_vars`` from the sub-block.
+
+        Coefficients are ordered [const] + x_vars; ``residuals`` is None.
+        """
+        cols = ([0] if constant else []) + [self._index[x] for x in x_vars]
+        j = self._index[y]
+
+        beta, XtX_inv, keep = solve_normal_equations(
+            self.matrix[np.ix_(cols, cols)], self.matrix[cols, j], tol
+        )
+        kept = np.asarray(cols)[keep]
+        ssr = self.matrix[j, j] - beta[keep] @ self.matrix[kept, j]
+
+        return LeastSquaresFit(beta=beta, XtX_inv=XtX_inv, keep=keep, ssr=max(float(ssr), 0.0))
+
+    def total_ss(self, y: str) -> float:
+        """Sum of squares of ``y`` around its mean."""
+        j = self._index[y]
+        return float(self.matrix[j, j] - self.matrix[0, j] ** 2 / self.n)
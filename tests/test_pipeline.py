@@ -36,6 +36,11 @@ class TestParseArgs:
             assert args.cmd == 'run_estimation'
             assert args.specification == 'baseline'
             assert args.sample == 'full'
+            assert args.streaming is False
+            assert args.run_all is False
+            assert args.jobs == 1
+            assert args.fe_cache is False
+            assert args.bootstrap is None
 
     def test_run_estimation_with_options(self):
         """Parse run_estimation with custom options."""
@@ -45,6 +50,74 @@ class TestParseArgs:
             assert args.specification == 'robust'
             assert args.sample == 'subset'
 
+    def test_run_estimation_jobs(self):
+        """Parse run_estimation with all specifications in parallel."""
+        from pipeline import parse_args
+        with patch('sys.argv', ['pipeline.py', 'run_estimation', '--all', '--jobs', '4']):
+            args = parse_args()
+            assert args.run_all is True
+            assert args.jobs == 4
+
+    def test_run_estimation_fe_cache(self):
+        """Parse run_estimation with the persistent FE cache."""
+        from pipeline import parse_args
+        with patch('sys.argv', ['pipeline.py', 'run_estimation', '--fe-cache']):
+            args = parse_args()
+            assert args.fe_cache is True
+
+    def test_run_estimation_bootstrap(self):
+        """Parse run_estimation with wild bootstrap settings."""
+        from pipeline import parse_args
+        with patch('sys.argv', ['pipeline.py', 'run_estimation', '--bootstrap', 'webb',
+                                '--n-boot', '999', '--seed', '7']):
+            args = parse_args()
+            assert (args.bootstrap, args.n_boot, args.seed) == ('webb', 999, 7)
+
+    def test_run_estimation_streaming(self):
+        """Parse run_estimation with streaming flag."""
+        from pipeline import parse_args
+        with patch('sys.argv', ['pipeline.py', 'run_estimation', '--streaming']):
+            args = parse_args()
+            assert args.streaming is True
+
+    def test_estimate_robustness_options(self):
+        """Parse estimate_robustness with permutation count and workers."""
+        from pipeline import parse_args
+        with patch('sys.argv', ['pipeline.py', 'estimate_robustness']):
+            args = parse_args()
+            assert args.permutations == 9_999
+            assert args.jobs == 1
+        with patch('sys.argv', ['pipeline.py', 'estimate_robustness', '--permutations', '500', '--jobs', '4']):
+            args = parse_args()
+            assert args.permutations == 500
+            assert args.jobs == 4
+
+    def test_link_records_workers(self):
+        """Parse link_records with worker count."""
+        from pipeline import parse_args
+        with patch('sys.argv', ['pipeline.py', 'link_records', '--workers', '4']):
+            args = parse_args()
+            assert args.workers == 4
+            assert args.streaming is False
+            assert args.sources is None
+            assert args.fuzzy_key is None
+
+    def test_link_records_sources(self):
+        """Parse link_records with sources and a fuzzy key."""
+        from pipeline import parse_args
+        with patch('sys.argv', ['pipeline.py', 'link_records', '--sources', 'a.parquet', 'b.parquet',
+                                '--fuzzy-key', 'name', 'firm_name', '--workers', '2']):
+            args = parse_args()
+            assert args.sources == ['a.parquet', 'b.parquet']
+            assert args.fuzzy_key == ['name', 'firm_name']
+
+    def test_link_records_streaming(self):
+        """Parse link_records with streaming flag."""
+        from pipeline import parse_args
+        with patch('sys.argv', ['pipeline.py', 'link_records', '--streaming']):
+            args = parse_args()
+            assert args.streaming is True
+
     def test_review_new_discipline(self):
         """Parse review_new with discipline option."""
         from pipeline import parse_args
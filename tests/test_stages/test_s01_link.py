@@ -0,0 +1,617 @@
+#!/usr/bin/env python3
+"""
+Tests for src/stages/s01_link.py
+
+Tests cover:
+- Streaming (bucketed) exact joins against the in-memory merge
+- Blocked fuzzy matching against a brute-force reference
+- One-to-one assignment (greedy and optimal)
+- Candidate generation bounds
+- Similarity cache reuse and LRU eviction
+- Fellegi-Sunter probabilistic matching
+- Spatial matching against a brute-force haversine scan
+"""
+from __future__ import annotations
+
+import pytest
+import pandas as pd
+import numpy as np
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from stages.s01_link import (
+    exact_match,
+    streaming_exact_match,
+    fuzzy_match,
+    one_to_one_assignment,
+    spatial_match,
+    haversine_distance,
+    probabilistic_match,
+    FieldComparison,
+    block_pairs,
+    compare_fields,
+    fit_fellegi_sunter,
+    QGramIndex,
+    load_qgram_index,
+    SimilarityCache,
+    load_similarity_cache,
+    _levenshtein_similarity,
+    _levenshtein_distance,
+    _levenshtein_batch,
+    _edit_budget,
+    _jaro_winkler_similarity,
+    jaro_winkler_batch,
+    _encode_strings,
+    _normalize_strings,
+)
+
+
+def _brute_force_matches(left: list, right: list, threshold: float, method: str) -> list:
+    """Reference matcher: first right value with the highest passing score."""
+    scorers = {
+        'levenshtein': _levenshtein_similarity,
+        'jaro_winkler': _jaro_winkler_similarity,
+        'contains': lambda a, b: 1.0 if a.lower() in b.lower() else 0.0,
+    }
+    matches = []
+    for left_val in left:
+        best, best_score = None, 0
+        for right_val in right:
+            score = scorers[method](left_val, right_val)
+            if score > best_score and score >= threshold:
+                best, best_score = right_val, score
+        matches.append(best)
+    return matches
+
+
+@pytest.fixture
+def name_pairs() -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Short random names over a small alphabet, so many pairs are close."""
+    rng = np.random.default_rng(7)
+
+    def name():
+        return ''.join(rng.choice(list('abcdeAB'), size=rng.integers(0, 8)))
+
+    right = pd.DataFrame({'name': list(dict.fromkeys(name() for _ in range(150)))})
+    left = pd.DataFrame({'query': [name() for _ in range(80)]})
+    return left, right
+
+
+class TestStreamingExactMatch:
+    """Tests for the out-of-core exact join."""
+
+    def test_matches_in_memory_merge(self, temp_dir):
+        """Bucketed joins should reproduce exact_match rows and counts."""
+        rng = np.random.default_rng(5)
+        left = pd.DataFrame({
+            'id': rng.integers(0, 400, 1000),
+            'x': rng.random(1000),
+            'label': rng.choice(['a', 'b'], 1000),
+        })
+        right = pd.DataFrame({'id': np.arange(0, 400, 3), 'label': 'r', 'z': 1.5})
+        left.to_parquet(temp_dir / 'left.parquet', index=False)
+        right.to_parquet(temp_dir / 'right.parquet', index=False)
+
+        result = streaming_exact_match(
+            temp_dir / 'left.parquet', temp_dir / 'right.parquet', 'id',
+            temp_dir / 'out.parquet', n_buckets=7, batch_size=128
+        )
+        expected, expected_result = exact_match(left, right, on='id')
+        got = pd.read_parquet(temp_dir / 'out.parquet')
+
+        order = ['id', 'x']
+        pd.testing.assert_frame_equal(
+            got.sort_values(order).reset_index(drop=True),
+            expected.sort_values(order).reset_index(drop=True),
+        )
+        assert result.n_matched == expected_result.n_matched
+        assert result.n_unmatched == expected_result.n_unmatched
+        assert result.n_source == len(right)
+        assert not list(temp_dir.glob('linkage_buckets_*'))
+
+
+class TestFuzzyMatch:
+    """Tests for the blocked fuzzy matching engine."""
+
+    @pytest.mark.parametrize('method', ['levenshtein', 'contains', 'jaro_winkler'])
+    @pytest.mark.parametrize('threshold', [0.0, 0.6, 0.8, 0.95])
+    def test_qgram_blocking_is_lossless(self, name_pairs, method, threshold):
+        """Q-gram blocking should find the same matches as a full scan."""
+        left, right = name_pairs
+        merged, _ = fuzzy_match(left, right, 'query', 'name', threshold, method)
+        expected = _brute_force_matches(
+            left['query'].tolist(), right['name'].tolist(), threshold, method
+        )
+        got = [None if pd.isna(v) else v for v in merged['name']]
+        assert got == expected
+
+    @pytest.mark.parametrize('threshold', [0.7, 0.9])
+    def test_unblocked_jaro_winkler(self, name_pairs, threshold):
+        """Without blocking, Jaro-Winkler should match a full scan."""
+        left, right = name_pairs
+        merged, _ = fuzzy_match(
+            left, right, 'query', 'name', threshold, 'jaro_winkler', blocking=None
+        )
+        expected = _brute_force_matches(
+            left['query'].tolist(), right['name'].tolist(), threshold, 'jaro_winkler'
+        )
+        got = [None if pd.isna(v) else v for v in merged['name']]
+        assert got == expected
+
+    def test_jaro_winkler_without_shared_grams(self):
+        """Jaro-Winkler matches sharing no q-gram are still found by default."""
+        left, right = pd.DataFrame({'query': ['bdBd']}), pd.DataFrame({'name': ['AbaBbdcB']})
+        merged, _ = fuzzy_match(left, right, 'query', 'name', 0.6, 'jaro_winkler')
+
+        assert _jaro_winkler_similarity('bdBd', 'AbaBbdcB') >= 0.6
+        assert merged['name'].tolist() == ['AbaBbdcB']
+
+    def test_linkage_result_counts(self):
+        """Matched and unmatched counts should cover every left row."""
+        left = pd.DataFrame({'name': ['Jon Smith', 'Mary Jones', 'Zzz']})
+        right = pd.DataFrame({'name_ref': ['John Smith', 'Mary Jones'], 'x': [1, 2]})
+
+        merged, result = fuzzy_match(left, right, 'name', 'name_ref', threshold=0.8)
+
+        assert merged['x'].tolist()[:2] == [1, 2]
+        assert result.n_matched == 2
+        assert result.n_unmatched == 1
+        assert result.match_type == 'fuzzy_levenshtein'
+
+    def test_top_k_candidates(self):
+        """Top-k candidate generation should still pick the closest value."""
+        left = pd.DataFrame({'name': ['Jon Smith', 'Mary Jonse']})
+        right = pd.DataFrame({'ref': ['John Smith', 'Mary Jones', 'Mary Jane']})
+
+        merged, _ = fuzzy_match(left, right, 'name', 'ref', threshold=0.7, top_k=2)
+
+        assert merged['ref'].tolist() == ['John Smith', 'Mary Jones']
+
+    def test_parallel_matches_serial(self, name_pairs):
+        """Sharding across worker processes should not change the output."""
+        left, right = name_pairs
+
+        serial, serial_result = fuzzy_match(left, right, 'query', 'name', 0.7, batch_size=16)
+        parallel, parallel_result = fuzzy_match(
+            left, right, 'query', 'name', 0.7, batch_size=16, workers=2
+        )
+
+        pd.testing.assert_frame_equal(serial, parallel)
+        assert serial_result.n_matched == parallel_result.n_matched
+
+    def test_missing_reference_values(self):
+        """Missing reference values should not corrupt other scores."""
+        left = pd.DataFrame({'name': ['a', 'smith']})
+        right = pd.DataFrame({'ref': ['aaba', None, 'smyth']})
+
+        merged, _ = fuzzy_match(left, right, 'name', 'ref', threshold=0.5)
+
+        assert pd.isna(merged['ref'].iloc[0])
+        assert merged['ref'].iloc[1] == 'smyth'
+
+    def test_unknown_method_raises(self):
+        """Unknown methods should raise ValueError."""
+        df = pd.DataFrame({'a': ['x']})
+        with pytest.raises(ValueError):
+            fuzzy_match(df, df, 'a', 'a', method='soundex')
+
+
+class TestOneToOneAssignment:
+    """Tests for one-to-one fuzzy linkage."""
+
+    @staticmethod
+    def _sequential_greedy(left, right, score, left_cap, right_cap):
+        """Reference greedy assignment, one pair at a time."""
+        left_cap, right_cap = left_cap.copy(), right_cap.copy()
+        assigned = {}
+        for k in np.lexsort((right, left, -score)):
+            take = min(left_cap[left[k]], right_cap[right[k]])
+            if take:
+                left_cap[left[k]] -= take
+                right_cap[right[k]] -= take
+                assigned[(left[k], right[k])] = take
+        return assigned
+
+    def test_greedy_matches_sequential(self):
+        """Vectorized greedy rounds should reproduce the sequential pass."""
+        rng = np.random.default_rng(2)
+        for _ in range(20):
+            key = np.unique(rng.integers(0, 30 * 30, 200))
+            left, right = np.divmod(key, 30)
+            score = rng.choice([0.6, 0.8, 0.9, 1.0], len(key))
+            left_cap, right_cap = rng.integers(1, 4, 30), rng.integers(1, 4, 30)
+
+            got = one_to_one_assignment(left, right, score, left_cap, right_cap)
+
+            assert dict(zip(zip(got[0], got[1]), got[2])) == self._sequential_greedy(
+                left, right, score, left_cap, right_cap
+            )
+
+    def test_optimal_beats_greedy(self):
+        """Optimal assignment should maximise total score."""
+        left = np.array([0, 0, 1])
+        right = np.array([0, 1, 0])
+        score = np.array([0.9, 0.8, 0.85])
+
+        greedy = one_to_one_assignment(left, right, score)
+        optimal = one_to_one_assignment(left, right, score, method='optimal')
+
+        assert list(zip(greedy[0], greedy[1])) == [(0, 0)]
+        assert sorted(zip(optimal[0], optimal[1])) == [(0, 1), (1, 0)]
+
+    @pytest.mark.parametrize('assignment', ['greedy', 'optimal'])
+    def test_each_right_row_used_once(self, assignment):
+        """Duplicate values should be linked record by record."""
+        left = pd.DataFrame({'name': ['Jon Smith', 'Jon Smith', 'John Smyth', 'Mary']})
+        right = pd.DataFrame({'ref': ['John Smith', 'John Smith', 'Mary Jones'], 'rid': [1, 2, 3]})
+
+        merged, result = fuzzy_match(
+            left, right, 'name', 'ref', threshold=0.7, assignment=assignment
+        )
+
+        assert len(merged) == len(left)
+        assert sorted(merged['rid'].dropna()) == [1, 2]
+        assert result.n_matched == 2
+
+    def test_parallel_matches_serial(self, name_pairs):
+        """Sharded pair collection should not change the assignment."""
+        left, right = name_pairs
+
+        serial, _ = fuzzy_match(left, right, 'query', 'name', 0.6, batch_size=16, assignment='greedy')
+        parallel, _ = fuzzy_match(
+            left, right, 'query', 'name', 0.6, batch_size=16, assignment='greedy', workers=2
+        )
+
+        pd.testing.assert_frame_equal(serial, parallel)
+
+
+class TestQGramIndex:
+    """Tests for candidate generation."""
+
+    def test_candidates_respect_length_bounds(self):
+        """Levenshtein candidates should satisfy the length filter."""
+        index = QGramIndex(['abc', 'abcd', 'abcdefgh', 'xyz'])
+        codes, lengths = _encode_strings(_normalize_strings(['abcd']))
+
+        _, right_id = index.candidates(codes, lengths, 0.75, 'levenshtein')
+
+        assert sorted(index.values[right_id]) == ['abc', 'abcd']
+
+    def test_prefix_blocking(self):
+        """Prefix blocking should only pair strings with the same lead."""
+        index = QGramIndex(['Smith', 'Smyth', 'Psmith'])
+        codes, lengths = _encode_strings(_normalize_strings(['smith']))
+
+        _, right_id = index.candidates(codes, lengths, 0.5, 'levenshtein', 'prefix')
+
+        assert sorted(index.values[right_id]) == ['smith', 'smyth']
+
+    def test_top_k_ranks_by_shared_grams(self):
+        """Top-k candidates should be ordered by shared gram count."""
+        index = QGramIndex(['smith', 'smythe', 'jones', 'smit'])
+        codes, lengths = _encode_strings(_normalize_strings(['smith']))
+
+        _, right_id, shared = index.top_k(codes, lengths, k=2)
+
+        assert list(index.values[right_id]) == ['smith', 'smit']
+        assert shared[0] > shared[1]
+
+    def test_save_and_load_roundtrip(self, temp_dir):
+        """A loaded index should return the same candidates."""
+        values = ['Anna Berg', 'Ann Berg', 'Hans Bergman']
+        index = QGramIndex(values)
+        loaded = QGramIndex.load(index.save(temp_dir / 'index.npz'))
+
+        codes, lengths = _encode_strings(_normalize_strings(['anna berg']))
+        expected = index.candidates(codes, lengths, 0.7, 'levenshtein')
+        got = loaded.candidates(codes, lengths, 0.7, 'levenshtein')
+
+        assert all(np.array_equal(a, b) for a, b in zip(expected, got))
+        assert list(loaded.values) == list(index.values)
+
+    def test_load_qgram_index_caches(self, temp_dir):
+        """The cached index should be reused for unchanged reference values."""
+        values = ['alpha', 'beta', 'gamma']
+
+        load_qgram_index(values, index_dir=temp_dir)
+        cached = list(temp_dir.glob('qgram_*.npz'))
+        load_qgram_index(values, index_dir=temp_dir)
+        load_qgram_index(values + ['delta'], index_dir=temp_dir)
+
+        assert len(cached) == 1
+        assert len(list(temp_dir.glob('qgram_*.npz'))) == 2
+
+
+class TestJaroWinklerBatch:
+    """Tests for the vectorized Jaro-Winkler kernel."""
+
+    def test_matches_scalar(self):
+        """Batch scores should equal the scalar function exactly."""
+        rng = np.random.default_rng(9)
+        words = [
+            ''.join(rng.choice(list('abcAé'), size=rng.integers(0, 10))) for _ in range(2000)
+        ]
+        left, right = words[:1000], words[1000:]
+
+        got = jaro_winkler_batch(left, right)
+        expected = [_jaro_winkler_similarity(a, b) for a, b in zip(left, right)]
+
+        assert got.tolist() == expected
+
+    def test_known_values(self):
+        """Classic examples and edge cases."""
+        got = jaro_winkler_batch(['MARTHA', 'dixon', '', 'abc'], ['marhta', 'dicksonx', '', ''])
+        np.testing.assert_allclose(got, [0.961111, 0.813333, 1.0, 0.0], atol=1e-6)
+
+    def test_length_mismatch_raises(self):
+        """Unaligned inputs should raise ValueError."""
+        with pytest.raises(ValueError):
+            jaro_winkler_batch(['a'], ['a', 'b'])
+
+
+class TestSimilarityCache:
+    """Tests for the persistent pair-score cache."""
+
+    @pytest.mark.parametrize('method', ['levenshtein', 'jaro_winkler'])
+    def test_cached_runs_match_uncached(self, name_pairs, method):
+        """Reusing cached scores across thresholds should not change matches."""
+        left, right = name_pairs
+        cache = SimilarityCache(method)
+
+        for threshold in (0.9, 0.6, 0.8, 0.95):
+            expected, _ = fuzzy_match(left, right, 'query', 'name', threshold, method)
+            got, _ = fuzzy_match(left, right, 'query', 'name', threshold, method, cache=cache)
+            pd.testing.assert_frame_equal(got, expected)
+
+        assert len(cache) > 0
+
+    @staticmethod
+    def _keys(*pairs: tuple[str, str]) -> np.ndarray:
+        """Cache keys for (left, right) string pairs."""
+        left, right = zip(*pairs)
+        return SimilarityCache.pair_keys(
+            SimilarityCache.string_hashes(left), SimilarityCache.string_hashes(right)
+        )
+
+    def test_keys_hold_both_digests(self):
+        """Keys are order-sensitive 128-bit digests of both strings."""
+        keys = self._keys(('ab', 'c'), ('a', 'bc'), ('c', 'ab'), ('ab', 'c'))
+
+        assert keys.dtype == SimilarityCache.key_dtype()
+        assert len(set(keys[:3].tolist())) == 3
+        assert keys[0] == keys[3]
+
+    def test_bounds_answer_higher_thresholds_only(self):
+        """A below-threshold bound is a hit only at the same or higher threshold."""
+        cache = SimilarityCache('levenshtein')
+        keys = self._keys(('a', 'x'), ('b', 'y'))
+        cache.store(keys, np.array([0.0, 0.75]), threshold=0.7)
+        cache.flush()
+
+        scores, hit = cache.lookup(keys, 0.8)
+        assert hit.tolist() == [True, True]
+        assert scores.tolist() == [0.0, 0.75]
+
+        _, hit = cache.lookup(keys, 0.5)
+        assert hit.tolist() == [False, True]
+
+    def test_lru_eviction(self):
+        """Entries not used recently should be evicted first."""
+        cache = SimilarityCache('jaro_winkler', max_entries=2)
+        k1, k2, k3 = self._keys(('a', 'a'), ('b', 'b'), ('c', 'c'))
+        cache.store(np.array([k1, k2]), np.array([0.1, 0.2]), 0.0)
+        cache.flush()
+
+        cache.clock += 1
+        cache.lookup(np.array([k1]), 0.0)
+        cache.store(np.array([k3]), np.array([0.3]), 0.0)
+        cache.flush()
+
+        assert sorted(cache.keys.tolist()) == sorted([k1, k3])
+
+    def test_persistent_cache_roundtrip(self, temp_dir):
+        """Saved caches should load with their entries and a newer clock."""
+        cache = load_similarity_cache('levenshtein', cache_dir=temp_dir)
+        keys = self._keys(('a', 'b'), ('c', 'd'))
+        cache.store(keys, np.array([0.9, 1.0]), 0.8)
+        cache.save()
+
+        loaded = load_similarity_cache('levenshtein', cache_dir=temp_dir)
+        scores, hit = loaded.lookup(keys, 0.8)
+
+        assert len(loaded) == 2
+        assert hit.all() and scores.tolist() == [0.9, 1.0]
+        assert loaded.clock == cache.clock + 1
+
+    def test_old_format_starts_empty(self, temp_dir):
+        """A cache written in an older format is replaced by an empty one."""
+        np.savez(temp_dir / 'scores_levenshtein.npz', version=1)
+        assert len(load_similarity_cache('levenshtein', cache_dir=temp_dir)) == 0
+
+
+class TestLevenshteinKernel:
+    """Tests for the bounded edit-distance kernels."""
+
+    @pytest.mark.parametrize('s1,s2,expected', [
+        ('kitten', 'sitting', 3),
+        ('Flaw', 'lawn', 2),
+        ('', 'abc', 3),
+        ('ABC', 'abc', 0),
+    ])
+    def test_distance(self, s1, s2, expected):
+        """Unbounded distance should be the exact edit distance."""
+        assert _levenshtein_distance(s1, s2) == expected
+
+    def test_bound_stops_early(self):
+        """Distances beyond the bound are reported as bound + 1."""
+        assert _levenshtein_distance('abcdefgh', 'stuvwxyz', max_dist=2) == 3
+        assert _levenshtein_distance('a', 'abcdef', max_dist=2) == 3
+
+    def test_threshold_keeps_passing_scores(self):
+        """Scores meeting the threshold should be unchanged by the bound."""
+        words = ['martha', 'marhta', 'dixon', 'dicksonx', 'jones', 'johnson', '']
+        for s1 in words:
+            for s2 in words:
+                full = _levenshtein_similarity(s1, s2)
+                for threshold in (0.5, 0.7, 0.9):
+                    bounded = _levenshtein_similarity(s1, s2, threshold)
+                    if full >= threshold:
+                        assert bounded == full
+                    else:
+                        assert bounded == 0.0
+
+    def test_batch_matches_scalar(self):
+        """The vectorized kernel should agree with the scalar kernel."""
+        rng = np.random.default_rng(3)
+        words = [''.join(rng.choice(list('abc'), size=rng.integers(0, 12))) for _ in range(400)]
+        left, right = np.array(words[:200]), np.array(words[200:])
+        codes_l, len_l = _encode_strings(left)
+        codes_r, len_r = _encode_strings(right)
+        budget = _edit_budget(np.maximum(np.maximum(len_l, len_r), 1), 0.6)
+
+        distance = _levenshtein_batch(codes_l, len_l, codes_r, len_r, budget)
+
+        for k in range(len(left)):
+            expected = _levenshtein_distance(left[k], right[k], int(budget[k]))
+            assert distance[k] == expected
+
+
+@pytest.fixture
+def person_records() -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Reference persons and a noisy subset of them."""
+    rng = np.random.default_rng(11)
+    n = 400
+    right = pd.DataFrame({
+        'first': rng.choice(['anna', 'erik', 'karin', 'lars', 'maria', 'nils'], n),
+        'last': [f'berg{i}' for i in rng.integers(0, 300, n)],
+        'birth_year': rng.integers(1940, 2000, n),
+        'region': rng.integers(0, 5, n),
+        'rid': np.arange(n),
+    })
+    left = right.sample(150, random_state=3).reset_index(drop=True)
+    left['last'] = left['last'].str.replace('berg', 'burg')
+    left.loc[::10, 'birth_year'] = np.nan
+    return left, right
+
+
+class TestProbabilisticMatch:
+    """Tests for Fellegi-Sunter matching."""
+
+    def test_recovers_true_links(self, person_records):
+        """EM weights should link noisy records back to their source."""
+        left, right = person_records
+        comparisons = [
+            FieldComparison('first'),
+            FieldComparison('last', method='levenshtein', threshold=0.7),
+            FieldComparison('birth_year', method='numeric', tolerance=1),
+        ]
+
+        merged, result = probabilistic_match(
+            left.drop(columns='rid'), right, comparisons, block_on=['region']
+        )
+
+        assert (merged['rid'] == left['rid']).mean() > 0.95
+        assert merged['match_probability'].between(0, 1).all()
+        assert result.match_type == 'probabilistic'
+        assert result.n_matched + result.n_unmatched == len(left)
+        assert list(result.diagnostics['field']) == ['first', 'last', 'birth_year']
+
+    def test_em_separates_m_and_u(self, person_records):
+        """Agreement should be far more likely among matches."""
+        left, right = person_records
+        comparisons = [FieldComparison('first'), FieldComparison('birth_year', method='numeric')]
+        left_pos, right_pos = block_pairs(left, right, ['region'])
+
+        gamma = compare_fields(left, right, left_pos, right_pos, comparisons)
+        model = fit_fellegi_sunter(gamma, ['first', 'birth_year'])
+
+        assert (model.m > model.u).all()
+        assert 0 < model.prior < 0.1
+
+    def test_missing_values_are_neutral(self):
+        """Missing fields should be coded separately from disagreement."""
+        left = pd.DataFrame({'a': ['x', None, 'y']})
+        right = pd.DataFrame({'a': ['x', 'z', 'z']})
+        pos = np.arange(3)
+
+        gamma = compare_fields(left, right, pos, pos, [FieldComparison('a')])
+
+        assert gamma[:, 0].tolist() == [1, -1, 0]
+
+    def test_block_pairs(self):
+        """Blocking should only pair rows sharing every key."""
+        left = pd.DataFrame({'k': [1, 2, None]})
+        right = pd.DataFrame({'k': [2, 1, 2]})
+
+        left_pos, right_pos = block_pairs(left, right, ['k'])
+
+        assert sorted(zip(left_pos, right_pos)) == [(0, 1), (1, 0), (1, 2)]
+
+    def test_unknown_comparison_raises(self):
+        """Unknown comparison methods should raise ValueError."""
+        with pytest.raises(ValueError):
+            FieldComparison('a', method='soundex')
+
+
+@pytest.fixture
+def spatial_points() -> tuple[pd.DataFrame, pd.DataFrame, np.ndarray]:
+    """Query and reference points with their full distance matrix."""
+    from utils.synthetic_data import SyntheticDataGenerator
+
+    gen = SyntheticDataGenerator(seed=4)
+    left = gen.generate_spatial_data(n_points=300)
+    right = gen.generate_spatial_data(n_points=80)[['id', 'latitude', 'longitude']]
+    distance = haversine_distance(
+        left['latitude'].to_numpy()[:, None], left['longitude'].to_numpy()[:, None],
+        right['latitude'].to_numpy()[None, :], right['longitude'].to_numpy()[None, :]
+    )
+    return left, right, distance
+
+
+class TestSpatialMatch:
+    """Tests for KD-tree spatial matching."""
+
+    def test_haversine_known_distance(self):
+        """One degree of latitude is about 111.2 km."""
+        assert haversine_distance(0, 0, 1, 0) == pytest.approx(111.195, abs=0.01)
+
+    def test_nearest_matches_brute_force(self, spatial_points):
+        """Nearest neighbours should match a full distance scan."""
+        left, right, distance = spatial_points
+
+        merged, result = spatial_match(left, right, batch_size=64)
+
+        assert merged['id_right'].tolist() == right['id'].to_numpy()[distance.argmin(axis=1)].tolist()
+        np.testing.assert_allclose(merged['match_distance_km'], distance.min(axis=1))
+        assert result.match_type == 'spatial'
+        assert result.n_matched == len(left)
+
+    def test_radius_matches_brute_force(self, spatial_points):
+        """Radius matching should return every pair within the radius."""
+        left, right, distance = spatial_points
+
+        merged, result = spatial_match(left, right, method='radius', radius_km=8, batch_size=64)
+
+        within = distance <= 8
+        assert merged['match_distance_km'].notna().sum() == within.sum()
+        assert result.n_matched == within.any(axis=1).sum()
+        assert len(merged) == within.sum() + (~within.any(axis=1)).sum()
+
+    def test_missing_coordinates_unmatched(self):
+        """Rows without coordinates should not be linked."""
+        left = pd.DataFrame({'latitude': [0.0, np.nan], 'longitude': [179.99, 0.0]})
+        right = pd.DataFrame({'latitude': [0.0, 0.0], 'longitude': [-179.99, 170.0]})
+
+        merged, result = spatial_match(left, right)
+
+        assert merged['longitude_right'].iloc[0] == -179.99
+        assert result.n_unmatched == 1
+
+    def test_radius_requires_distance(self):
+        """Radius matching without a radius should raise ValueError."""
+        df = pd.DataFrame({'latitude': [0.0], 'longitude': [0.0]})
+        with pytest.raises(ValueError):
+            spatial_match(df, df, method='radius')
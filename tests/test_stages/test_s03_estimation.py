@@ -0,0 +1,717 @@
+#!/usr/bin/env python3
+"""
+Tests for src/stages/s03_estimation.py
+
+Tests cover:
+- Multi-way fixed effects absorption against dummy-variable least squares
+- Within transformation and fixed effects estimation
+- Reuse of demeaned columns across specifications and runs
+- Cluster-robust variance (one-way loop reference, multi-way CGM)
+- Specification sweeps from shared sufficient statistics
+- Streaming estimation from parquet against in-memory estimates
+- Parallel specification runs over a memory-mapped panel
+- Event-study leads and lags against a dense dummy regression
+"""
+from __future__ import annotations
+
+import pytest
+import pandas as pd
+import numpy as np
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from stages.s03_estimation import (
+    absorb_fe,
+    encode_fe,
+    demean_by_fe,
+    run_fe_estimation,
+    run_ols,
+    sweep_specifications,
+    run_streaming_estimation,
+    run_specifications,
+    event_study,
+    group_time_att,
+    SPECIFICATIONS,
+    cluster_score_sums,
+    cluster_vcov,
+    wild_cluster_bootstrap,
+    FECache,
+    load_fe_cache,
+    main,
+)
+
+
+@pytest.fixture
+def unbalanced_panel() -> pd.DataFrame:
+    """Unbalanced panel with unit and time effects and a staggered treatment."""
+    rng = np.random.default_rng(11)
+    n_units, n_periods = 80, 12
+    df = pd.DataFrame({
+        'id': np.repeat(np.arange(n_units), n_periods),
+        'period': np.tile(np.arange(n_periods), n_units),
+    })
+    df = df[rng.random(len(df)) > 0.3].reset_index(drop=True)
+
+    unit_effect = rng.normal(size=n_units)[df['id']]
+    time_effect = np.linspace(0, 2, n_periods)[df['period']]
+    start = rng.integers(4, 16, n_units)[df['id']]
+    df['treatment'] = (df['period'] >= start).astype(int)
+    df['outcome'] = 1.5 * df['treatment'] + unit_effect + time_effect + rng.normal(scale=0.1, size=len(df))
+    df['unit_fe'] = df['id']
+    df['time_fe'] = df['period']
+    for j in range(1, 4):
+        df[f'covariate_{j}'] = rng.normal(size=len(df))
+    return df
+
+
+@pytest.fixture
+def project_panel(unbalanced_panel, temp_dir, monkeypatch) -> Path:
+    """Project root holding the panel as data_work/panel.parquet."""
+    import utils.helpers
+    (temp_dir / 'data_work').mkdir()
+    unbalanced_panel.to_parquet(temp_dir / 'data_work' / 'panel.parquet')
+    monkeypatch.setattr(utils.helpers, 'get_project_root', lambda: temp_dir)
+    return temp_dir
+
+
+def _dummy_residuals(values: np.ndarray, df: pd.DataFrame) -> np.ndarray:
+    """Residualize on explicit unit and time dummies."""
+    dummies = pd.get_dummies(df[['unit_fe', 'time_fe']].astype(str)).to_numpy(dtype=float)
+    beta = np.linalg.lstsq(dummies, values, rcond=None)[0]
+    return values - dummies @ beta
+
+
+class TestAbsorbFE:
+    """Tests for alternating-projection fixed effects absorption."""
+
+    def test_two_way_matches_dummies(self, unbalanced_panel):
+        """Two-way demeaning on an unbalanced panel equals dummy residuals."""
+        values = unbalanced_panel[['outcome', 'treatment']].to_numpy(dtype=float)
+        absorbed = absorb_fe(values, encode_fe(unbalanced_panel, ['unit_fe', 'time_fe']))
+
+        assert absorbed.converged
+        np.testing.assert_allclose(absorbed.values, _dummy_residuals(values, unbalanced_panel), atol=1e-6)
+
+    def test_acceleration_agrees(self, unbalanced_panel):
+        """Accelerated and plain iterations reach the same fixed point."""
+        values = unbalanced_panel[['outcome', 'treatment']].to_numpy(dtype=float)
+        codes = encode_fe(unbalanced_panel, ['unit_fe', 'time_fe'])
+        fast = absorb_fe(values, codes, accelerate=True)
+        plain = absorb_fe(values, codes, accelerate=False)
+
+        assert fast.n_iter <= plain.n_iter
+        np.testing.assert_allclose(fast.values, plain.values, atol=1e-6)
+
+    def test_single_fe_exact(self, unbalanced_panel):
+        """A single fixed effect is removed in one sweep."""
+        y = unbalanced_panel['outcome'].to_numpy()
+        absorbed = absorb_fe(y, encode_fe(unbalanced_panel, ['unit_fe']))
+        expected = y - unbalanced_panel.groupby('unit_fe')['outcome'].transform('mean').to_numpy()
+
+        assert absorbed.n_iter == 1
+        assert absorbed.values.shape == y.shape
+        np.testing.assert_allclose(absorbed.values, expected, atol=1e-12)
+
+    def test_non_convergence_warns(self, unbalanced_panel):
+        """Hitting the iteration cap raises a RuntimeWarning."""
+        y = unbalanced_panel['outcome'].to_numpy()
+        codes = encode_fe(unbalanced_panel, ['unit_fe', 'time_fe'])
+
+        with pytest.warns(RuntimeWarning):
+            absorbed = absorb_fe(y, codes, tol=0.0, max_iter=2, accelerate=False)
+        assert not absorbed.converged
+
+
+class TestFixedEffectsEstimation:
+    """Tests for the within transformation and FE regressions."""
+
+    def test_demean_preserves_other_columns(self, unbalanced_panel):
+        """Only the outcome and regressors are demeaned."""
+        original = unbalanced_panel.copy()
+        demeaned = demean_by_fe(unbalanced_panel, 'outcome', ['treatment'], ['unit_fe', 'time_fe'])
+
+        pd.testing.assert_frame_equal(unbalanced_panel, original)
+        pd.testing.assert_series_equal(demeaned['id'], original['id'])
+        assert abs(demeaned.groupby('unit_fe')['outcome'].mean()).max() < 1e-6
+
+    def test_two_way_fe_recovers_effect(self, unbalanced_panel):
+        """Baseline two-way FE estimate matches dummy regression."""
+        result = run_fe_estimation(unbalanced_panel, 'baseline')
+
+        y = _dummy_residuals(unbalanced_panel['outcome'].to_numpy(), unbalanced_panel)
+        d = _dummy_residuals(unbalanced_panel['treatment'].to_numpy(dtype=float), unbalanced_panel)
+        assert result.coefficient == pytest.approx((d @ y) / (d @ d), abs=1e-6)
+        assert result.coefficient == pytest.approx(1.5, abs=0.05)
+        assert result.n_units == unbalanced_panel['id'].nunique()
+
+
+class TestFECache:
+    """Tests for cached fixed effects absorption."""
+
+    def test_reuse_across_specifications(self, unbalanced_panel):
+        """Specifications sharing FE and sample absorb each column once."""
+        cache = FECache()
+        baseline = run_fe_estimation(unbalanced_panel, 'baseline', fe_cache=cache)
+        assert (cache.hits, cache.misses) == (0, 2)
+
+        again = run_fe_estimation(unbalanced_panel, 'baseline', fe_cache=cache)
+        assert (cache.hits, cache.misses) == (2, 2)
+        assert again.coefficient == baseline.coefficient
+
+        run_fe_estimation(unbalanced_panel, 'unit_fe_only', fe_cache=cache)
+        assert cache.misses == 4
+
+    def test_cached_matches_uncached(self, unbalanced_panel):
+        """Cached demeaning returns the same values."""
+        cache = FECache()
+        fe = ['unit_fe', 'time_fe']
+        plain = demean_by_fe(unbalanced_panel, 'outcome', ['treatment'], fe)
+        demean_by_fe(unbalanced_panel, 'outcome', [], fe, cache=cache)
+        cached = demean_by_fe(unbalanced_panel, 'outcome', ['treatment'], fe, cache=cache)
+
+        assert (cache.hits, cache.misses) == (1, 2)
+        pd.testing.assert_frame_equal(cached, plain)
+
+    def test_sample_and_values_change_key(self, unbalanced_panel):
+        """A different sample or changed values are not served from cache."""
+        cache = FECache()
+        fe = ['unit_fe', 'time_fe']
+        demean_by_fe(unbalanced_panel, 'outcome', [], fe, cache=cache)
+
+        demean_by_fe(unbalanced_panel.iloc[10:], 'outcome', [], fe, cache=cache)
+        changed = unbalanced_panel.assign(outcome=unbalanced_panel['outcome'] + 1.0)
+        demean_by_fe(changed, 'outcome', [], fe, cache=cache)
+
+        assert cache.hits == 0
+        assert cache.misses == 3
+
+    def test_spills_to_disk(self, unbalanced_panel, temp_dir):
+        """A new cache on the same directory reuses spilled entries."""
+        fe = ['unit_fe', 'time_fe']
+        first = load_fe_cache(temp_dir / 'fe_cache')
+        expected = demean_by_fe(unbalanced_panel, 'outcome', ['treatment'], fe, cache=first)
+        assert len(list((temp_dir / 'fe_cache').glob('*.npy'))) == 2
+
+        second = load_fe_cache(temp_dir / 'fe_cache')
+        result = demean_by_fe(unbalanced_panel, 'outcome', ['treatment'], fe, cache=second)
+
+        assert (second.hits, second.misses) == (2, 0)
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_memory_only_writes_nothing(self, unbalanced_panel, temp_dir, monkeypatch):
+        """Without a directory, entries stay in memory."""
+        monkeypatch.chdir(temp_dir)
+        cache = load_fe_cache(None)
+        demean_by_fe(unbalanced_panel, 'outcome', ['treatment'], ['unit_fe', 'time_fe'], cache=cache)
+
+        assert cache.path is None
+        assert len(cache) == 2
+        assert list(temp_dir.iterdir()) == []
+
+    def test_spill_size_bound(self, unbalanced_panel, temp_dir):
+        """Spilled files beyond max_bytes are evicted, least recently used first."""
+        fe = ['unit_fe', 'time_fe']
+        entry_bytes = len(unbalanced_panel) * 8
+        cache = load_fe_cache(temp_dir / 'fe_cache', max_bytes=2.5 * entry_bytes)
+
+        demean_by_fe(unbalanced_panel, 'outcome', ['treatment'], fe, cache=cache)
+        demean_by_fe(unbalanced_panel, 'outcome', ['covariate_1'], fe, cache=cache)
+
+        files = list((temp_dir / 'fe_cache').glob('*.npy'))
+        assert len(files) == 2
+        assert sum(f.stat().st_size for f in files) <= 2.5 * entry_bytes
+
+
+class TestClusterVariance:
+    """Tests for grouped-score cluster-robust variance."""
+
+    @pytest.fixture
+    def ols_inputs(self):
+        """Design, residuals and two clusterings."""
+        rng = np.random.default_rng(3)
+        n = 600
+        df = pd.DataFrame({
+            'y': rng.normal(size=n),
+            'x': rng.normal(size=n),
+            'firm': rng.integers(0, 40, n),
+            'year': rng.integers(0, 8, n),
+        })
+        X = np.column_stack([np.ones(n), df['x']])
+        XtX_inv = np.linalg.inv(X.T @ X)
+        residuals = df['y'].to_numpy() - X @ (XtX_inv @ (X.T @ df['y'].to_numpy()))
+        return df, X, residuals, XtX_inv
+
+    def test_score_sums_match_groupby(self):
+        """Grouped sums equal a pandas groupby in sorted cluster order."""
+        rng = np.random.default_rng(0)
+        scores = rng.normal(size=(100, 3))
+        codes = rng.integers(0, 7, 100)
+        expected = pd.DataFrame(scores).groupby(codes).sum().to_numpy()
+
+        np.testing.assert_allclose(cluster_score_sums(scores, codes), expected)
+
+    def test_one_way_matches_loop(self, ols_inputs):
+        """One-way variance equals the explicit per-cluster loop."""
+        df, X, residuals, XtX_inv = ols_inputs
+        clusters = df['firm'].to_numpy()
+        n, k = X.shape
+
+        meat = np.zeros((k, k))
+        for c in np.unique(clusters):
+            score = X[clusters == c].T @ residuals[clusters == c]
+            meat += np.outer(score, score)
+        G = len(np.unique(clusters))
+        expected = (G / (G - 1)) * ((n - 1) / (n - k)) * XtX_inv @ meat @ XtX_inv
+
+        np.testing.assert_allclose(cluster_vcov(X, residuals, XtX_inv, [clusters]), expected)
+
+    def test_two_way_inclusion_exclusion(self, ols_inputs):
+        """Two-way variance is V_firm + V_year - V_firm*year."""
+        df, X, residuals, XtX_inv = ols_inputs
+        firm, year = df['firm'].to_numpy(), df['year'].to_numpy()
+        expected = (
+            cluster_vcov(X, residuals, XtX_inv, [firm])
+            + cluster_vcov(X, residuals, XtX_inv, [year])
+            - cluster_vcov(X, residuals, XtX_inv, [firm * 10 + year])
+        )
+
+        result = run_ols(df, 'y', ['x'], cluster_var=['firm', 'year'])
+        assert result['std_error'] == pytest.approx(np.sqrt(expected[1, 1]))
+
+    def test_two_way_specification(self, unbalanced_panel):
+        """Multi-way cluster specifications run and report both variables."""
+        result = run_fe_estimation(unbalanced_panel, 'twoway_cluster')
+
+        assert result.std_error > 0
+        assert result.to_dict()['cluster'] == 'id,period'
+
+
+class TestWildClusterBootstrap:
+    """Tests for the wild cluster restricted bootstrap."""
+
+    @pytest.fixture
+    def few_clusters(self) -> pd.DataFrame:
+        """Twelve clusters with a cluster-level shock and a control."""
+        rng = np.random.default_rng(21)
+        n_clusters, size = 12, 30
+        df = pd.DataFrame({'id': np.repeat(np.arange(n_clusters), size)})
+        df['treatment'] = ((df['id'] < 5) & (rng.random(len(df)) < 0.6)).astype(float)
+        df['covariate_1'] = rng.normal(size=len(df))
+        df['outcome'] = 0.1 * df['treatment'] + 0.5 * df['covariate_1'] + rng.normal(size=n_clusters)[df['id']] + rng.normal(size=len(df))
+        return df
+
+    def test_matches_re_estimation(self, few_clusters):
+        """Replications equal re-running OLS on each bootstrap sample."""
+        x_vars = ['treatment', 'covariate_1']
+        n_boot = 199
+        result = wild_cluster_bootstrap(few_clusters, 'outcome', x_vars, 'id', n_boot=n_boot, seed=4)
+
+        # Same draws, generated as in the implementation
+        v = np.array([-1.0, 1.0])[np.random.default_rng(4).integers(0, 2, size=(12, n_boot))]
+        X_r = np.column_stack([np.ones(len(few_clusters)), few_clusters['covariate_1']])
+        y = few_clusters['outcome'].to_numpy()
+        u_r = y - X_r @ np.linalg.lstsq(X_r, y, rcond=None)[0]
+        observed = run_ols(few_clusters, 'outcome', x_vars, cluster_var='id')['t_stat']
+
+        exceed = 0
+        for b in range(n_boot):
+            sample = few_clusters.assign(outcome=y - u_r + u_r * v[few_clusters['id'], b])
+            exceed += abs(run_ols(sample, 'outcome', x_vars, cluster_var='id')['t_stat']) >= abs(observed)
+
+        assert result['t_stat'] == pytest.approx(observed)
+        assert result['p_value'] == pytest.approx(exceed / n_boot)
+        assert result['n_clusters'] == 12
+
+    def test_webb_weights_and_fe(self, unbalanced_panel):
+        """The option runs through run_fe_estimation and rejects a strong effect."""
+        result = run_fe_estimation(unbalanced_panel, 'baseline', bootstrap='webb', n_boot=999, seed=0)
+
+        assert result.bootstrap_weights == 'webb'
+        assert result.bootstrap_p_value < 0.01
+        assert result.to_dict()['bootstrap_p_value'] == result.bootstrap_p_value
+        assert run_fe_estimation(unbalanced_panel, 'baseline').bootstrap_p_value is None
+
+    def test_rejects_invalid_options(self, unbalanced_panel):
+        """Unknown weights and multi-way or missing clustering raise."""
+        x_vars = ['treatment']
+        with pytest.raises(ValueError, match="Unknown bootstrap weights"):
+            run_fe_estimation(unbalanced_panel, 'no_fe', bootstrap='normal')
+        with pytest.raises(ValueError, match="one-way"):
+            wild_cluster_bootstrap(unbalanced_panel, 'outcome', x_vars, ['id', 'period'])
+        with pytest.raises(ValueError, match="requires a cluster variable"):
+            wild_cluster_bootstrap(unbalanced_panel, 'outcome', x_vars, None)
+
+    @pytest.mark.parametrize('spec_name', ['no_fe', 'twoway_cluster'])
+    def test_unsupported_clustering_keeps_analytic(self, unbalanced_panel, spec_name):
+        """Specifications without one-way clustering skip the bootstrap only."""
+        with pytest.warns(RuntimeWarning, match="one-way clustering"):
+            result = run_fe_estimation(unbalanced_panel, spec_name, bootstrap='webb', n_boot=99)
+        expected = run_fe_estimation(unbalanced_panel, spec_name)
+
+        assert result.std_error == expected.std_error
+        assert (result.bootstrap_p_value, result.bootstrap_weights) == (None, None)
+
+    def test_all_specifications_keep_results(self, unbalanced_panel):
+        """--all --bootstrap returns a result for every specification."""
+        settings = {'bootstrap': 'webb', 'n_boot': 199, 'seed': 1}
+        with pytest.warns(RuntimeWarning):
+            outcomes = run_specifications(list(SPECIFICATIONS), df=unbalanced_panel, bootstrap=settings)
+
+        assert all(error is None for _, _, error in outcomes)
+        assert all(result is not None for _, result, _ in outcomes)
+        assert {name for name, result, _ in outcomes if result.bootstrap_p_value is not None} == {
+            name for name, spec in SPECIFICATIONS.items() if isinstance(spec['cluster'], str)
+        }
+
+    def test_specification_runner_passes_settings(self, unbalanced_panel):
+        """Serial and parallel runners give the same seeded bootstrap p-values."""
+        settings = {'bootstrap': 'rademacher', 'n_boot': 199, 'seed': 5}
+        names = ['baseline', 'unit_fe_only']
+        serial = run_specifications(names, df=unbalanced_panel, bootstrap=settings)
+        parallel = run_specifications(names, df=unbalanced_panel, jobs=2, bootstrap=settings)
+
+        for (_, expected, _), (_, result, _) in zip(serial, parallel):
+            assert expected.bootstrap_weights == 'rademacher'
+            assert result.bootstrap_p_value == expected.bootstrap_p_value
+
+
+    def test_main_all_writes_every_specification(self, project_panel):
+        """main(run_all=True, bootstrap=...) exports a row per specification."""
+        with pytest.warns(RuntimeWarning):
+            main(run_all=True, bootstrap='webb', n_boot=99, seed=1, verbose=False)
+        results = pd.read_csv(project_panel / 'data_work' / 'diagnostics' / 'estimation_results.csv')
+
+        assert list(results['specification']) == list(SPECIFICATIONS)
+        assert results.set_index('specification')['bootstrap_p_value'].notna().to_dict() == {
+            name: isinstance(spec['cluster'], str) for name, spec in SPECIFICATIONS.items()
+        }
+
+
+class TestSpecificationSweep:
+    """Tests for sufficient-statistics specification sweeps."""
+
+    def test_matches_row_level_estimates(self, unbalanced_panel):
+        """Swept results, clustered SEs included, equal per-spec estimation."""
+        names = ['baseline', 'with_controls', 'no_fe', 'unit_fe_only', 'twoway_cluster']
+        swept = sweep_specifications(unbalanced_panel, names)
+
+        assert [r.specification for r in swept] == names
+        for result in swept:
+            assert result.elapsed_seconds > 0
+            expected = run_fe_estimation(unbalanced_panel, result.specification)
+
+            assert result.coefficient == pytest.approx(expected.coefficient, rel=1e-8)
+            assert result.std_error == pytest.approx(expected.std_error, rel=1e-8)
+            assert result.r_squared == pytest.approx(expected.r_squared, rel=1e-8)
+            assert result.n_obs == expected.n_obs
+            assert result.cluster == expected.cluster
+
+    def test_specs_keep_their_own_samples(self, unbalanced_panel):
+        """Missing controls only drop rows from the specifications using them."""
+        df = unbalanced_panel.copy()
+        df.loc[df.index[::7], 'covariate_2'] = np.nan
+        baseline, controls = sweep_specifications(df, ['baseline', 'with_controls'])
+
+        assert baseline.n_obs == len(df)
+        assert controls.n_obs == df['covariate_2'].notna().sum()
+        assert controls.std_error == pytest.approx(run_fe_estimation(df, 'with_controls').std_error, rel=1e-8)
+
+    def test_shared_fe_absorbed_once(self, unbalanced_panel):
+        """Specifications with the same FE share one absorption."""
+        cache = FECache()
+        sweep_specifications(unbalanced_panel, ['baseline', 'with_controls', 'twoway_cluster'], fe_cache=cache)
+
+        assert cache.misses == 5
+
+    def test_unknown_specification(self, unbalanced_panel):
+        """Unknown names raise."""
+        with pytest.raises(ValueError, match="Unknown specification"):
+            sweep_specifications(unbalanced_panel, ['missing'])
+
+    def test_main_records_timing(self, project_panel):
+        """main(run_all=True) sweeps and still exports per-spec timing."""
+        main(run_all=True, verbose=False)
+        results = pd.read_csv(project_panel / 'data_work' / 'diagnostics' / 'estimation_results.csv')
+
+        assert list(results['specification']) == list(SPECIFICATIONS)
+        assert (results['elapsed_seconds'] > 0).all()
+
+
+class TestStreamingEstimation:
+    """Tests for out-of-core estimation over parquet batches."""
+
+    @pytest.mark.parametrize('spec_name', list(SPECIFICATIONS))
+    def test_matches_in_memory(self, unbalanced_panel, temp_dir, spec_name):
+        """Batched estimates equal run_fe_estimation for every specification."""
+        panel = unbalanced_panel.copy()
+        panel.loc[::17, 'covariate_2'] = np.nan
+        path = temp_dir / 'panel.parquet'
+        panel.to_parquet(path, row_group_size=150)
+
+        expected = run_fe_estimation(panel, spec_name)
+        result = run_streaming_estimation(path, spec_name, batch_size=100)
+
+        assert result.coefficient == pytest.approx(expected.coefficient, abs=1e-8)
+        assert result.std_error == pytest.approx(expected.std_error, rel=1e-6)
+        assert result.r_squared == pytest.approx(expected.r_squared, abs=1e-8)
+        assert (result.n_obs, result.n_units, result.n_periods) == (
+            expected.n_obs, expected.n_units, expected.n_periods
+        )
+
+    def test_high_cardinality_fixed_effects(self, temp_dir):
+        """Many levels in every fixed effect are absorbed, not carried as dummies."""
+        rng = np.random.default_rng(16)
+        n = 20_000
+        panel = pd.DataFrame({'id': rng.integers(0, 2_000, n), 'period': rng.integers(0, 5_000, n)})
+        panel['treatment'] = rng.random(n).round()
+        panel['outcome'] = panel['treatment'] + rng.normal(size=2_000)[panel['id']] + rng.normal(size=n)
+        panel['unit_fe'] = panel['id']
+        panel['time_fe'] = panel['period']
+        path = temp_dir / 'panel.parquet'
+        panel.to_parquet(path)
+
+        expected = run_fe_estimation(panel, 'baseline')
+        result = run_streaming_estimation(path, 'baseline', batch_size=3_000)
+
+        assert result.coefficient == pytest.approx(expected.coefficient, abs=1e-8)
+        assert result.std_error == pytest.approx(expected.std_error, rel=1e-6)
+
+    def test_passes_update_every_fixed_effect(self, unbalanced_panel, temp_dir, monkeypatch):
+        """One FE needs no iteration pass; each iteration updates every FE in one pass."""
+        import pyarrow.parquet as pq
+        path = temp_dir / 'panel.parquet'
+        unbalanced_panel.to_parquet(path)
+
+        passes = []
+        iter_batches = pq.ParquetFile.iter_batches
+        monkeypatch.setattr(
+            pq.ParquetFile, 'iter_batches',
+            lambda self, *args, **kwargs: passes.append(1) or iter_batches(self, *args, **kwargs)
+        )
+        run_streaming_estimation(path, 'unit_fe_only', batch_size=200)
+        # Levels and sums, cross-products, cluster scores
+        assert len(passes) == 3
+
+        passes.clear()
+        with pytest.warns(RuntimeWarning, match="did not converge in 2 iterations"):
+            run_streaming_estimation(path, 'baseline', batch_size=200, max_iter=2)
+        assert len(passes) == 2 + 3
+
+
+class TestParallelSpecifications:
+    """Tests for the process-pool specification runner."""
+
+    def test_parallel_matches_serial(self, unbalanced_panel, temp_dir):
+        """Workers on the shared panel reproduce serial results in order."""
+        panel = unbalanced_panel.assign(id='u' + unbalanced_panel['id'].astype(str))
+        names = list(SPECIFICATIONS)[::-1]
+
+        serial = run_specifications(names, df=panel)
+        parallel = run_specifications(names, df=panel, jobs=2, fe_cache=load_fe_cache(temp_dir / 'fe_cache'))
+
+        assert [name for name, _, _ in parallel] == names
+        for (_, expected, _), (_, result, error) in zip(serial, parallel):
+            assert error is None
+            assert result.coefficient == pytest.approx(expected.coefficient, rel=1e-10)
+            assert result.std_error == pytest.approx(expected.std_error, rel=1e-10)
+            assert result.n_units == expected.n_units
+            assert result.elapsed_seconds > 0
+
+    def test_bool_treatment_shared_unchanged(self, unbalanced_panel):
+        """A bool treatment starting with True is not recoded in workers."""
+        panel = unbalanced_panel.assign(treatment=unbalanced_panel['treatment'].astype(bool))
+        panel = panel.sort_values('treatment', ascending=False, kind='stable')
+        names = ['baseline', 'no_fe']
+
+        serial = run_specifications(names, df=panel)
+        parallel = run_specifications(names, df=panel, jobs=2)
+
+        for (_, expected, _), (_, result, error) in zip(serial, parallel):
+            assert error is None
+            assert result.coefficient == pytest.approx(expected.coefficient, rel=1e-10)
+
+    def test_errors_are_reported(self, unbalanced_panel):
+        """A failing specification returns its error instead of a result."""
+        panel = unbalanced_panel.drop(columns=['covariate_1'])
+        outcomes = run_specifications(['baseline', 'with_controls'], df=panel, jobs=2)
+
+        assert outcomes[0][1] is not None
+        assert outcomes[1][1] is None
+        assert 'covariate_1' in outcomes[1][2]
+
+    def test_timing_in_results(self, unbalanced_panel):
+        """Per-specification time is part of the exported row."""
+        (_, result, _), = run_specifications(['baseline'], df=unbalanced_panel)
+
+        assert result.to_dict()['elapsed_seconds'] == result.elapsed_seconds
+
+
+class TestEventStudy:
+    """Tests for the sparse event-study estimator."""
+
+    @pytest.fixture
+    def staggered_panel(self) -> pd.DataFrame:
+        """Staggered adoption with never-treated units and growing effects."""
+        rng = np.random.default_rng(8)
+        n_units, n_periods = 150, 12
+        df = pd.DataFrame({
+            'id': np.repeat(np.arange(n_units), n_periods),
+            'period': np.tile(np.arange(n_periods), n_units),
+        })
+        df = df[rng.random(len(df)) > 0.15].reset_index(drop=True)
+        start = rng.choice(np.r_[np.arange(3, 10), [np.nan] * 2], n_units)[df['id']]
+        df['event_time'] = df['period'] - start
+        effect = np.where(df['event_time'] >= 0, 1.0 + 0.2 * df['event_time'], 0.0)
+        df['outcome'] = effect + rng.normal(size=n_units)[df['id']] + 0.1 * df['period'] + rng.normal(scale=0.5, size=len(df))
+        df['unit_fe'] = df['id']
+        df['time_fe'] = df['period']
+        return df
+
+    def test_matches_dummy_regression(self, staggered_panel):
+        """Coefficients equal OLS on dense binned dummies and FE dummies."""
+        result = event_study(staggered_panel, window=(-4, 4))
+        binned = staggered_panel['event_time'].clip(-4, 4)
+        periods = [t for t in range(-4, 5) if t != -1]
+        dummies = np.column_stack([(binned == t).to_numpy(dtype=float) for t in periods])
+        fe = pd.get_dummies(staggered_panel[['unit_fe', 'time_fe']].astype(str)).to_numpy(dtype=float)
+        beta = np.linalg.lstsq(np.column_stack([dummies, fe]), staggered_panel['outcome'], rcond=None)[0]
+
+        estimated = result.set_index('event_time').loc[periods, 'coefficient']
+        np.testing.assert_allclose(estimated, beta[:len(periods)], atol=1e-6)
+
+    def test_cluster_errors_match_demeaned_ols(self, staggered_panel):
+        """Clustered SEs equal the sandwich on demeaned dense dummies."""
+        result = event_study(staggered_panel, window=(-3, 3), cluster='id').set_index('event_time')
+        binned = staggered_panel['event_time'].clip(-3, 3)
+        periods = [t for t in range(-3, 4) if t != -1]
+        panel = staggered_panel.assign(**{f'd{j}': (binned == t).astype(float) for j, t in enumerate(periods)})
+        x_vars = [f'd{j}' for j in range(len(periods))]
+        demeaned = demean_by_fe(panel, 'outcome', x_vars, ['unit_fe', 'time_fe'])
+
+        X = demeaned[x_vars].to_numpy()
+        XtX_inv = np.linalg.inv(X.T @ X)
+        residuals = demeaned['outcome'].to_numpy() - X @ (XtX_inv @ (X.T @ demeaned['outcome'].to_numpy()))
+        V = cluster_vcov(X, residuals, XtX_inv, [panel['id'].to_numpy()])
+
+        np.testing.assert_allclose(result.loc[periods, 'std_error'], np.sqrt(np.diag(V)), rtol=1e-6)
+
+    def test_reference_and_endpoint_bins(self, staggered_panel):
+        """The reference row is zero and endpoint bins pool outlying periods."""
+        result = event_study(staggered_panel, window=(-2, 2)).set_index('event_time')
+        event_time = staggered_panel['event_time']
+
+        assert list(result.index) == [-2, -1, 0, 1, 2]
+        assert result.loc[-1, 'coefficient'] == 0.0
+        assert result.loc[2, 'n_obs'] == (event_time >= 2).sum()
+        assert result.loc[-2, 'n_obs'] == (event_time <= -2).sum()
+        assert result.loc[2, 'coefficient'] > result.loc[0, 'coefficient'] > 0.5
+
+    def test_empty_bins_are_unidentified(self, staggered_panel):
+        """Bins with no observations are reported as NaN."""
+        result = event_study(staggered_panel, window=(-20, 3), cluster=None).set_index('event_time')
+
+        assert result.loc[-20, 'n_obs'] == 0
+        assert np.isnan(result.loc[-20, 'coefficient'])
+        assert np.isfinite(result.loc[0, 'std_error'])
+
+    def test_reference_outside_window(self, staggered_panel):
+        """The omitted period must lie inside the window."""
+        with pytest.raises(ValueError, match="Reference period"):
+            event_study(staggered_panel, window=(0, 3))
+
+
+class TestGroupTimeATT:
+    """Tests for the Callaway-Sant'Anna group-time ATT estimator."""
+
+    @pytest.fixture
+    def cohort_panel(self) -> pd.DataFrame:
+        """Balanced staggered panel with never-treated units."""
+        rng = np.random.default_rng(19)
+        n_units, n_periods = 240, 10
+        df = pd.DataFrame({
+            'id': np.repeat(np.arange(n_units), n_periods),
+            'period': np.tile(np.arange(n_periods), n_units),
+        })
+        start = rng.choice([3.0, 5.0, 7.0, np.nan], n_units)
+        df['treatment_period'] = start[df['id']]
+        event = df['period'] - df['treatment_period']
+        df['treatment'] = (event >= 0).astype(int)
+        effect = np.where(event >= 0, 1.0 + 0.5 * event, 0.0)
+        df['outcome'] = effect + rng.normal(size=n_units)[df['id']] + 0.2 * df['period'] + rng.normal(scale=0.3, size=len(df))
+        return df
+
+    @staticmethod
+    def _brute_force(df, cohort, period, base, control_group):
+        """2x2 comparison by subsetting the wide panel."""
+        wide = df.pivot(index='id', columns='period', values='outcome')
+        diff = wide[period] - wide[base]
+        first = df.groupby('id')['treatment_period'].first()
+        treated = first == cohort
+        control = first.isna()
+        if control_group == 'not_yet_treated':
+            control |= (first > max(period, base)) & ~treated
+        att = diff[treated].mean() - diff[control].mean()
+        se = np.sqrt(diff[treated].var(ddof=0) / treated.sum() + diff[control].var(ddof=0) / control.sum())
+        return att, se
+
+    @pytest.mark.parametrize('base_period', ['varying', 'universal'])
+    @pytest.mark.parametrize('control_group', ['never_treated', 'not_yet_treated'])
+    def test_matches_cell_by_cell(self, cohort_panel, control_group, base_period):
+        """Every ATT(g, t) equals the 2x2 difference computed from the panel."""
+        result = group_time_att(cohort_panel, control_group=control_group, base_period=base_period)
+
+        assert len(result.group_time) == 3 * 9
+        for row in result.group_time.itertuples():
+            varying = base_period == 'varying' and row.period < row.cohort
+            base = row.period - 1 if varying else row.cohort - 1
+            att, se = self._brute_force(cohort_panel, row.cohort, row.period, base, control_group)
+            assert row.att == pytest.approx(att, abs=1e-12)
+            if control_group == 'never_treated':
+                assert row.std_error == pytest.approx(se, rel=1e-10)
+
+    def test_aggregations(self, cohort_panel):
+        """Event-time and overall ATTs are cohort-size weighted averages of the cells."""
+        result = group_time_att(cohort_panel)
+        gt = result.group_time
+        post = gt[gt['event_time'] >= 0]
+
+        expected = np.average(post['att'], weights=post['n_treated'])
+        assert result.overall_att == pytest.approx(expected)
+        at_two = gt[gt['event_time'] == 2]
+        row = result.event_time.set_index('event_time').loc[2]
+        assert row['att'] == pytest.approx(np.average(at_two['att'], weights=at_two['n_treated']))
+        assert row['n_cohorts'] == 3
+
+        # True effects are 1 + 0.5 e after treatment and zero before
+        effects = result.event_time.set_index('event_time')['att']
+        np.testing.assert_allclose(effects.loc[0:2], [1.0, 1.5, 2.0], atol=0.15)
+        np.testing.assert_allclose(effects.loc[-3:-1], 0.0, atol=0.15)
+        assert 0 < result.overall_se < 0.1
+
+    def test_cohort_from_treatment(self, cohort_panel):
+        """Without a cohort column the first treated period defines cohorts."""
+        expected = group_time_att(cohort_panel)
+        derived = group_time_att(cohort_panel.drop(columns='treatment_period'))
+
+        pd.testing.assert_frame_equal(derived.group_time, expected.group_time)
+
+    def test_unbalanced_uses_available_means(self, cohort_panel):
+        """With missing rows each cell compares means of the observed units."""
+        df = cohort_panel.sample(frac=0.85, random_state=1)
+        result = group_time_att(df)
+        row = result.group_time.query('cohort == 5 and period == 6').iloc[0]
+
+        means = df.groupby([df['treatment_period'].fillna(-1), 'period'])['outcome'].mean()
+        expected = (means[5, 6] - means[5, 4]) - (means[-1, 6] - means[-1, 4])
+        assert row['att'] == pytest.approx(expected, abs=1e-12)
+        assert np.isfinite(result.group_time['std_error']).all()
+
+    def test_invalid_options(self, cohort_panel):
+        """Unknown control groups and base periods raise."""
+        with pytest.raises(ValueError, match="control group"):
+            group_time_att(cohort_panel, control_group='all')
+        with pytest.raises(ValueError, match="base period"):
+            group_time_att(cohort_panel, base_period='first')
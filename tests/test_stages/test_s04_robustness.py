@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Tests for src/stages/s04_robustness.py
+
+Tests cover:
+- Randomization inference against re-estimating permuted panels
+- Robustness scheduler: serial/parallel agreement, column projection,
+  incremental output and failed checks
+- Mask-based sample restrictions against filtered copies
+- Leave-one-cluster-out coefficients against re-estimation
+"""
+from __future__ import annotations
+
+import pytest
+import pandas as pd
+import numpy as np
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from stages.s03_estimation import run_fe_estimation, demean_by_fe
+from stages import s04_robustness
+from stages.s04_robustness import (
+    run_randomization_inference,
+    run_robustness_tasks,
+    specification_tasks,
+    placebo_tasks,
+    sample_tasks,
+    RobustnessTask,
+    masked_ols,
+    restriction_mask,
+    mask_weights,
+    leave_one_cluster_out,
+    loco_summary,
+)
+from utils.solvers import least_squares
+
+
+@pytest.fixture
+def staggered_panel() -> pd.DataFrame:
+    """Balanced panel with two adoption cohorts and never-treated units."""
+    rng = np.random.default_rng(22)
+    n_units, n_periods = 60, 10
+    df = pd.DataFrame({
+        'id': np.repeat(np.arange(n_units), n_periods),
+        'period': np.tile(np.arange(n_periods), n_units),
+    })
+    start = rng.choice([4.0, 6.0, np.inf], n_units)[df['id']]
+    df['treatment'] = (df['period'] >= start).astype(float)
+    df['outcome'] = 0.3 * df['treatment'] + rng.normal(size=n_units)[df['id']] + 0.1 * df['period'] + rng.normal(size=len(df))
+    df['unit_fe'] = df['id']
+    df['time_fe'] = df['period']
+    df['ever_treated'] = np.isfinite(start).astype(int)
+    df['covariate_1'] = rng.normal(size=len(df))
+    return df
+
+
+def _column_count(df: pd.DataFrame) -> dict:
+    """Check that reports how many columns it was given."""
+    return {'coefficient': float(df.shape[1]), 'std_error': 0.0, 'p_value': 1.0, 'n_obs': len(df)}
+
+
+class TestRandomizationInference:
+    """Tests for run_randomization_inference."""
+
+    def test_observed_coefficient(self, staggered_panel):
+        """The observed statistic is the two-way FE coefficient."""
+        result = run_randomization_inference(staggered_panel, n_permutations=100)
+        expected = run_fe_estimation(staggered_panel, 'baseline').coefficient
+
+        assert result.coefficient == pytest.approx(expected, rel=1e-10)
+        assert result.test_type == 'randomization'
+        assert result.n_obs == len(staggered_panel)
+
+    def test_permuted_coefficients_match_re_estimation(self, staggered_panel):
+        """On a balanced panel each permuted value is the re-estimated coefficient."""
+        df = staggered_panel
+        paths = df.pivot(index='id', columns='period', values='treatment').to_numpy()
+        demeaned = demean_by_fe(df, 'outcome', ['treatment'], ['unit_fe', 'time_fe'])
+        denominator = df['treatment'] @ demeaned['treatment']
+
+        rng = np.random.default_rng(0)
+        for _ in range(5):
+            permuted = paths[rng.permutation(len(paths))][df['id'], df['period']]
+            fast = permuted @ demeaned['outcome'] / denominator
+            slow = run_fe_estimation(df.assign(treatment=permuted), 'baseline').coefficient
+            assert fast == pytest.approx(slow, rel=1e-9)
+
+    def test_pvalue_is_exact_and_reproducible(self, staggered_panel):
+        """p-values lie on the (1 + k) / (1 + B) grid and do not depend on jobs."""
+        serial = run_randomization_inference(staggered_panel, n_permutations=2_500, seed=3)
+        parallel = run_randomization_inference(staggered_panel, n_permutations=2_500, seed=3, jobs=2)
+
+        assert parallel.p_value == serial.p_value
+        assert parallel.std_error == pytest.approx(serial.std_error)
+        assert (serial.p_value * 2_501) == pytest.approx(round(serial.p_value * 2_501))
+        assert 0 < serial.p_value <= 1
+
+    def test_direct_scoring_matches_table(self, staggered_panel, monkeypatch):
+        """Without the units x paths table, permutations give the same results."""
+        df = staggered_panel.copy()
+        # Irregular paths: every unit's treatment switches at its own periods
+        df['treatment'] = np.random.default_rng(1).integers(0, 2, len(df)).astype(float)
+        table = run_randomization_inference(df, n_permutations=300, seed=2)
+
+        monkeypatch.setattr(s04_robustness, 'RI_TABLE_BYTES', 0)
+        direct = run_randomization_inference(df, n_permutations=300, seed=2)
+
+        assert direct.p_value == table.p_value
+        assert direct.std_error == pytest.approx(table.std_error, rel=1e-10)
+
+    def test_detects_large_effect(self, staggered_panel):
+        """A large treatment effect sits in the far tail of the permutation distribution."""
+        df = staggered_panel.assign(outcome=staggered_panel['outcome'] + 3 * staggered_panel['treatment'])
+        result = run_randomization_inference(df, n_permutations=999)
+
+        assert result.p_value == pytest.approx(1 / 1000)
+        assert result.std_error < abs(result.coefficient) / 5
+
+    def test_unbalanced_panel(self, staggered_panel):
+        """Missing unit-periods are handled; the test stays valid."""
+        df = staggered_panel.sample(frac=0.85, random_state=0)
+        result = run_randomization_inference(df, n_permutations=500)
+
+        assert result.coefficient == pytest.approx(run_fe_estimation(df, 'baseline').coefficient, rel=1e-8)
+        assert 0 < result.p_value <= 1
+
+
+class TestRobustnessScheduler:
+    """Tests for run_robustness_tasks."""
+
+    @pytest.fixture
+    def battery(self, staggered_panel) -> list[RobustnessTask]:
+        """The stage's full set of declared checks."""
+        df = staggered_panel
+        return specification_tasks(df) + placebo_tasks(df, pre_period_end=8) + sample_tasks(df)
+
+    def test_parallel_matches_serial(self, staggered_panel, battery):
+        """A worker pool over the shared panel gives the serial results, in order."""
+        serial = run_robustness_tasks(staggered_panel, battery)
+        parallel = run_robustness_tasks(staggered_panel, battery, jobs=3)
+
+        assert [r.test_name for r in serial] == [t.name for t in battery]
+        assert [r.to_dict() for r in parallel] == [r.to_dict() for r in serial]
+
+    def test_bool_columns_match_serial(self, staggered_panel):
+        """A bool treatment starting with True gives the same results in workers."""
+        df = staggered_panel.assign(treatment=staggered_panel['treatment'].astype(bool))
+        df = df.sort_values('treatment', ascending=False, kind='stable')
+        tasks = specification_tasks(df) + placebo_tasks(df, pre_period_end=8) + sample_tasks(df)
+
+        serial = run_robustness_tasks(df, tasks, jobs=1)
+        parallel = run_robustness_tasks(df, tasks, jobs=2)
+
+        assert [r.to_dict() for r in parallel] == [r.to_dict() for r in serial]
+
+    def test_checks_see_only_declared_columns(self, staggered_panel):
+        """Each check receives its column projection."""
+        tasks = [
+            RobustnessTask('two', 'sample', '', ['outcome', 'treatment'], _column_count),
+            RobustnessTask('three', 'sample', '', ['outcome', 'treatment', 'period'], _column_count),
+        ]
+        for jobs in (1, 2):
+            results = run_robustness_tasks(staggered_panel, tasks, jobs=jobs)
+            assert [r.coefficient for r in results] == [2.0, 3.0]
+
+    def test_results_written_as_they_finish(self, staggered_panel, battery, monkeypatch):
+        """Every finished check is appended to the output immediately."""
+        written = []
+        monkeypatch.setattr(
+            s04_robustness, 'save_diagnostic',
+            lambda df, name, append=False: written.append((name, append, df['test_name'].tolist()))
+        )
+        run_robustness_tasks(staggered_panel, battery, jobs=2, output='robustness_results')
+
+        assert len(written) == len(battery)
+        assert all(name == 'robustness_results' and append for name, append, _ in written)
+        assert sorted(names[0] for *_, names in written) == sorted(t.name for t in battery)
+
+    def test_failed_checks_are_skipped(self, staggered_panel, capsys):
+        """A failing check is reported and left out of the results."""
+        tasks = [
+            RobustnessTask('missing', 'sample', '', ['outcome', 'no_such_column'], _column_count),
+        ] + specification_tasks(staggered_panel)
+        results = run_robustness_tasks(staggered_panel, tasks)
+
+        assert [r.test_name for r in results] == ['main', 'with_control']
+        assert 'missing failed' in capsys.readouterr().out
+
+
+class TestSampleRestrictions:
+    """Tests for mask-based sample restrictions."""
+
+    @staticmethod
+    def _ols_on_copy(df: pd.DataFrame, x_vars: list[str]) -> tuple[float, float, int]:
+        """Treatment coefficient and SE from OLS on a filtered copy."""
+        df = df[['outcome'] + x_vars].dropna()
+        X = np.column_stack([np.ones(len(df)), df[x_vars]])
+        fit = least_squares(X, df['outcome'].to_numpy())
+        se = np.sqrt(fit.ssr / (len(df) - X.shape[1]) * fit.XtX_inv[1, 1])
+        return fit.beta[1], se, len(df)
+
+    @pytest.mark.parametrize('restriction,params,filtered', [
+        ('trim_endpoints', {}, lambda df: df[(df['period'] > 0) & (df['period'] < 9)]),
+        ('subsample', {'frac': 0.8, 'seed': 42}, lambda df: df.sample(frac=0.8, random_state=42)),
+        ('trim_outliers', {'lower': 0.01, 'upper': 0.99},
+         lambda df: df[df['outcome'].between(df['outcome'].quantile(0.01), df['outcome'].quantile(0.99))]),
+    ])
+    def test_masks_match_filtered_copies(self, staggered_panel, restriction, params, filtered):
+        """Weighted cross-products over a mask equal OLS on the filtered panel."""
+        mask = restriction_mask(staggered_panel, restriction, **params)
+        result = masked_ols(staggered_panel, 'outcome', ['treatment', 'covariate_1'], mask=mask)
+        coef, se, n = self._ols_on_copy(filtered(staggered_panel), ['treatment', 'covariate_1'])
+
+        assert result['coefficient'] == pytest.approx(coef, rel=1e-9)
+        assert result['std_error'] == pytest.approx(se, rel=1e-9)
+        assert result['n_obs'] == n
+
+    def test_chunked_accumulation(self, staggered_panel, monkeypatch):
+        """Row slices, including ones the mask excludes, give the one-pass result."""
+        mask = restriction_mask(staggered_panel, 'trim_endpoints')
+        expected = masked_ols(staggered_panel, 'outcome', ['treatment', 'covariate_1'], mask=mask)
+
+        monkeypatch.setattr(s04_robustness, 'MASK_CHUNK_ROWS', 7)
+        result = masked_ols(staggered_panel, 'outcome', ['treatment', 'covariate_1'], mask=mask)
+
+        assert result['coefficient'] == pytest.approx(expected['coefficient'], rel=1e-10)
+        assert result['std_error'] == pytest.approx(expected['std_error'], rel=1e-10)
+        assert result['n_obs'] == expected['n_obs']
+
+    def test_index_mask_counts_repeats(self, staggered_panel):
+        """Row positions may repeat, as in a bootstrap resample."""
+        rows = np.random.default_rng(0).integers(0, len(staggered_panel), len(staggered_panel))
+        result = masked_ols(staggered_panel, 'outcome', ['treatment'], mask=rows)
+        coef, _, n = self._ols_on_copy(staggered_panel.iloc[rows], ['treatment'])
+
+        assert result['coefficient'] == pytest.approx(coef, rel=1e-9)
+        assert result['n_obs'] == n
+
+    def test_mask_validation(self, staggered_panel):
+        """Wrong-length masks and unknown restrictions raise."""
+        with pytest.raises(ValueError, match="Mask has"):
+            mask_weights(np.ones(5, dtype=bool), 6)
+        with pytest.raises(ValueError, match="Unknown sample restriction"):
+            restriction_mask(staggered_panel, 'drop_weekends')
+        np.testing.assert_array_equal(mask_weights(None, 3), np.ones(3))
+
+
+class TestLeaveOneClusterOut:
+    """Tests for leave-one-cluster-out influence."""
+
+    @pytest.mark.parametrize('spec_name', ['unit_fe_only', 'no_fe'])
+    def test_matches_re_estimation(self, staggered_panel, spec_name):
+        """With FE nested in clusters every coefficient equals dropping the cluster and re-estimating."""
+        df = staggered_panel.sample(frac=0.9, random_state=2)
+        influence = leave_one_cluster_out(df, spec_name, cluster_var='id')
+        full = run_fe_estimation(df, spec_name).coefficient
+
+        expected = [run_fe_estimation(df[df['id'] != g], spec_name).coefficient for g in influence['cluster']]
+        np.testing.assert_allclose(influence['coefficient'], expected, rtol=1e-10)
+        np.testing.assert_allclose(influence['influence'], np.array(expected) - full, atol=1e-12)
+        assert influence['n_obs'].tolist() == df.groupby('id').size().tolist()
+        assert influence['exact'].all()
+
+    def test_two_way_fe_is_close(self, staggered_panel):
+        """With time FE (not nested) the update is flagged and stays within a bounded error."""
+        influence = leave_one_cluster_out(staggered_panel)
+        full = run_fe_estimation(staggered_panel, 'baseline').coefficient
+        expected = np.array([
+            run_fe_estimation(staggered_panel[staggered_panel['id'] != g], 'baseline').coefficient
+            for g in influence['cluster']
+        ])
+        spread = np.abs(expected - full).max()
+
+        assert not influence['exact'].any()
+        np.testing.assert_allclose(influence['coefficient'], expected, atol=0.05 * spread)
+        assert 'approximate' in loco_summary(influence).description
+
+    def test_unidentified_drop_is_nan(self, staggered_panel):
+        """Dropping the only source of treatment variation leaves NaN."""
+        df = staggered_panel.assign(treatment=(staggered_panel['id'] == 0) * (staggered_panel['period'] >= 5.0))
+        influence = leave_one_cluster_out(df, 'no_fe')
+
+        assert np.isnan(influence.loc[influence['cluster'] == 0, 'coefficient']).all()
+        assert np.isfinite(influence.loc[influence['cluster'] != 0, 'coefficient']).all()
+
+    def test_jackknife_summary(self, staggered_panel):
+        """The summary reports the full-sample coefficient and the jackknife SE."""
+        influence = leave_one_cluster_out(staggered_panel, 'unit_fe_only')
+        result = loco_summary(influence)
+        coefs = influence['coefficient'].to_numpy()
+        G = len(coefs)
+
+        assert result.coefficient == pytest.approx(run_fe_estimation(staggered_panel, 'unit_fe_only').coefficient)
+        assert result.std_error == pytest.approx(np.sqrt((G - 1) / G * ((coefs - coefs.mean()) ** 2).sum()))
+        assert result.n_obs == len(staggered_panel)
+        assert result.test_type == 'jackknife'
+        assert 'approximate' not in result.description
@@ -30,6 +30,8 @@ from utils.helpers import (
     format_difference,
     load_data,
     save_data,
+    share_columns,
+    load_shared_columns,
     clean_numeric,
     calculate_match_rate,
 )
@@ -234,6 +236,38 @@ class TestSaveData:
         assert path.exists()
 
 
+class TestSharedColumns:
+    """Tests for share_columns and load_shared_columns."""
+
+    def test_roundtrip_is_memory_mapped(self, temp_dir):
+        """Projected columns come back read-only; strings become float codes."""
+        df = pd.DataFrame({
+            'x': [1.5, np.nan, 3.0],
+            'n': [1, 2, 3],
+            'g': ['a', None, 'a'],
+            'unused': [0, 0, 0],
+        })
+        paths = share_columns(df, ['x', 'n', 'g'], temp_dir)
+        shared = load_shared_columns(paths)
+
+        assert list(shared.columns) == ['x', 'n', 'g']
+        np.testing.assert_array_equal(shared['x'], df['x'])
+        np.testing.assert_array_equal(shared['n'], df['n'])
+        np.testing.assert_array_equal(shared['g'], [0.0, np.nan, 0.0])
+        assert not shared['n'].to_numpy().flags.writeable
+
+    def test_bool_columns_keep_their_values(self, temp_dir):
+        """Booleans are stored as 0/1 whatever the first value is."""
+        df = pd.DataFrame({
+            'treated': [True, False, True],
+            'flag': pd.array([True, None, False], dtype='boolean'),
+        })
+        shared = load_shared_columns(share_columns(df, ['treated', 'flag'], temp_dir))
+
+        np.testing.assert_array_equal(shared['treated'], [1.0, 0.0, 1.0])
+        np.testing.assert_array_equal(shared['flag'], [1.0, np.nan, 0.0])
+
+
 # ============================================================
 # DATA CLEANING TESTS
 # ============================================================
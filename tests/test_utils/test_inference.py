@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests for src/utils/inference.py
+
+Tests cover:
+- t, normal and F distribution functions against scipy.stats
+- Quantile functions inverting the CDFs
+- Accuracy of small two-sided p-values
+- Vectorized evaluation with NaN and scalar returns
+"""
+from __future__ import annotations
+
+import pytest
+import numpy as np
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from utils.inference import (
+    normal_cdf,
+    normal_ppf,
+    t_cdf,
+    t_ppf,
+    two_sided_pvalue,
+    critical_value,
+    f_cdf,
+    f_sf,
+    f_ppf,
+)
+
+stats = pytest.importorskip('scipy.stats')
+
+
+class TestStudentT:
+    """Tests for the t distribution functions."""
+
+    @pytest.mark.parametrize('df', [1, 2.5, 7, 40, 5000])
+    def test_matches_scipy(self, df):
+        """CDF, quantiles and p-values agree with scipy.stats.t."""
+        x = np.linspace(-6, 6, 49)
+        p = np.array([1e-10, 0.01, 0.2, 0.8, 0.975, 1 - 1e-8])
+
+        np.testing.assert_allclose(t_cdf(x, df), stats.t.cdf(x, df), rtol=1e-10, atol=1e-14)
+        np.testing.assert_allclose(t_ppf(p, df), stats.t.ppf(p, df), rtol=1e-9)
+        np.testing.assert_allclose(two_sided_pvalue(x, df), 2 * stats.t.sf(np.abs(x), df), rtol=1e-10)
+
+    def test_ppf_inverts_cdf(self):
+        """t_ppf(t_cdf(x)) recovers x."""
+        x = np.linspace(-4, 4, 17)
+        np.testing.assert_allclose(t_ppf(t_cdf(x, 12), 12), x, atol=1e-10)
+
+    def test_small_pvalues_keep_precision(self):
+        """Tail probabilities do not round to zero."""
+        p = two_sided_pvalue(30.0, 500)
+        assert 0 < p < 1e-100
+        assert p == pytest.approx(2 * stats.t.sf(30.0, 500), rel=1e-8)
+
+    def test_critical_values(self):
+        """Two-sided critical values for t and normal."""
+        assert critical_value(0.05, 10) == pytest.approx(2.228138851986274)
+        assert critical_value(0.05) == pytest.approx(1.959963984540054)
+        assert critical_value(0.05, np.inf) == pytest.approx(1.959963984540054)
+
+
+class TestNormal:
+    """Tests for the normal distribution functions."""
+
+    def test_matches_scipy(self):
+        """Normal CDF and quantiles agree with scipy.stats.norm."""
+        x = np.linspace(-8, 8, 33)
+        np.testing.assert_allclose(normal_cdf(x), stats.norm.cdf(x), rtol=1e-12)
+        # Upper quantiles lose precision as the CDF approaches 1
+        lower = x[x <= 4]
+        np.testing.assert_allclose(normal_ppf(normal_cdf(lower)), lower, atol=1e-8)
+
+    def test_pvalue_without_df_is_normal(self):
+        """df=None gives z-test p-values."""
+        assert two_sided_pvalue(1.959963984540054) == pytest.approx(0.05)
+
+
+class TestF:
+    """Tests for the F distribution functions."""
+
+    @pytest.mark.parametrize('dfn,dfd', [(1, 5), (3, 40), (12, 2000)])
+    def test_matches_scipy(self, dfn, dfd):
+        """CDF, survival function and quantiles agree with scipy.stats.f."""
+        x = np.linspace(0, 8, 33)
+        p = np.array([0.01, 0.5, 0.95, 0.999])
+
+        np.testing.assert_allclose(f_cdf(x, dfn, dfd), stats.f.cdf(x, dfn, dfd), rtol=1e-10, atol=1e-14)
+        np.testing.assert_allclose(f_sf(x, dfn, dfd), stats.f.sf(x, dfn, dfd), rtol=1e-10)
+        np.testing.assert_allclose(f_ppf(p, dfn, dfd), stats.f.ppf(p, dfn, dfd), rtol=1e-9)
+
+    def test_square_of_t(self):
+        """F(1, df) tail equals the two-sided t p-value of sqrt(x)."""
+        assert f_sf(4.0, 1, 25) == pytest.approx(two_sided_pvalue(2.0, 25), rel=1e-12)
+
+
+class TestVectorization:
+    """Tests for array handling."""
+
+    def test_scalar_returns_float(self):
+        """Scalar inputs give Python floats."""
+        assert isinstance(t_cdf(1.0, 5), float)
+        assert isinstance(two_sided_pvalue(1.0), float)
+        assert isinstance(f_sf(1.0, 2, 10), float)
+
+    def test_nan_and_broadcasting(self):
+        """NaN propagates elementwise; df broadcasts against statistics."""
+        p = two_sided_pvalue(np.array([1.0, np.nan, 3.0]), np.array([5, 5, 50]))
+
+        assert np.isnan(p[1])
+        assert p[0] == pytest.approx(stats.t.sf(1.0, 5) * 2)
+        assert p[2] == pytest.approx(stats.t.sf(3.0, 50) * 2)
+
+    def test_mixed_infinite_df(self):
+        """Infinite entries of a df array use the normal limit elementwise."""
+        df = np.array([np.inf, 10])
+        with np.errstate(all='raise'):
+            cdf = t_cdf(np.array([1.0, 1.0]), df)
+            p = two_sided_pvalue(2.0, df)
+            q = t_ppf(0.975, df)
+
+        np.testing.assert_allclose(cdf, [stats.norm.cdf(1.0), stats.t.cdf(1.0, 10)], rtol=1e-12)
+        np.testing.assert_allclose(p, [2 * stats.norm.sf(2.0), 2 * stats.t.sf(2.0, 10)], rtol=1e-12)
+        np.testing.assert_allclose(q, [stats.norm.ppf(0.975), stats.t.ppf(0.975, 10)], rtol=1e-10)
+        assert two_sided_pvalue(2.0, np.inf) == pytest.approx(2 * stats.norm.sf(2.0))
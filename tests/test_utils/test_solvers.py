@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Tests for src/utils/solvers.py
+
+Tests cover:
+- Cholesky and QR least squares against numpy lstsq
+- Dropping collinear columns in order
+- Solving from cross-products
+- Sufficient-statistics regressions (chunked accumulation, nested specs)
+- Weighted cross-products for masked samples
+"""
+from __future__ import annotations
+
+import pytest
+import numpy as np
+import pandas as pd
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from utils.solvers import (
+    least_squares,
+    solve_normal_equations,
+    CrossProducts,
+)
+
+
+@pytest.fixture
+def design():
+    """Well-conditioned design with a constant and an outcome."""
+    rng = np.random.default_rng(5)
+    n = 500
+    X = np.column_stack([np.ones(n), rng.normal(size=(n, 4))])
+    y = X @ np.array([1.0, 2.0, -1.0, 0.5, 0.0]) + rng.normal(size=n)
+    return X, y
+
+
+class TestLeastSquares:
+    """Tests for least_squares."""
+
+    @pytest.mark.parametrize('method', ['cholesky', 'qr'])
+    def test_matches_lstsq(self, design, method):
+        """Coefficients, SSR and inverse agree with the textbook solution."""
+        X, y = design
+        fit = least_squares(X, y, method=method)
+        expected, ssr = np.linalg.lstsq(X, y, rcond=None)[:2]
+
+        assert fit.keep.all()
+        np.testing.assert_allclose(fit.beta, expected, rtol=1e-10)
+        assert fit.ssr == pytest.approx(ssr[0])
+        np.testing.assert_allclose(fit.XtX_inv, np.linalg.inv(X.T @ X), rtol=1e-8)
+        np.testing.assert_allclose(fit.residuals, y - X @ expected, atol=1e-10)
+
+    @pytest.mark.parametrize('method', ['cholesky', 'qr'])
+    def test_drops_later_collinear_column(self, design, method):
+        """A column spanned by earlier ones is dropped; estimates are unchanged."""
+        X, y = design
+        X_wide = np.column_stack([X[:, :3], X[:, 1] - 2 * X[:, 2], X[:, 3:], np.zeros(len(X))])
+        fit = least_squares(X_wide, y, method=method)
+
+        assert fit.dropped == [3, 6]
+        assert np.isnan(fit.beta[[3, 6]]).all()
+        np.testing.assert_allclose(fit.beta[fit.keep], least_squares(X, y).beta, rtol=1e-8)
+        assert fit.XtX_inv.shape == (5, 5)
+
+    def test_qr_on_ill_conditioned_design(self):
+        """QR keeps accuracy on a nearly collinear (but full rank) design."""
+        rng = np.random.default_rng(2)
+        n = 1000
+        x = rng.normal(size=n)
+        X = np.column_stack([np.ones(n), x, x + 1e-4 * rng.normal(size=n)])
+        y = X @ np.array([1.0, 1.0, 1.0]) + 1e-3 * rng.normal(size=n)
+
+        fit = least_squares(X, y, method='qr')
+        expected = np.linalg.lstsq(X, y, rcond=None)[0]
+
+        assert fit.keep.all()
+        np.testing.assert_allclose(fit.beta, expected, rtol=1e-6)
+
+    def test_unknown_method(self, design):
+        """Unknown methods raise."""
+        X, y = design
+        with pytest.raises(ValueError, match="Unknown solver"):
+            least_squares(X, y, method='inverse')
+
+
+class TestNormalEquations:
+    """Tests for solve_normal_equations."""
+
+    def test_multiple_right_hand_sides(self, design):
+        """Each column of X'Y is solved independently."""
+        X, y = design
+        Y = np.column_stack([y, 2 * y])
+        beta, XtX_inv, keep = solve_normal_equations(X.T @ X, X.T @ Y)
+
+        np.testing.assert_allclose(beta[:, 1], 2 * beta[:, 0])
+        np.testing.assert_allclose(XtX_inv @ (X.T @ X), np.eye(5), atol=1e-10)
+        assert keep.all()
+
+
+class TestCrossProducts:
+    """Tests for CrossProducts."""
+
+    @pytest.fixture
+    def frame(self, design):
+        """Design as a DataFrame with a few missing values."""
+        X, y = design
+        df = pd.DataFrame(X[:, 1:], columns=['x1', 'x2', 'x3', 'x4']).assign(y=y)
+        df.loc[[3, 17], 'x4'] = np.nan
+        return df
+
+    def test_nested_specifications(self, frame):
+        """Sub-block solutions equal row-level OLS on the common sample."""
+        cp = CrossProducts.from_frame(frame, ['y', 'x1', 'x2', 'x3', 'x4'])
+        complete = frame.dropna()
+        assert cp.n == len(complete)
+
+        for x_vars in (['x1'], ['x1', 'x3'], ['x4', 'x2']):
+            X = np.column_stack([np.ones(len(complete)), complete[x_vars]])
+            expected = least_squares(X, complete['y'].to_numpy())
+            fit = cp.ols('y', x_vars)
+
+            np.testing.assert_allclose(fit.beta, expected.beta, rtol=1e-9)
+            np.testing.assert_allclose(fit.XtX_inv, expected.XtX_inv, rtol=1e-9)
+            assert fit.ssr == pytest.approx(expected.ssr, rel=1e-9)
+
+    def test_chunked_equals_single_pass(self, frame):
+        """Accumulating chunks (or merging accumulators) gives the same matrix."""
+        columns = ['y', 'x1', 'x2']
+        full = CrossProducts.from_frame(frame, columns)
+        chunked = CrossProducts(columns)
+        for chunk in np.array_split(frame[columns].to_numpy(), 7):
+            chunked.update(chunk)
+        halves = CrossProducts.from_frame(frame.iloc[:200], columns).merge(
+            CrossProducts.from_frame(frame.iloc[200:], columns)
+        )
+
+        np.testing.assert_allclose(chunked.matrix, full.matrix)
+        np.testing.assert_allclose(halves.matrix, full.matrix)
+
+    def test_without_constant(self, frame):
+        """Regressions through the origin use only the variable block."""
+        cp = CrossProducts.from_frame(frame, ['y', 'x1'])
+        fit = cp.ols('y', ['x1'], constant=False)
+        x, y = frame['x1'].to_numpy(), frame['y'].to_numpy()
+
+        assert fit.beta[0] == pytest.approx((x @ y) / (x @ x))
+
+    def test_weights_restrict_the_sample(self, frame):
+        """0/1 weights equal subsetting; integer weights equal repeating rows."""
+        columns = ['y', 'x1', 'x2']
+        mask = (frame['x3'] > 0).to_numpy()
+        counts = np.arange(len(frame)) % 3
+
+        masked = CrossProducts.from_frame(frame, columns, weights=mask)
+        subset = CrossProducts.from_frame(frame[mask], columns)
+        repeated = CrossProducts.from_frame(frame.loc[frame.index.repeat(counts)], columns)
+
+        np.testing.assert_allclose(masked.matrix, subset.matrix)
+        np.testing.assert_allclose(CrossProducts.from_frame(frame, columns, weights=counts).matrix, repeated.matrix)
+        assert masked.n == mask.sum()